@@ -0,0 +1,29 @@
+"""program_host_ids_index
+
+Revision ID: 42c9605b9c04
+Revises: 9155e1d0b66f
+Create Date: 2026-10-17 04:58:11.787391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '42c9605b9c04'
+down_revision: Union[str, None] = '9155e1d0b66f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Multi-valued index (MySQL 8.0.17+) over the ids in the hosts JSON array
+    op.create_index('ix_radio_programs_host_ids', 'radio_programs', [sa.text("(CAST(hosts->'$[*].id' AS CHAR(36) ARRAY))")], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_radio_programs_host_ids', table_name='radio_programs')
@@ -0,0 +1,31 @@
+"""forum_slug_length
+
+Revision ID: 4768ef673224
+Revises: 7239dfade960
+Create Date: 2026-10-17 04:28:41.756162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4768ef673224'
+down_revision: Union[str, None] = '7239dfade960'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Older slugs are slugified titles of up to 500 characters. Give those an id-based slug first so the
+    # ALTER neither fails in strict mode nor truncates them into unique key collisions
+    op.execute("UPDATE forums SET slug = CONCAT('forum_', REPLACE(id, '-', '')) WHERE CHAR_LENGTH(slug) > 255")
+    op.alter_column('forums', 'slug', existing_type=sa.String(length=500), type_=sa.String(length=255), existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('forums', 'slug', existing_type=sa.String(length=255), type_=sa.String(length=500), existing_nullable=False)
@@ -0,0 +1,32 @@
+"""keyset_pagination_indexes
+
+Revision ID: 497962f23e11
+Revises: c30546ea7603
+Create Date: 2026-10-17 04:07:11.248398
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '497962f23e11'
+down_revision: Union[str, None] = 'c30546ea7603'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_forums_station_state_status_created_at', 'forums', ['station_id', 'state', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_forum_comments_forum_state_status_created_at', 'forum_comments', ['forum_id', 'state', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_news_station_state_published_created_at', 'news', ['station_id', 'state', 'is_published', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_news_station_state_published_created_at', table_name='news')
+    op.drop_index('ix_forum_comments_forum_state_status_created_at', table_name='forum_comments')
+    op.drop_index('ix_forums_station_state_status_created_at', table_name='forums')
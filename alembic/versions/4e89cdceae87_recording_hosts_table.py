@@ -0,0 +1,54 @@
+"""recording_hosts_table
+
+Revision ID: 4e89cdceae87
+Revises: 917aa5c798f9
+Create Date: 2026-10-17 05:17:08.947670
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e89cdceae87'
+down_revision: Union[str, None] = '917aa5c798f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recording_hosts',
+    sa.Column('recording_id', sa.String(length=36), nullable=False),
+    sa.Column('host_id', sa.String(length=36), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('state', sa.Boolean(), nullable=False),
+    sa.Column('status', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['recording_id'], ['radio_session_recordings.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['host_id'], ['hosts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('recording_id', 'host_id', name='uq_recording_hosts_recording_host')
+    )
+    op.create_index(op.f('ix_recording_hosts_host_id'), 'recording_hosts', ['host_id'], unique=False)
+    # Backfill from the radio_session_recordings.hosts JSON array, whose entries are {"id": ...} objects or bare id strings
+    op.execute("""
+        INSERT IGNORE INTO recording_hosts (id, recording_id, host_id, state, status, created_at, updated_at)
+        SELECT UUID(), r.id, h.id, 1, 1, NOW(), NOW()
+        FROM radio_session_recordings r
+        JOIN JSON_TABLE(r.hosts, '$[*]' COLUMNS (
+            object_id VARCHAR(36) PATH '$.id' NULL ON ERROR,
+            plain_id VARCHAR(36) PATH '$' NULL ON ERROR
+        )) v
+        JOIN hosts h ON h.id = COALESCE(v.object_id, v.plain_id)
+        WHERE JSON_TYPE(r.hosts) = 'ARRAY'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_recording_hosts_host_id'), table_name='recording_hosts')
+    op.drop_table('recording_hosts')
@@ -0,0 +1,60 @@
+"""news_comments_livechat_cascade
+
+Revision ID: 560f80f5d976
+Revises: 5a82ce4b18a9
+Create Date: 2026-10-17 04:45:35.664617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '560f80f5d976'
+down_revision: Union[str, None] = '5a82ce4b18a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FOREIGN_KEYS = [
+    ('news_comments', 'news_id', 'news'),
+    ('news_comments', 'parent_id', 'news_comments'),
+    ('livechat_messages', 'station_id', 'stations'),
+]
+
+INDEXES = [
+    ('news_comments', 'news_id', 'news'),
+    ('news_comments', 'parent_id', 'news_comments'),
+    ('livechat_messages', 'user_id', 'users'),
+]
+
+
+def _drop_foreign_key(table: str, column: str) -> None:
+    # The existing keys were created unnamed, so look up MySQL's generated names
+    inspector = sa.inspect(op.get_bind())
+    for foreign_key in inspector.get_foreign_keys(table):
+        if foreign_key['constrained_columns'] == [column]:
+            op.drop_constraint(foreign_key['name'], table, type_='foreignkey')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, _ in INDEXES:
+        op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+    for table, column, referred_table in FOREIGN_KEYS:
+        _drop_foreign_key(table, column)
+        op.create_foreign_key(f'fk_{table}_{column}', table, referred_table, [column], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Drop the keys first, MySQL refuses to drop an index a foreign key still relies on
+    foreign_keys = dict.fromkeys(FOREIGN_KEYS + INDEXES)
+    for table, column, _ in foreign_keys:
+        _drop_foreign_key(table, column)
+    for table, column, _ in INDEXES:
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
+    for table, column, referred_table in foreign_keys:
+        op.create_foreign_key(f'fk_{table}_{column}', table, referred_table, [column], ['id'])
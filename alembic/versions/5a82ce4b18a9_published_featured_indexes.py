@@ -0,0 +1,30 @@
+"""published_featured_indexes
+
+Revision ID: 5a82ce4b18a9
+Revises: 4768ef673224
+Create Date: 2026-10-17 04:34:49.655503
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a82ce4b18a9'
+down_revision: Union[str, None] = '4768ef673224'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_events_published_featured_state_status_created_at', 'events', ['is_published', 'is_featured', 'state', 'status', 'created_at'], unique=False)
+    op.create_index('ix_forums_published_state_status_created_at', 'forums', ['is_published', 'state', 'status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_forums_published_state_status_created_at', table_name='forums')
+    op.drop_index('ix_events_published_featured_state_status_created_at', table_name='events')
@@ -0,0 +1,38 @@
+"""station_listeners_unique_station_user
+
+Revision ID: 6fb91144641f
+Revises: 42c9605b9c04
+Create Date: 2026-10-17 05:13:08.863598
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6fb91144641f'
+down_revision: Union[str, None] = '42c9605b9c04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the most recently seen row per (station_id, user_id) before the key goes on
+    op.execute(
+        "DELETE older FROM station_listeners AS older "
+        "JOIN station_listeners AS newer "
+        "ON newer.station_id = older.station_id AND newer.user_id = older.user_id "
+        "AND (COALESCE(newer.last_seen, '1970-01-01') > COALESCE(older.last_seen, '1970-01-01') "
+        "OR (COALESCE(newer.last_seen, '1970-01-01') = COALESCE(older.last_seen, '1970-01-01') AND newer.id > older.id))"
+    )
+    op.create_unique_constraint('uq_station_listeners_station_user', 'station_listeners', ['station_id', 'user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # MySQL may have dropped its implicit station_id index in favour of the unique key, the foreign key needs one
+    op.create_index('ix_station_listeners_station_id', 'station_listeners', ['station_id'], unique=False)
+    op.drop_constraint('uq_station_listeners_station_user', 'station_listeners', type_='unique')
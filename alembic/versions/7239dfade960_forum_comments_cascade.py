@@ -0,0 +1,39 @@
+"""forum_comments_cascade
+
+Revision ID: 7239dfade960
+Revises: fb4b288577d6
+Create Date: 2026-10-17 04:27:34.754830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7239dfade960'
+down_revision: Union[str, None] = 'fb4b288577d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_foreign_key(table: str, column: str, referred_table: str, ondelete: Union[str, None]) -> None:
+    # The existing keys were created unnamed, so look up MySQL's generated names
+    inspector = sa.inspect(op.get_bind())
+    for foreign_key in inspector.get_foreign_keys(table):
+        if foreign_key['constrained_columns'] == [column]:
+            op.drop_constraint(foreign_key['name'], table, type_='foreignkey')
+    op.create_foreign_key(f'fk_{table}_{column}', table, referred_table, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_key('forum_comments', 'forum_id', 'forums', 'CASCADE')
+    _replace_foreign_key('forum_comments', 'reply_to', 'forum_comments', 'CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_key('forum_comments', 'reply_to', 'forum_comments', None)
+    _replace_foreign_key('forum_comments', 'forum_id', 'forums', None)
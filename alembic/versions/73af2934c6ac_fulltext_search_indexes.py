@@ -0,0 +1,32 @@
+"""fulltext_search_indexes
+
+Revision ID: 73af2934c6ac
+Revises: a1f0c7564a7c
+Create Date: 2026-10-17 04:22:07.891658
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '73af2934c6ac'
+down_revision: Union[str, None] = 'a1f0c7564a7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_forums_fulltext', 'forums', ['title', 'body'], unique=False, mysql_prefix='FULLTEXT')
+    op.create_index('ix_news_fulltext', 'news', ['title', 'content', 'summary'], unique=False, mysql_prefix='FULLTEXT')
+    op.create_index('ix_events_fulltext', 'events', ['title', 'description', 'venue_name', 'venue_address'], unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_fulltext', table_name='events')
+    op.drop_index('ix_news_fulltext', table_name='news')
+    op.drop_index('ix_forums_fulltext', table_name='forums')
@@ -0,0 +1,34 @@
+"""live_row_indexes
+
+Revision ID: 9155e1d0b66f
+Revises: dffd44fdfba5
+Create Date: 2026-10-17 04:53:29.353796
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9155e1d0b66f'
+down_revision: Union[str, None] = 'dffd44fdfba5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_radio_programs_station_state_status', 'radio_programs', ['station_id', 'state', 'status'], unique=False)
+    op.create_index('ix_radio_programs_state_created_at', 'radio_programs', ['state', 'created_at'], unique=False)
+    op.create_index('ix_hosts_state_status_created_at', 'hosts', ['state', 'status', 'created_at'], unique=False)
+    op.create_index('ix_hosts_state_status_name', 'hosts', ['state', 'status', 'name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_hosts_state_status_name', table_name='hosts')
+    op.drop_index('ix_hosts_state_status_created_at', table_name='hosts')
+    op.drop_index('ix_radio_programs_state_created_at', table_name='radio_programs')
+    op.drop_index('ix_radio_programs_station_state_status', table_name='radio_programs')
@@ -0,0 +1,28 @@
+"""station_listeners_last_seen_index
+
+Revision ID: 917aa5c798f9
+Revises: 6fb91144641f
+Create Date: 2026-10-17 05:15:35.482598
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '917aa5c798f9'
+down_revision: Union[str, None] = '6fb91144641f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_station_listeners_station_last_seen', 'station_listeners', ['station_id', 'last_seen'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_station_listeners_station_last_seen', table_name='station_listeners')
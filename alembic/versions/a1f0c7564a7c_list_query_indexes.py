@@ -0,0 +1,34 @@
+"""list_query_indexes
+
+Revision ID: a1f0c7564a7c
+Revises: dfe9b7ea577d
+Create Date: 2026-10-17 04:21:17.940621
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f0c7564a7c'
+down_revision: Union[str, None] = 'dfe9b7ea577d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_livechat_messages_station_visible_state_status_created_at', 'livechat_messages', ['station_id', 'is_visible', 'state', 'status', 'created_at'], unique=False)
+    op.create_index('ix_events_published_state_status_start_date', 'events', ['is_published', 'state', 'status', 'start_date'], unique=False)
+    op.create_index('ix_events_state_status_created_at', 'events', ['state', 'status', 'created_at'], unique=False)
+    op.create_index('ix_users_state_status_last_seen', 'users', ['state', 'status', 'last_seen'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_state_status_last_seen', table_name='users')
+    op.drop_index('ix_events_state_status_created_at', table_name='events')
+    op.drop_index('ix_events_published_state_status_start_date', table_name='events')
+    op.drop_index('ix_livechat_messages_station_visible_state_status_created_at', table_name='livechat_messages')
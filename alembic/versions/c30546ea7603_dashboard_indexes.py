@@ -0,0 +1,43 @@
+"""dashboard_indexes
+
+Revision ID: c30546ea7603
+Revises: ac262badf6c6
+Create Date: 2026-10-17 04:05:52.678636
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c30546ea7603'
+down_revision: Union[str, None] = 'ac262badf6c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_stations_state_status', 'stations', ['state', 'status'], unique=False)
+    op.create_index('ix_stations_state_streaming_status', 'stations', ['state', 'streaming_status'], unique=False)
+    op.create_index('ix_news_state_published_created_at', 'news', ['state', 'is_published', 'created_at'], unique=False)
+    op.create_index('ix_news_state_published_views_count', 'news', ['state', 'is_published', 'views_count'], unique=False)
+    op.create_index('ix_events_state_start_date', 'events', ['state', 'start_date'], unique=False)
+    op.create_index('ix_radio_session_recordings_state_recording_status', 'radio_session_recordings', ['state', 'recording_status'], unique=False)
+    op.create_index('ix_users_state_role', 'users', ['state', 'role'], unique=False)
+    op.create_index('ix_users_state_last_seen', 'users', ['state', 'last_seen'], unique=False)
+    op.execute('ANALYZE TABLE stations, news, events, radio_session_recordings, users')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_state_last_seen', table_name='users')
+    op.drop_index('ix_users_state_role', table_name='users')
+    op.drop_index('ix_radio_session_recordings_state_recording_status', table_name='radio_session_recordings')
+    op.drop_index('ix_events_state_start_date', table_name='events')
+    op.drop_index('ix_news_state_published_views_count', table_name='news')
+    op.drop_index('ix_news_state_published_created_at', table_name='news')
+    op.drop_index('ix_stations_state_streaming_status', table_name='stations')
+    op.drop_index('ix_stations_state_status', table_name='stations')
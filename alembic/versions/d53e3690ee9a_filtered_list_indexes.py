@@ -0,0 +1,34 @@
+"""filtered_list_indexes
+
+Revision ID: d53e3690ee9a
+Revises: 73af2934c6ac
+Create Date: 2026-10-17 04:22:56.623525
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd53e3690ee9a'
+down_revision: Union[str, None] = '73af2934c6ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_radio_session_recordings_station_recording_status_created_at', 'radio_session_recordings', ['station_id', 'recording_status', 'state', 'status', 'created_at'], unique=False)
+    op.create_index('ix_radio_session_recordings_station_program_session_date', 'radio_session_recordings', ['station_id', 'program_id', 'session_date'], unique=False)
+    op.create_index('ix_events_event_type_state_status_created_at', 'events', ['event_type', 'state', 'status', 'created_at'], unique=False)
+    op.create_index('ix_events_category_state_status_created_at', 'events', ['category', 'state', 'status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_events_category_state_status_created_at', table_name='events')
+    op.drop_index('ix_events_event_type_state_status_created_at', table_name='events')
+    op.drop_index('ix_radio_session_recordings_station_program_session_date', table_name='radio_session_recordings')
+    op.drop_index('ix_radio_session_recordings_station_recording_status_created_at', table_name='radio_session_recordings')
@@ -0,0 +1,55 @@
+"""forum_views_table
+
+Revision ID: dfe9b7ea577d
+Revises: 497962f23e11
+Create Date: 2026-10-17 04:12:03.473872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dfe9b7ea577d'
+down_revision: Union[str, None] = '497962f23e11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('forum_views',
+    sa.Column('forum_id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('viewed_at', sa.DateTime(), nullable=False),
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('state', sa.Boolean(), nullable=False),
+    sa.Column('status', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['forum_id'], ['forums.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('forum_id', 'user_id', name='uq_forum_views_forum_user')
+    )
+    # Backfill from the legacy forums.views JSON array
+    op.execute("""
+        INSERT IGNORE INTO forum_views (id, forum_id, user_id, viewed_at, state, status, created_at, updated_at)
+        SELECT UUID(), f.id, v.user_id,
+               COALESCE(CAST(REPLACE(v.viewed_at, 'T', ' ') AS DATETIME), NOW()),
+               1, 1, NOW(), NOW()
+        FROM forums f
+        JOIN JSON_TABLE(f.views, '$[*]' COLUMNS (
+            user_id VARCHAR(36) PATH '$.user_id',
+            viewed_at VARCHAR(64) PATH '$.viewed_at'
+        )) v
+        JOIN users u ON u.id = v.user_id
+        WHERE JSON_TYPE(f.views) = 'ARRAY'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('forum_views')
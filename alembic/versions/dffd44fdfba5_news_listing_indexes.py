@@ -0,0 +1,36 @@
+"""news_listing_indexes
+
+Revision ID: dffd44fdfba5
+Revises: 560f80f5d976
+Create Date: 2026-10-17 04:47:12.250595
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dffd44fdfba5'
+down_revision: Union[str, None] = '560f80f5d976'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_news_state_published_published_at', 'news', ['state', 'is_published', 'published_at'], unique=False)
+    op.create_index('ix_news_station_state_published_published_at', 'news', ['station_id', 'state', 'is_published', 'published_at'], unique=False)
+    op.create_index('ix_news_station_category_state_published_created_at', 'news', ['station_id', 'category_id', 'state', 'is_published', 'created_at', 'id'], unique=False)
+    op.create_index('ix_news_station_featured_state_published_created_at', 'news', ['station_id', 'is_featured', 'state', 'is_published', 'created_at', 'id'], unique=False)
+    op.create_index('ix_news_station_breaking_state_created_at', 'news', ['station_id', 'is_breaking', 'state', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_news_station_breaking_state_created_at', table_name='news')
+    op.drop_index('ix_news_station_featured_state_published_created_at', table_name='news')
+    op.drop_index('ix_news_station_category_state_published_created_at', table_name='news')
+    op.drop_index('ix_news_station_state_published_published_at', table_name='news')
+    op.drop_index('ix_news_state_published_published_at', table_name='news')
@@ -0,0 +1,32 @@
+"""advert_counters_integer
+
+Revision ID: fb4b288577d6
+Revises: d53e3690ee9a
+Create Date: 2026-10-17 04:23:23.490635
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fb4b288577d6'
+down_revision: Union[str, None] = 'd53e3690ee9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("UPDATE adverts SET views_count = '0' WHERE views_count IS NULL OR views_count NOT REGEXP '^[0-9]+$'")
+    op.execute("UPDATE adverts SET clicks_count = '0' WHERE clicks_count IS NULL OR clicks_count NOT REGEXP '^[0-9]+$'")
+    op.alter_column('adverts', 'views_count', existing_type=sa.String(length=36), type_=sa.Integer(), nullable=False, server_default='0')
+    op.alter_column('adverts', 'clicks_count', existing_type=sa.String(length=36), type_=sa.Integer(), nullable=False, server_default='0')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('adverts', 'clicks_count', existing_type=sa.Integer(), type_=sa.String(length=36), nullable=True, server_default=None)
+    op.alter_column('adverts', 'views_count', existing_type=sa.Integer(), type_=sa.String(length=36), nullable=True, server_default=None)
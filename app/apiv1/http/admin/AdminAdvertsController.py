@@ -6,7 +6,7 @@ from app.utils.returns_data import returnsdata
 from typing import Optional, Dict, Any
 from app.utils.security import get_current_user_details
 from app.utils.pagination import paginate_data
-from fastapi.encoders import jsonable_encoder
+from app.models.AdvertModel import AdvertOut
 from app.apiv1.services.admin.AdminAdvertService import (
     get_adverts,
     get_advert_by_id,
@@ -34,8 +34,9 @@ async def fetch_adverts(request: Request, db: AsyncSession = Depends(get_databas
             filters["status"] = status_filter
             
         adverts_results = await get_adverts(db, page=page, per_page=per_page, filters=filters)
-        adverts_data = [await advert.to_dict_with_relations(db) for advert in adverts_results]
-        return paginate_data(jsonable_encoder(adverts_data), page=page, per_page=per_page)
+        # get_adverts eager loads station and creator, so each row validates without touching the session
+        adverts_data = [AdvertOut.model_validate(advert).model_dump(mode="json") for advert in adverts_results]
+        return paginate_data(adverts_data, page=page, per_page=per_page)
     except Exception as e:
         return returnsdata.error_msg(f"Failed to fetch adverts: {str(e)}", ERROR)
 
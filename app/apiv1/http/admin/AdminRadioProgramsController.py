@@ -8,6 +8,7 @@ from app.utils.file_upload import base64_to_upload_file
 from typing import Optional, Dict, Any
 from fastapi.encoders import jsonable_encoder
 from app.utils.security import get_current_user_details
+from app.models.RadioProgramModel import RadioProgram
 from app.apiv1.services.admin.AdminRadioProgramsService import (
     get_programs,
     get_program_by_id,
@@ -27,7 +28,7 @@ async def fetch_programs(request: Request, db: AsyncSession = Depends(get_databa
         page = int(request.query_params.get("page", 1))
         per_page = int(request.query_params.get("per_page", 100))
         programs_results = await get_programs(db, page=page, per_page=per_page)
-        programs = [await program.to_dict_with_relations(db) for program in programs_results]
+        programs = await RadioProgram.to_dicts_with_relations(db, programs_results)
         return paginate_data(jsonable_encoder(programs), page=page, per_page=per_page)
     except Exception as e:
         return returnsdata.error_msg(f"Failed to fetch programs: {str(e)}", ERROR)
@@ -14,6 +14,7 @@ from app.apiv1.services.admin.AdminStationService import (
     toggle_station_streaming_status,
     toggle_station_radio_access
 )
+from app.models.StationModel import Station
 
 router = APIRouter()
 
@@ -24,7 +25,7 @@ async def fetch_stations(request: Request,db: AsyncSession = Depends(get_databas
         page = int(request.query_params.get("page", 1))
         per_page = int(body_data.get("per_page", 10))
         stations_results = await get_stations(db, page=page, per_page=per_page)
-        stations_data = [await station.to_dict_with_relations(db) for station in stations_results]
+        stations_data = await Station.to_dicts_with_relations(db, stations_results)
         return returnsdata.success(data=stations_data, msg="Stations fetched successfully", status=SUCCESS)
     except Exception as e:
         return returnsdata.error_msg(f"Failed to fetch stations: {str(e)}", ERROR)
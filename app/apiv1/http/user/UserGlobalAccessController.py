@@ -4,6 +4,7 @@ from sqlalchemy import select
 from app.database import get_database
 from app.utils.constants import SUCCESS, ERROR
 from app.utils.returns_data import returnsdata
+from app.utils.helper_functions import convert_status_to_boolean
 from typing import Optional, Dict, Any
 from app.utils.security import get_current_user_details, decode_and_validate_token, extract_token_from_header
 from app.apiv1.services.user.UserStationService import get_station_by_access_link, create_livechat_message, get_station_livechat_messages, delete_station_livechat_message, get_user_hosts_by_station, get_user_radio_sessions, get_user_radio_events
@@ -41,8 +42,10 @@ async def get_user_news_endpoint(request: Request, db: AsyncSession = Depends(ge
         station_id = form_data.get("station_id")
         if not station_id:
             return returnsdata.error_msg("Station ID is required", ERROR)
-        data = await get_user_news(db, station_id=station_id, filters=form_data, per_page=per_page, page=page)
+        data = await get_user_news(db, station_id=station_id, filters=form_data, per_page=per_page, page=page, cursor=form_data.get("cursor"), include_total=bool(convert_status_to_boolean(form_data.get("include_total", True))))
         return returnsdata.success(data=data, msg="News retrieved successfully", status=SUCCESS)
+    except HTTPException as e:
+        return returnsdata.error_msg(e.detail, ERROR, status_code=e.status_code)
     except Exception as e:
         return returnsdata.error_msg(f"Failed to retrieve news: {str(e)}", ERROR)
 
@@ -109,7 +112,7 @@ async def get_user_news_breaking_endpoint(request: Request, db: AsyncSession = D
             return returnsdata.error_msg("Station ID is required", ERROR)
         limit = int(form_data.get("limit",10))
         offset = int(form_data.get("offset",0))
-        data = await get_user_news_breaking(db, station_id=station_id, limit=limit, offset=offset)
+        data = await get_user_news_breaking(db, station_id=station_id, limit=limit, offset=offset, include_total=bool(convert_status_to_boolean(form_data.get("include_total", True))))
         return  returnsdata.success(data=data,msg="News retrieved successfully",status=SUCCESS)
     except Exception as e:
         return returnsdata.error_msg( f"Logout failed: {str(e)}", ERROR )
@@ -184,8 +187,10 @@ async def get_user_forums_endpoint(request: Request, db: AsyncSession = Depends(
         station_id = form_data.get("station_id")
         if not station_id:
             return returnsdata.error_msg("Station ID is required", ERROR)
-        data = await get_user_forums(db, station_id, filters=form_data, per_page=per_page, page=page)
+        data = await get_user_forums(db, station_id, filters=form_data, per_page=per_page, page=page, cursor=form_data.get("cursor"), include_total=bool(convert_status_to_boolean(form_data.get("include_total", True))))
         return returnsdata.success(data=data, msg="News retrieved successfully", status=SUCCESS)
+    except HTTPException as e:
+        return returnsdata.error_msg(e.detail, ERROR, status_code=e.status_code)
     except Exception as e:
         return returnsdata.error_msg(f"Failed to retrieve news: {str(e)}", ERROR)
 
@@ -216,8 +221,10 @@ async def get_forum_comments_endpoint(request: Request, db: AsyncSession = Depen
         if not forum_id:
             return returnsdata.error_msg("Forum ID is required", ERROR)
             
-        data = await get_forum_comments(db, forum_id, page=page, per_page=per_page)
+        data = await get_forum_comments(db, forum_id, page=page, per_page=per_page, cursor=form_data.get("cursor"), include_total=bool(convert_status_to_boolean(form_data.get("include_total", True))))
         return returnsdata.success(data=data, msg="Comments retrieved successfully", status=SUCCESS)
+    except HTTPException as e:
+        return returnsdata.error_msg(e.detail, ERROR, status_code=e.status_code)
     except Exception as e:
         return returnsdata.error_msg(f"Failed to retrieve comments: {str(e)}", ERROR)
 
@@ -30,7 +30,7 @@ async def get_adverts(db: AsyncSession, page: int = 1, per_page: int = 10, filte
                     status_value = bool(filters["status"])
                 conditions.append(Advert.status == status_value)
         
-        stmt = select(Advert).where(and_(*conditions)).order_by(desc(Advert.created_at)).offset(offset).limit(per_page)
+        stmt = select(Advert).options(*Advert.serialization_options()).where(and_(*conditions)).order_by(desc(Advert.created_at)).offset(offset).limit(per_page)
         
         result = await db.execute(stmt)
         adverts = result.scalars().all()
@@ -42,7 +42,7 @@ async def get_adverts(db: AsyncSession, page: int = 1, per_page: int = 10, filte
 
 async def get_advert_by_id(db: AsyncSession, advert_id: str) -> Dict[str, Any]:
     try:
-        stmt = select(Advert).where(and_(Advert.id == advert_id, Advert.state == True))
+        stmt = select(Advert).options(*Advert.serialization_options()).where(and_(Advert.id == advert_id, Advert.state == True))
         result = await db.execute(stmt)
         advert = result.scalar_one_or_none()
         
@@ -88,7 +88,7 @@ async def create_new_advert(db: AsyncSession, advert_data: Dict[str, Any], admin
         
         db.add(new_advert)
         await db.commit()
-        await db.refresh(new_advert)
+        new_advert = await Advert.get_for_serialization(db, new_advert.id)
         return new_advert
         
     except Exception as e:
@@ -126,7 +126,7 @@ async def update_advert_data(db: AsyncSession, advert_id: str, update_data: Dict
         advert.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(advert)
+        advert = await Advert.get_for_serialization(db, advert.id)
         
         # Delete old image if new one was uploaded
         if image and image.filename and old_image_path:
@@ -162,7 +162,7 @@ async def update_advert_status(db: AsyncSession, advert_id: str, status_data: Di
         advert.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(advert)
+        advert = await Advert.get_for_serialization(db, advert.id)
         return await advert.to_dict_with_relations(db)
         
     except HTTPException:
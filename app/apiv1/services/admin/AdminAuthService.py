@@ -1,11 +1,10 @@
 from fastapi import HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, and_, or_, func
-from slugify import slugify
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from app.database import get_database
-from app.utils.helper_functions import log_system_error, convert_status_to_boolean
+from app.utils.helper_functions import log_system_error, convert_status_to_boolean, generate_unique_slug
 from app.models.UserModel import User
 from app.utils.messaging_service import MessagingService
 from app.apiv1.email_templates.get_password_reset_template import get_password_reset_template
@@ -13,18 +12,23 @@ from app.utils.security import verify_password, create_user_access_token, invali
 import re
 import random
 
+UPPERCASE_RE = re.compile(r'[A-Z]')
+LOWERCASE_RE = re.compile(r'[a-z]')
+DIGIT_RE = re.compile(r'\d')
+SPECIAL_CHAR_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
 
 def validate_admin_password(password: str) -> tuple[bool, str]:
     """Validate admin password requirements: 8+ chars, uppercase, lowercase, number, special char"""
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
-    if not re.search(r'[A-Z]', password):
+    if not UPPERCASE_RE.search(password):
         return False, "Password must contain at least one uppercase letter"
-    if not re.search(r'[a-z]', password):
+    if not LOWERCASE_RE.search(password):
         return False, "Password must contain at least one lowercase letter"
-    if not re.search(r'\d', password):
+    if not DIGIT_RE.search(password):
         return False, "Password must contain at least one number"
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not SPECIAL_CHAR_RE.search(password):
         return False, "Password must contain at least one special character"
     return True, "Password is valid"
 
@@ -54,7 +58,7 @@ async def authenticate_admin(db: AsyncSession, email: str, password: str, rememb
 
         expires_delta = timedelta(days=30) if remember else None
         device_fp = device_fingerprint or f"admin-{admin.id}"
-        admin_data = await admin.to_dict()
+        admin_data = admin.to_dict()
         token_data = await create_user_access_token(
             db=db, 
             user=admin_data, 
@@ -118,15 +122,7 @@ async def create_admin(db: AsyncSession, data: Dict[str, Any], creator_id: str)
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="User with this email already exists")
 
         # Generate unique slug
-        base_slug = slugify(name)
-        slug = base_slug
-        counter = 1
-        while True:
-            slug_check = await db.execute(select(User).where(User.slug == slug, User.state == True))
-            if not slug_check.scalar_one_or_none():
-                break
-            slug = f"{base_slug}-{counter}"
-            counter += 1
+        slug = await generate_unique_slug(db, User, name, User.state == True)
 
         # Handle image upload
         image_path = None
@@ -206,18 +202,7 @@ async def update_admin(db: AsyncSession, admin_id: str, data: Dict[str, Any], up
         if "name" in data and data["name"]:
             admin.name = data["name"]
             # Update slug if name changed
-            base_slug = slugify(data["name"])
-            slug = base_slug
-            counter = 1
-            while True:
-                slug_check = await db.execute(
-                    select(User).where(User.slug == slug, User.id != admin_id, User.state == True)
-                )
-                if not slug_check.scalar_one_or_none():
-                    break
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            admin.slug = slug
+            admin.slug = await generate_unique_slug(db, User, data["name"], User.id != admin_id, User.state == True)
 
         # Update email
         if "email" in data and data["email"]:
@@ -15,7 +15,7 @@ async def get_forums(db: AsyncSession, page: int = 1, per_page: int = 10) -> Lis
     try:
         offset = (page - 1) * per_page
         
-        stmt = select(Forum).where(and_(Forum.state == True)).order_by(desc(Forum.created_at)).offset(offset).limit(per_page)     
+        stmt = select(Forum).options(*Forum.serialization_options()).where(and_(Forum.state == True)).order_by(desc(Forum.created_at)).offset(offset).limit(per_page)     
         result = await db.execute(stmt)
         forums = result.scalars().all()
         return forums
@@ -26,7 +26,7 @@ async def get_forums(db: AsyncSession, page: int = 1, per_page: int = 10) -> Lis
 
 async def get_forum_by_id(db: AsyncSession, forum_id: str) -> Dict[str, Any]:
     try:
-        stmt = select(Forum).where(and_(Forum.id == forum_id, Forum.state == True))
+        stmt = select(Forum).options(*Forum.serialization_options()).where(and_(Forum.id == forum_id, Forum.state == True))
         result = await db.execute(stmt)
         forum = result.scalar_one_or_none()
         
@@ -60,7 +60,7 @@ async def create_new_forum(db: AsyncSession, forum_data: Dict[str, Any], admin_i
         
         db.add(new_forum)
         await db.commit()
-        await db.refresh(new_forum)
+        new_forum = await Forum.get_for_serialization(db, new_forum.id)
         return new_forum
         
     except Exception as e:
@@ -85,7 +85,7 @@ async def update_forum_data(db: AsyncSession, forum_id: str, update_data: Dict[s
         forum.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(forum)
+        forum = await Forum.get_for_serialization(db, forum.id)
         return await forum.to_dict_with_relations(db)
         
     except HTTPException:
@@ -113,7 +113,7 @@ async def update_forum_status(db: AsyncSession, forum_id: str, status_data: Dict
         forum.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(forum)
+        forum = await Forum.get_for_serialization(db, forum.id)
         return await forum.to_dict_with_relations(db)
         
     except HTTPException:
@@ -147,7 +147,7 @@ async def get_forum_comments(db: AsyncSession, forum_id: str, page: int = 1, per
     try:
         offset = (page - 1) * per_page
         
-        stmt = select(ForumComment).where(
+        stmt = select(ForumComment).options(*ForumComment.serialization_options()).where(
             and_(ForumComment.forum_id == forum_id, ForumComment.state == True)
         ).order_by(desc(ForumComment.created_at)).offset(offset).limit(per_page)
         
@@ -178,7 +178,7 @@ async def create_forum_comment(db: AsyncSession, comment_data: Dict[str, Any], u
         
         db.add(new_comment)
         await db.commit()
-        await db.refresh(new_comment)
+        new_comment = await ForumComment.get_for_serialization(db, new_comment.id)
         return new_comment
         
     except Exception as e:
@@ -205,7 +205,7 @@ async def update_forum_comment(db: AsyncSession, comment_id: str, update_data: D
         comment.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(comment)
+        comment = await ForumComment.get_for_serialization(db, comment.id)
         return await comment.to_dict_with_relations(db)
         
     except HTTPException:
@@ -1,12 +1,13 @@
 from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, or_
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from app.models.HostModel import Host
-from slugify import slugify
 from app.utils.file_upload import save_upload_file, remove_file
+from app.utils.helper_functions import generate_suffixed_slug, commit_with_fresh_slug, flush_with_fresh_slug
 import math
 import os
 import uuid
@@ -42,16 +43,19 @@ async def get_host_by_id(db: AsyncSession, host_id: str) -> Dict[str, Any]:
 
 async def create_new_host(db: AsyncSession, host_data: Dict[str, Any], image: UploadFile, admin_id: str) -> Dict[str, Any]:
     try:
-        existing_host = await db.execute(select(Host).where(and_(Host.name == host_data["name"], Host.state == True)))
-        if existing_host.scalar_one_or_none():
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Host with this name already exists")
+        # Name and email clashes in one lookup, for the specific error message
+        clashes = [Host.name == host_data["name"]]
         if host_data.get("email"):
-            existing_email = await db.execute(select(Host).where(and_(Host.email == host_data["email"], Host.state == True)))
-            if existing_email.scalar_one_or_none():
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Host with this email already exists")
+            clashes.append(Host.email == host_data["email"])
+        existing = await db.execute(select(Host.name, Host.email).where(and_(Host.state == True, or_(*clashes))))
+        existing_rows = existing.all()
+        if any(row.name == host_data["name"] for row in existing_rows):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Host with this name already exists")
+        if existing_rows:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Host with this email already exists")
         
         # Generate slug
-        slug = slugify(host_data["name"])
+        slug = generate_suffixed_slug(host_data["name"])
 
         image_url = None
         image_path = None
@@ -78,8 +82,12 @@ async def create_new_host(db: AsyncSession, host_data: Dict[str, Any], image: Up
             updated_at=datetime.utcnow()
         )
         
-        db.add(new_host)
-        await db.commit()
+        # The unique email and slug keys settle races the lookup above cannot see
+        try:
+            await commit_with_fresh_slug(db, new_host, host_data["name"])
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Host with this email or name already exists")
         await db.refresh(new_host)
         
         return await new_host.to_dict_with_relations(db)
@@ -122,16 +130,18 @@ async def update_host_data(db: AsyncSession, host_id: str, update_data: Dict[str
             image_path,image_url = await save_upload_file(image, "hosts/profile_images")
             host['image_url'] = image_url
             host['image_path'] = image_path
+        name_changed = bool(update_data.get("name")) and update_data["name"] != host.name
         # Update host fields
         for key, value in update_data.items():
             if hasattr(host, key):
                 setattr(host, key, value)
         
         # Update slug if name changed
-        if update_data.get("name"):
-            host.slug = slugify(update_data["name"])
+        if name_changed:
+            await flush_with_fresh_slug(db, host, update_data["name"])
         
         host.updated_at = datetime.utcnow()
+        await host.sync_program_snapshots(db)
         
         await db.commit()
         await db.refresh(host)
@@ -156,6 +166,7 @@ async def delete_host_by_id(db: AsyncSession, host_id: str) -> bool:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Host not found")
         host.state = False
         host.updated_at = datetime.utcnow()
+        await host.sync_program_snapshots(db)
         
         await db.commit()
         return True
@@ -178,6 +189,7 @@ async def toggle_host_status(db: AsyncSession, host_id: str, status_value: bool)
         # Update status
         host.status = status_value
         host.updated_at = datetime.utcnow()
+        await host.sync_program_snapshots(db)
         
         await db.commit()
         await db.refresh(host)
@@ -202,6 +214,7 @@ async def update_host_profile_image(db: AsyncSession, host_id: str, image_file:
         host.image_url = image_url
         host.image_path = image_path
         host.updated_at = datetime.utcnow()
+        await host.sync_program_snapshots(db)
         
         await db.commit()
         await db.refresh(host)
@@ -221,7 +234,7 @@ async def get_active_hosts(db: AsyncSession) -> List[Dict[str, Any]]:
         hosts = result.scalars().all()
         hosts_data = []
         for host in hosts:
-            host_dict = await host.to_dict()
+            host_dict = host.to_dict()
             hosts_data.append(host_dict)
         
         return hosts_data
@@ -236,7 +249,7 @@ async def get_on_air_hosts(db: AsyncSession) -> List[Dict[str, Any]]:
         hosts = result.scalars().all()
         hosts_data = []
         for host in hosts:
-            host_dict = await host.to_dict()
+            host_dict = host.to_dict()
             hosts_data.append(host_dict)
         
         return hosts_data
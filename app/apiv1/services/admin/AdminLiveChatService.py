@@ -10,14 +10,13 @@ from app.utils.file_upload import save_upload_file, remove_file
 import math
 from app.models.LiveChatMessageModel import LiveChatMessage
 from app.utils.websocket_manager import websocket_manager
-from sqlalchemy.orm import selectinload
 
 
 async def get_station_livechat_messages(db: AsyncSession,  limit: int = 200, offset: int = 0) -> List[Dict[str, Any]]:
     try:
         limit = min(limit, 200)  # Enforce 200 message limit
         
-        query = select(LiveChatMessage).options(selectinload(LiveChatMessage.user),selectinload(LiveChatMessage.station)).where(and_(LiveChatMessage.is_visible == True,LiveChatMessage.state == True,LiveChatMessage.status == True)).order_by(asc(LiveChatMessage.created_at)).limit(limit).offset(offset)
+        query = select(LiveChatMessage).options(*LiveChatMessage.serialization_options()).where(and_(LiveChatMessage.is_visible == True,LiveChatMessage.state == True,LiveChatMessage.status == True)).order_by(asc(LiveChatMessage.created_at)).limit(limit).offset(offset)
         
         result = await db.execute(query)
         messages = result.scalars().all()
@@ -38,8 +37,8 @@ async def delete_station_livechat_message(db: AsyncSession, message_id: str) ->
 
         message_dict = await messages_data.to_dict_with_relations(db=db)
         await messages_data.delete_with_relations(db)
-        await websocket_manager.broadcast_to_station(
-                db=db,
+        await db.commit()
+        websocket_manager.broadcast_to_station_background(
                 station_id=station_id,
                 data={"message": message_dict},
                 message_type="deleted_message",
@@ -60,20 +59,20 @@ async def create_livechat_message(db: AsyncSession,station_id: str, message: str
         
         chat_message = LiveChatMessage(
             station_id=station_id,
+            station=station,
             user_id=user_id,
             message=message,
             message_type=message_type,
         )
         
+        # Ids and defaults are generated client side, so the committed object needs no reload
         db.add(chat_message)
         await db.commit()
-        await db.refresh(chat_message)
         
         message_dict = await chat_message.to_dict_with_relations(db=db)
 
         if user_id:
-            await websocket_manager.broadcast_to_station(
-                db=db,
+            websocket_manager.broadcast_to_station_background(
                 station_id=station_id,
                 data={"message": message_dict},
                 message_type="livechat_message",
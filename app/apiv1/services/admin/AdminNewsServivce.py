@@ -1,7 +1,7 @@
 from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc
-from slugify import slugify
+from sqlalchemy.orm import undefer_group
 from datetime import datetime, timedelta
 from typing import Optional, Union, Dict, Any, List
 from app.database import get_database
@@ -10,9 +10,9 @@ from app.models.UserModel import User
 from app.utils.returns_data import returnsdata
 from app.utils.constants import SUCCESS, ERROR
 from app.utils.file_upload import save_upload_file, remove_file
-import re
+from app.utils.helper_functions import generate_suffixed_slug, commit_with_fresh_slug, flush_with_fresh_slug
+from app.utils.view_counter import view_counter
 import os
-import random
 import uuid
 
 async def create_news_article(db: AsyncSession, data: dict, author_id: str, featured_image: Optional[UploadFile] = None, gallery_images: List[UploadFile] = None) -> Dict[str, Any]:
@@ -33,12 +33,7 @@ async def create_news_article(db: AsyncSession, data: dict, author_id: str, feat
             raise HTTPException(status_code=400, detail="Author ID is required")
         
         # Generate slug from title
-        slug = slugify(data.get("title"))
-        
-        # Check if slug already exists
-        existing_article = await db.execute(select(News).where(News.slug == slug))
-        if existing_article.scalar_one_or_none():
-            slug = f"{slug}-{random.randint(1000, 9999)}"
+        slug = generate_suffixed_slug(data.get("title"))
 
         # Calculate reading time (approximately 200 words per minute)
         word_count = len(data.get("content", "").split())
@@ -95,9 +90,8 @@ async def create_news_article(db: AsyncSession, data: dict, author_id: str, feat
             updated_at=datetime.utcnow()
         )
         
-        db.add(new_article)
-        await db.commit()
-        await db.refresh(new_article)
+        await commit_with_fresh_slug(db, new_article, data.get("title"))
+        new_article = await News.get_for_serialization(db, new_article.id)
         return await new_article.to_dict_with_relations(db)
         
     except Exception as e:
@@ -114,13 +108,7 @@ async def update_news_article(db: AsyncSession, article_id: str, data: dict, fea
         if not article:
             raise HTTPException(status_code=404, detail="News article not found")
 
-        # Update slug if title changed
-        if data.get("title") and data.get("title") != article.title:
-            new_slug = slugify(data.get("title"))
-            existing_article = await db.execute(select(News).where(and_(News.slug == new_slug, News.id != article_id)))
-            if existing_article.scalar_one_or_none():
-                new_slug = f"{new_slug}-{random.randint(1000, 9999)}"
-            article.slug = new_slug
+        title_changed = bool(data.get("title")) and data.get("title") != article.title
 
         # Handle featured image upload
         if featured_image:
@@ -155,7 +143,7 @@ async def update_news_article(db: AsyncSession, article_id: str, data: dict, fea
 
         # Update fields
         for field, value in data.items():
-            if hasattr(article, field) and value is not None:
+            if hasattr(News, field) and value is not None:
                 setattr(article, field, value)
 
         # Update reading time if content changed
@@ -163,7 +151,7 @@ async def update_news_article(db: AsyncSession, article_id: str, data: dict, fea
 
             word_count = len(data.get("content").split())
             article.reading_time = max(1, round(word_count / 200))
-            article.content = data.get("content", article.content)
+            article.content = data.get("content")
 
         # Update published_at if publishing status changed
         if data.get("is_published") and not article.published_at:
@@ -173,8 +161,11 @@ async def update_news_article(db: AsyncSession, article_id: str, data: dict, fea
         
         article.updated_at = datetime.utcnow()
         
+        # Update slug if title changed
+        if title_changed:
+            await flush_with_fresh_slug(db, article, data.get("title"))
         await db.commit()
-        await db.refresh(article)
+        article = await News.get_for_serialization(db, article.id)
         return await article.to_dict_with_relations(db)
         
     except Exception as e:
@@ -183,7 +174,7 @@ async def update_news_article(db: AsyncSession, article_id: str, data: dict, fea
 
 async def get_news_article_by_id(db: AsyncSession, article_id: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(News).where(and_(News.id == article_id, News.state == True)))
+        result = await db.execute(select(News).options(*News.detail_options()).where(and_(News.id == article_id, News.state == True)))
         article = result.scalar_one_or_none()
         
         if not article:
@@ -196,24 +187,25 @@ async def get_news_article_by_id(db: AsyncSession, article_id: str) -> Dict[str,
 
 async def get_news_article_by_slug(db: AsyncSession, slug: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(News).where(and_(News.slug == slug, News.state == True, News.is_published == True)))
+        result = await db.execute(select(News).options(*News.detail_options()).where(and_(News.slug == slug, News.state == True, News.is_published == True)))
         article = result.scalar_one_or_none()
         
         if not article:
             raise HTTPException(status_code=404, detail="News article not found")
             
-        # Increment views count
-        article.views_count += 1
-        await db.commit()
+        # Views are buffered and flushed in the background
+        view_counter.increment(News, 'views_count', article.id)
             
-        return await article.to_dict_with_relations(db)
+        data = await article.to_dict_with_relations(db)
+        data['views_count'] = (article.views_count or 0) + view_counter.pending(News, 'views_count', article.id)
+        return data
         
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get news article: {str(e)}")
 
 async def get_news_articles(db: AsyncSession, filters: dict = None) -> Dict[str, Any]:
     try:
-        query = select(News).where(News.state == True)
+        query = select(News).options(*News.serialization_options()).where(News.state == True)
         
         if filters:
             if filters.get("is_published"):
@@ -298,6 +290,7 @@ async def delete_news_article(db: AsyncSession, article_id: str) -> bool:
             raise HTTPException(status_code=404, detail="News article not found")
 
         success = await article.delete_with_relations(db)
+        await db.commit()
         return success
     except Exception as e:
         await db.rollback()
@@ -308,12 +301,7 @@ async def create_news_category(db: AsyncSession, data: dict) -> Dict[str, Any]:
         if not data.get("name"):
             raise HTTPException(status_code=400, detail="Category name is required")
 
-        slug = slugify(data.get("name"))
-        
-        # Check if slug already exists
-        existing_category = await db.execute(select(NewsCategory).where(NewsCategory.slug == slug))
-        if existing_category.scalar_one_or_none():
-            slug = f"{slug}-{random.randint(1000, 9999)}"
+        slug = generate_suffixed_slug(data.get("name"))
 
         new_category = NewsCategory(
             name=data.get("name"),
@@ -329,10 +317,9 @@ async def create_news_category(db: AsyncSession, data: dict) -> Dict[str, Any]:
             updated_at=datetime.utcnow()
         )
         
-        db.add(new_category)
-        await db.commit()
+        await commit_with_fresh_slug(db, new_category, data.get("name"))
         await db.refresh(new_category)
-        return await new_category.to_dict()
+        return new_category.to_dict()
         
     except Exception as e:
         await db.rollback()
@@ -354,7 +341,7 @@ async def update_news_category(db: AsyncSession, category_id: str, data: dict) -
         
         await db.commit()
         await db.refresh(category)
-        return await category.to_dict()
+        return category.to_dict()
         
     except Exception as e:
         await db.rollback()
@@ -367,7 +354,7 @@ async def get_news_categories(db: AsyncSession) -> List[Dict[str, Any]]:
         
         categories_data = []
         for category in categories:
-            categories_data.append(await category.to_dict())
+            categories_data.append(category.to_dict())
         
         return categories_data
         
@@ -376,23 +363,21 @@ async def get_news_categories(db: AsyncSession) -> List[Dict[str, Any]]:
 
 async def update_article_engagement(db: AsyncSession, article_id: str, action: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(News).where(and_(News.id == article_id, News.state == True)))
+        counter = {"like": "likes_count", "share": "shares_count", "view": "views_count"}.get(action)
+        if counter:
+            await News.increment_counter(db, article_id, counter)
+            await db.commit()
+        
+        result = await db.execute(select(News).options(undefer_group('body')).where(and_(News.id == article_id, News.state == True)).execution_options(populate_existing=True))
         article = result.scalar_one_or_none()
         
         if not article:
             raise HTTPException(status_code=404, detail="News article not found")
         
-        if action == "like":
-            article.likes_count += 1
-        elif action == "share":
-            article.shares_count += 1
-        elif action == "view":
-            article.views_count += 1
-        
-        await db.commit()
-        await db.refresh(article)
-        return await article.to_dict()
+        return article.to_dict()
         
+    except HTTPException:
+        raise
     except Exception as e:
         await db.rollback()
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to update article engagement: {str(e)}")
@@ -402,7 +387,7 @@ async def get_trending_news(db: AsyncSession, limit: int = 10) -> List[Dict[str,
         # Get articles from last 7 days ordered by views and engagement
         week_ago = datetime.utcnow() - timedelta(days=7)
         
-        query = select(News).where(
+        query = select(News).options(*News.serialization_options()).where(
             and_(
                 News.state == True,
                 News.is_published == True,
@@ -445,7 +430,7 @@ async def update_news_article_image(db: AsyncSession, article_id: str, featured_
         article.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(article)
+        article = await News.get_for_serialization(db, article.id)
         return await article.to_dict_with_relations(db)
         
     except Exception as e:
@@ -481,7 +466,7 @@ async def add_gallery_images(db: AsyncSession, article_id: str, gallery_images:
         article.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(article)
+        article = await News.get_for_serialization(db, article.id)
         return await article.to_dict_with_relations(db)
         
     except Exception as e:
@@ -520,7 +505,7 @@ async def remove_gallery_image(db: AsyncSession, article_id: str, image_id: str)
         article.updated_at = datetime.utcnow()
         
         await db.commit()
-        await db.refresh(article)
+        article = await News.get_for_serialization(db, article.id)
         return await article.to_dict_with_relations(db)
         
     except Exception as e:
@@ -1,7 +1,6 @@
 from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 from app.models.RadioProgramModel import RadioProgram
 from app.models.UserModel import User
 from app.models.StationModel import Station
@@ -20,7 +19,7 @@ async def get_programs(db: AsyncSession, page: int = 1, per_page: int = 100) ->
     try:
         offset = (page - 1) * per_page
         
-        stmt = (select(RadioProgram).options(selectinload(RadioProgram.station),selectinload(RadioProgram.creator)).where(RadioProgram.state == True).order_by(RadioProgram.created_at.desc()).offset(offset).limit(per_page))
+        stmt = (select(RadioProgram).options(*RadioProgram.serialization_options()).where(RadioProgram.state == True).order_by(RadioProgram.created_at.desc()).offset(offset).limit(per_page))
         
         result = await db.execute(stmt)
         programs = result.scalars().all()
@@ -36,10 +35,7 @@ async def get_program_by_id(db: AsyncSession, program_id: str) -> dict:
     try:
         stmt = (
             select(RadioProgram)
-            .options(
-                selectinload(RadioProgram.station),
-                selectinload(RadioProgram.creator)
-            )
+            .options(*RadioProgram.serialization_options())
             .where(RadioProgram.id == program_id)
             .where(RadioProgram.state == True)
         )
@@ -282,16 +278,8 @@ async def associate_hosts_to_program(db: AsyncSession, program_id: str, host_ids
                     detail=f"Hosts not found: {missing_ids}"
                 )
 
-            for host in hosts:
-                hosts_data.append({
-                    "id": host.id,
-                    "name": host.name,
-                    "role": host.role,
-                    "email": host.email,
-                    "phone": host.phone,
-                    "image_url": host.image_url,
-                    "on_air_status": host.on_air_status
-                })
+            # Full host snapshots, so program reads need no Host query
+            hosts_data = [host.program_snapshot() for host in hosts]
         
         program.hosts = hosts_data
         await db.flush()
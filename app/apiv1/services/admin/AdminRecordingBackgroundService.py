@@ -15,7 +15,7 @@ import json
 
 async def get_radio_sessions(db: AsyncSession, data: Dict[str, Any], page: int = 1, per_page: int = 10) -> Dict[str, Any]:
     try:
-        query = select(RadioSessionRecording).where(and_(RadioSessionRecording.state == True))
+        query = select(RadioSessionRecording).options(*RadioSessionRecording.serialization_options()).where(and_(RadioSessionRecording.state == True))
         
         # Apply filters using QueryOptimizer
         filters = {}
@@ -35,8 +35,7 @@ async def get_radio_sessions(db: AsyncSession, data: Dict[str, Any], page: int =
                 raise HTTPException(status_code=400, detail="Invalid session_date format")
         
         query = query.order_by(desc(RadioSessionRecording.created_at))
-        async def transform_radio_session(item, db_session): return await item.to_dict_with_relations(db_session)
-        return await paginate_query(db=db, query=query, page=page, per_page=per_page, transform_func=transform_radio_session, include_total=True)
+        return await paginate_query(db=db, query=query, page=page, per_page=per_page, batch_transform=RadioSessionRecording.to_dicts_with_relations, include_total=True)
     except HTTPException:
         raise
     except Exception as e:
@@ -13,32 +13,37 @@ import json
 import copy
 
 
+async def _get_or_create_schedule(db: AsyncSession, station_id: str) -> StationSchedule:
+    # Verify station exists
+    station_result = await db.execute(select(Station).where(and_(Station.id == station_id, Station.state == True)))
+    station = station_result.scalar_one_or_none()
+    
+    if not station:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Station not found")
+    
+    schedule_result = await db.execute(select(StationSchedule).where(and_(StationSchedule.station_id == station_id, StationSchedule.state == True)))
+    schedule = schedule_result.scalar_one_or_none()
+    
+    if not schedule:
+        schedule = StationSchedule(
+            station_id=station_id,
+            sessions=StationSchedule.get_empty_sessions(),
+            status=True,
+            state=True,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        
+        db.add(schedule)
+        await db.commit()
+        await db.refresh(schedule)
+    
+    return schedule
+
+
 async def get_or_create_station_schedule(db: AsyncSession, station_id: str) -> Dict[str, Any]:
     try:
-        # Verify station exists
-        station_result = await db.execute(select(Station).where(and_(Station.id == station_id, Station.state == True)))
-        station = station_result.scalar_one_or_none()
-        
-        if not station:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Station not found")
-        
-        schedule_result = await db.execute(select(StationSchedule).where(and_(StationSchedule.station_id == station_id, StationSchedule.state == True)))
-        schedule = schedule_result.scalar_one_or_none()
-        
-        if not schedule:
-            schedule = StationSchedule(
-                station_id=station_id,
-                sessions=StationSchedule.get_empty_sessions(),
-                status=True,
-                state=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            
-            db.add(schedule)
-            await db.commit()
-            await db.refresh(schedule)
-        
+        schedule = await _get_or_create_schedule(db, station_id)
         return await schedule.to_dict_with_relations(db)
         
     except HTTPException:
@@ -90,6 +95,17 @@ async def update_station_schedule(db: AsyncSession, station_id: str, sessions_da
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+async def get_editable_sessions(db: AsyncSession, station_id: str) -> Dict[str, List[Dict[str, Any]]]:
+    # A copy of the stored sessions to edit and write back. The serialized schedule is not used for this: it
+    # attaches program dicts that do not belong in the sessions column (and older rows may still carry them)
+    schedule = await _get_or_create_schedule(db, station_id)
+    sessions = copy.deepcopy(schedule.sessions or StationSchedule.get_empty_sessions())
+    for day_sessions in sessions.values():
+        for session in day_sessions:
+            session.pop('program', None)
+    return sessions
+
+
 async def validate_programs_exist(db: AsyncSession, sessions_data: Dict[str, Any]) -> None:
     program_ids = set()
     
@@ -112,8 +128,7 @@ async def validate_programs_exist(db: AsyncSession, sessions_data: Dict[str, Any
 
 async def add_session_to_day(db: AsyncSession, station_id: str, day: str, session_data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
     try:
-        current_schedule = await get_or_create_station_schedule(db, station_id)
-        sessions = copy.deepcopy(current_schedule["sessions"])
+        sessions = await get_editable_sessions(db, station_id)
         
         if day not in sessions:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid day: {day}")
@@ -130,8 +145,7 @@ async def add_session_to_day(db: AsyncSession, station_id: str, day: str, sessio
 
 async def update_session_in_day(db: AsyncSession, station_id: str, day: str, session_index: int, session_data: Dict[str, Any], user_id: str) -> Dict[str, Any]:
     try:
-        current_schedule = await get_or_create_station_schedule(db, station_id)
-        sessions = copy.deepcopy(current_schedule["sessions"])
+        sessions = await get_editable_sessions(db, station_id)
         
         if day not in sessions:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid day: {day}")
@@ -150,8 +164,7 @@ async def update_session_in_day(db: AsyncSession, station_id: str, day: str, ses
 
 async def remove_session_from_day(db: AsyncSession, station_id: str, day: str, session_index: int, user_id: str) -> Dict[str, Any]:
     try:
-        current_schedule = await get_or_create_station_schedule(db, station_id)
-        sessions = copy.deepcopy(current_schedule["sessions"])
+        sessions = await get_editable_sessions(db, station_id)
         
         if day not in sessions:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid day: {day}")
@@ -168,8 +181,7 @@ async def remove_session_from_day(db: AsyncSession, station_id: str, day: str, s
 
 async def clear_day_schedule(db: AsyncSession, station_id: str, day: str, user_id: str) -> Dict[str, Any]:
     try:
-        current_schedule = await get_or_create_station_schedule(db, station_id)
-        sessions = copy.deepcopy(current_schedule["sessions"])
+        sessions = await get_editable_sessions(db, station_id)
         
         if day not in sessions:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid day: {day}")
@@ -184,8 +196,7 @@ async def clear_day_schedule(db: AsyncSession, station_id: str, day: str, user_i
 
 async def duplicate_day_schedule(db: AsyncSession, station_id: str, source_day: str, target_day: str, user_id: str) -> Dict[str, Any]:
     try:
-        current_schedule = await get_or_create_station_schedule(db, station_id)
-        sessions = copy.deepcopy(current_schedule["sessions"])
+        sessions = await get_editable_sessions(db, station_id)
         
         if source_day not in sessions or target_day not in sessions:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid day specified")
@@ -199,8 +210,7 @@ async def duplicate_day_schedule(db: AsyncSession, station_id: str, source_day:
 
 async def get_schedule_conflicts(db: AsyncSession, station_id: str) -> Dict[str, Any]:
     try:
-        schedule = await get_or_create_station_schedule(db, station_id)
-        temp_schedule = StationSchedule(station_id=station_id,sessions=schedule["sessions"])
+        temp_schedule = StationSchedule(station_id=station_id, sessions=await get_editable_sessions(db, station_id))
         validation_result = temp_schedule.validate_sessions()
         
         return {
@@ -220,8 +230,7 @@ async def get_schedule_conflicts(db: AsyncSession, station_id: str) -> Dict[str,
 
 async def get_schedule_statistics(db: AsyncSession, station_id: str) -> Dict[str, Any]:
     try:
-        schedule = await get_or_create_station_schedule(db, station_id)
-        sessions = schedule["sessions"]
+        sessions = await get_editable_sessions(db, station_id)
         
         stats = {
             "total_sessions": 0,
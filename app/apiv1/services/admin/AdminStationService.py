@@ -14,7 +14,7 @@ async def get_stations(db: AsyncSession, page: int = 1, per_page: int = 10) -> L
         # Calculate offset
         offset = (page - 1) * per_page
         # Get stations with pagination
-        stations_query = select(Station).where(and_(Station.state == True, Station.status == True)).order_by(desc(Station.created_at)).offset(offset)
+        stations_query = select(Station).options(*Station.serialization_options()).where(and_(Station.state == True, Station.status == True)).order_by(desc(Station.created_at)).offset(offset)
         
         result = await db.execute(stations_query)
         stations = result.scalars().all()
@@ -25,7 +25,7 @@ async def get_stations(db: AsyncSession, page: int = 1, per_page: int = 10) -> L
 
 async def get_station_by_id(db: AsyncSession, station_id: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(Station).where(and_(Station.id == station_id, Station.state == True, Station.status == True)))
+        result = await db.execute(select(Station).options(*Station.serialization_options()).where(and_(Station.id == station_id, Station.state == True, Station.status == True)))
         station = result.scalar_one_or_none()
         
         if not station:
@@ -183,12 +183,8 @@ async def delete_station_by_id(db: AsyncSession, station_id: str) -> bool:
         if not station:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Station not found")
         
-        # Soft delete - set state to False
-        station.state = False
-        station.updated_at = datetime.utcnow()
-        
-        await db.commit()
-        return True
+        # Soft delete, together with the station's programs, schedule and listeners
+        return await station.delete_with_relations(db)
         
     except HTTPException:
         raise
@@ -249,7 +245,7 @@ async def get_active_stations(db: AsyncSession) -> List[Dict[str, Any]]:
         stations = result.scalars().all()
         stations_data = []
         for station in stations:
-            station_dict = await station.to_dict()
+            station_dict = station.to_dict()
             stations_data.append(station_dict)
         
         return stations_data
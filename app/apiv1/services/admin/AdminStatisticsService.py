@@ -14,6 +14,7 @@ from app.models.AdvertModel import Advert
 from app.models.RadioSessionRecordingModel import RadioSessionRecording
 from app.models.LiveChatMessageModel import LiveChatMessage
 from app.models.UserModel import User
+from app.models.StationListenersModel import StationListeners
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,11 @@ def convert_decimal(value):
     """Convert Decimal to float for JSON serialization"""
     return float(value) if isinstance(value, Decimal) else value
 
+async def _fetch_counts(db: AsyncSession, queries: List) -> List[int]:
+    """Run independent scalar COUNT/SUM queries as subqueries of one SELECT (single round trip)"""
+    result = await db.execute(select(*[query.scalar_subquery() for query in queries]))
+    return [value or 0 for value in result.one()]
+
 async def get_dashboard_analytics(db: AsyncSession) -> Dict[str, Any]:
     try:
         return {
@@ -58,10 +64,7 @@ async def _get_overview_stats(db: AsyncSession) -> Dict[str, Any]:
             select(func.count(Event.id)).where(and_(Event.state == True, Event.created_at >= week_ago))
         ]
         
-        results = []
-        for query in queries:
-            result = await db.execute(query)
-            results.append(result.scalar() or 0)
+        results = await _fetch_counts(db, queries)
         
         return {
             "total_stations": results[0],
@@ -92,36 +95,53 @@ async def _get_stations_analytics(db: AsyncSession) -> Dict[str, Any]:
             select(func.count(Station.id)).where(and_(Station.state == True, Station.streaming_status == 'maintenance'))
         ]
         
-        counts = []
-        for query in queries:
-            result = await db.execute(query)
-            counts.append(result.scalar() or 0)
+        counts = await _fetch_counts(db, queries)
         
-        # Station details
-        stations_result = await db.execute(select(Station).where(and_(Station.state == True, Station.status == True)))
-        stations = stations_result.scalars().all()
+        # Station details with listener counts and their total aggregated in SQL
+        listeners_subquery = (
+            select(StationListeners.station_id, func.count(StationListeners.id).label("listeners"))
+            .where(StationListeners.last_seen > datetime.now() - timedelta(hours=24))
+            .group_by(StationListeners.station_id)
+            .subquery()
+        )
+        listeners_column = func.coalesce(listeners_subquery.c.listeners, 0)
+        programs_count = (
+            select(func.count(RadioProgram.id))
+            .where(and_(RadioProgram.station_id == Station.id, RadioProgram.state == True))
+            .scalar_subquery()
+        )
+        news_count = (
+            select(func.count(News.id))
+            .where(and_(News.station_id == Station.id, News.state == True))
+            .scalar_subquery()
+        )
+        stations_result = await db.execute(
+            select(
+                Station,
+                listeners_column.label("listeners"),
+                programs_count.label("programs_count"),
+                news_count.label("news_count"),
+                func.sum(listeners_column).over().label("total_listeners")
+            )
+            .outerjoin(listeners_subquery, listeners_subquery.c.station_id == Station.id)
+            .where(and_(Station.state == True, Station.status == True))
+        )
+        rows = stations_result.all()
         
         station_details = []
-        total_listeners = 0
-        
-        for station in stations:
-            programs_count = await db.execute(select(func.count(RadioProgram.id)).where(and_(RadioProgram.station_id == station.id, RadioProgram.state == True)))
-            news_count = await db.execute(select(func.count(News.id)).where(and_(News.station_id == station.id, News.state == True)))
-            
-            listeners = convert_decimal(station.listeners) if station.listeners else 0
-            
+        total_listeners = convert_decimal(rows[0].total_listeners) if rows else 0
+        
+        for station, listeners, station_programs, station_news, _ in rows:
             station_details.append({
                 "id": station.id,
                 "name": station.name,
                 "frequency": station.frequency,
                 "streaming_status": station.streaming_status,
                 "listeners": listeners,
-                "programs_count": programs_count.scalar() or 0,
-                "news_count": news_count.scalar() or 0,
+                "programs_count": station_programs or 0,
+                "news_count": station_news or 0,
                 "logo_url": station.logo_url
             })
-            
-            total_listeners += listeners
         
         return {
             "total_stations": counts[0],
@@ -161,10 +181,7 @@ async def _get_content_analytics(db: AsyncSession) -> Dict[str, Any]:
             select(func.count(Advert.id)).where(and_(Advert.state == True, Advert.status == True))
         ]
         
-        results = []
-        for query in queries:
-            result = await db.execute(query)
-            results.append(result.scalar() or 0)
+        results = await _fetch_counts(db, queries)
         
         # Top news
         top_news = await db.execute(
@@ -209,10 +226,15 @@ async def _get_engagement_analytics(db: AsyncSession) -> Dict[str, Any]:
         today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
         week_ago = datetime.utcnow() - timedelta(days=7)
         
-        # Chat analytics
-        total_chat = await db.execute(select(func.count(LiveChatMessage.id)).where(LiveChatMessage.state == True))
-        today_chat = await db.execute(select(func.count(LiveChatMessage.id)).where(and_(LiveChatMessage.state == True, LiveChatMessage.created_at >= today)))
-        week_chat = await db.execute(select(func.count(LiveChatMessage.id)).where(and_(LiveChatMessage.state == True, LiveChatMessage.created_at >= week_ago)))
+        # Chat analytics and news engagement
+        (total_chat, today_chat, week_chat, news_views, news_likes, news_shares) = await _fetch_counts(db, [
+            select(func.count(LiveChatMessage.id)).where(LiveChatMessage.state == True),
+            select(func.count(LiveChatMessage.id)).where(and_(LiveChatMessage.state == True, LiveChatMessage.created_at >= today)),
+            select(func.count(LiveChatMessage.id)).where(and_(LiveChatMessage.state == True, LiveChatMessage.created_at >= week_ago)),
+            select(func.sum(News.views_count)).where(and_(News.state == True, News.is_published == True)),
+            select(func.sum(News.likes_count)).where(and_(News.state == True, News.is_published == True)),
+            select(func.sum(News.shares_count)).where(and_(News.state == True, News.is_published == True))
+        ])
         
         # Station messages
         station_messages = await db.execute(
@@ -222,22 +244,17 @@ async def _get_engagement_analytics(db: AsyncSession) -> Dict[str, Any]:
             .group_by(Station.id, Station.name)
         )
         
-        # News engagement
-        news_views = await db.execute(select(func.sum(News.views_count)).where(and_(News.state == True, News.is_published == True)))
-        news_likes = await db.execute(select(func.sum(News.likes_count)).where(and_(News.state == True, News.is_published == True)))
-        news_shares = await db.execute(select(func.sum(News.shares_count)).where(and_(News.state == True, News.is_published == True)))
-        
         return {
             "chat": {
-                "total_messages": total_chat.scalar() or 0,
-                "today_messages": today_chat.scalar() or 0,
-                "week_messages": week_chat.scalar() or 0,
+                "total_messages": total_chat,
+                "today_messages": today_chat,
+                "week_messages": week_chat,
                 "by_station": [{"station": row[0], "messages": row[1]} for row in station_messages.fetchall()]
             },
             "news_engagement": {
-                "total_views": convert_decimal(news_views.scalar()) if news_views.scalar() else 0,
-                "total_likes": convert_decimal(news_likes.scalar()) if news_likes.scalar() else 0,
-                "total_shares": convert_decimal(news_shares.scalar()) if news_shares.scalar() else 0
+                "total_views": convert_decimal(news_views),
+                "total_likes": convert_decimal(news_likes),
+                "total_shares": convert_decimal(news_shares)
             }
         }
     except Exception as e:
@@ -246,27 +263,23 @@ async def _get_engagement_analytics(db: AsyncSession) -> Dict[str, Any]:
 
 async def _get_recordings_analytics(db: AsyncSession) -> Dict[str, Any]:
     try:
-        # Recording counts by status
+        # Recording counts by status and storage size
         statuses = ['scheduled', 'recording', 'completed', 'failed']
-        counts = {}
-        
-        total_result = await db.execute(select(func.count(RadioSessionRecording.id)).where(RadioSessionRecording.state == True))
-        counts['total'] = total_result.scalar() or 0
-        
-        for status in statuses:
-            result = await db.execute(
-                select(func.count(RadioSessionRecording.id)).where(
-                    and_(RadioSessionRecording.state == True, RadioSessionRecording.recording_status == status)
-                )
+        queries = [select(func.count(RadioSessionRecording.id)).where(RadioSessionRecording.state == True)]
+        queries += [
+            select(func.count(RadioSessionRecording.id)).where(
+                and_(RadioSessionRecording.state == True, RadioSessionRecording.recording_status == status)
             )
-            counts[status] = result.scalar() or 0
-        
-        # Storage size
-        storage_result = await db.execute(
+            for status in statuses
+        ]
+        queries.append(
             select(func.sum(RadioSessionRecording.file_size_mb)).where(
                 and_(RadioSessionRecording.state == True, RadioSessionRecording.recording_status == 'completed')
             )
         )
+        results = await _fetch_counts(db, queries)
+        counts = dict(zip(['total'] + statuses, results))
+        total_storage = results[-1]
         
         # Recent recordings
         recent = await db.execute(
@@ -295,7 +308,7 @@ async def _get_recordings_analytics(db: AsyncSession) -> Dict[str, Any]:
             "active": counts['recording'],
             "completed": counts['completed'],
             "failed": counts['failed'],
-            "total_storage_mb": convert_decimal(storage_result.scalar()) if storage_result.scalar() else 0,
+            "total_storage_mb": convert_decimal(total_storage),
             "recent_recordings": recent_list,
             "success_rate": success_rate
         }
@@ -316,10 +329,7 @@ async def _get_users_analytics(db: AsyncSession) -> Dict[str, Any]:
             select(func.count(User.id)).where(and_(User.state == True, User.role == 'presenter'))
         ]
         
-        results = []
-        for query in queries:
-            result = await db.execute(query)
-            results.append(result.scalar() or 0)
+        results = await _fetch_counts(db, queries)
         
         return {
             "total_users": results[0],
@@ -385,27 +395,20 @@ async def _get_trends_analytics(db: AsyncSession) -> Dict[str, Any]:
     try:
         trends = {"daily_content": []}
         
-        for i in range(7):
-            date = datetime.utcnow() - timedelta(days=i)
+        days = [datetime.utcnow() - timedelta(days=i) for i in range(7)]
+        queries = []
+        for date in days:
             date_start = datetime.combine(date.date(), datetime.min.time())
             date_end = datetime.combine(date.date(), datetime.max.time())
-            
-            news_count = await db.execute(
-                select(func.count(News.id)).where(
-                    and_(News.state == True, News.created_at.between(date_start, date_end))
-                )
-            )
-            
-            events_count = await db.execute(
-                select(func.count(Event.id)).where(
-                    and_(Event.state == True, Event.created_at.between(date_start, date_end))
-                )
-            )
-            
+            queries.append(select(func.count(News.id)).where(and_(News.state == True, News.created_at.between(date_start, date_end))))
+            queries.append(select(func.count(Event.id)).where(and_(Event.state == True, Event.created_at.between(date_start, date_end))))
+        
+        results = await _fetch_counts(db, queries)
+        for i, date in enumerate(days):
             trends["daily_content"].append({
                 "date": date.strftime("%Y-%m-%d"),
-                "news": news_count.scalar() or 0,
-                "events": events_count.scalar() or 0
+                "news": results[i * 2],
+                "events": results[i * 2 + 1]
             })
         
         trends["daily_content"].reverse()
@@ -417,32 +420,20 @@ async def _get_trends_analytics(db: AsyncSession) -> Dict[str, Any]:
 async def _get_performance_metrics(db: AsyncSession) -> Dict[str, Any]:
     try:
         # Count records
-        stations_count = await db.execute(select(func.count(Station.id)).where(Station.state == True))
-        programs_count = await db.execute(select(func.count(RadioProgram.id)).where(RadioProgram.state == True))
-        news_count = await db.execute(select(func.count(News.id)).where(News.state == True))
-        events_count = await db.execute(select(func.count(Event.id)).where(Event.state == True))
-        
-        total_records = (
-            (stations_count.scalar() or 0) +
-            (programs_count.scalar() or 0) +
-            (news_count.scalar() or 0) +
-            (events_count.scalar() or 0)
-        )
+        stations_count, programs_count, news_count, events_count, published_news, active_stations = await _fetch_counts(db, [
+            select(func.count(Station.id)).where(Station.state == True),
+            select(func.count(RadioProgram.id)).where(RadioProgram.state == True),
+            select(func.count(News.id)).where(News.state == True),
+            select(func.count(Event.id)).where(Event.state == True),
+            select(func.count(News.id)).where(and_(News.state == True, News.is_published == True)),
+            select(func.count(Station.id)).where(and_(Station.state == True, Station.status == True))
+        ])
         
-        # Health ratios
-        published_news_ratio = 0
-        if news_count.scalar():
-            published_news = await db.execute(
-                select(func.count(News.id)).where(and_(News.state == True, News.is_published == True))
-            )
-            published_news_ratio = (published_news.scalar() or 0) / news_count.scalar() * 100
+        total_records = stations_count + programs_count + news_count + events_count
         
-        station_health = 0
-        if stations_count.scalar():
-            active_stations = await db.execute(
-                select(func.count(Station.id)).where(and_(Station.state == True, Station.status == True))
-            )
-            station_health = (active_stations.scalar() or 0) / stations_count.scalar() * 100
+        # Health ratios
+        published_news_ratio = published_news / news_count * 100 if news_count else 0
+        station_health = active_stations / stations_count * 100 if stations_count else 0
         
         return {
             "total_records": total_records,
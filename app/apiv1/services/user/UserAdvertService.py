@@ -4,12 +4,13 @@ from sqlalchemy.future import select
 from sqlalchemy import and_, desc, or_
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from app.models.AdvertModel import Advert
+from app.models.AdvertModel import Advert, AdvertOut
+from app.models.StationModel import Station
+from app.models.UserModel import User
 from app.utils.returns_data import returnsdata
 from app.utils.constants import SUCCESS, ERROR
 from app.utils.file_upload import save_upload_file, remove_file
 from app.utils.pagination import paginate_data
-from fastapi.encoders import jsonable_encoder
 import os
 import uuid
 
@@ -18,11 +19,25 @@ async def get_user_adverts_by_station(db: AsyncSession, station_id: str, page: i
     try:
         offset = (page - 1) * per_page
         
-        stmt = select(Advert).where(and_(Advert.station_id == station_id, Advert.state == True, Advert.status == True)).order_by(desc(Advert.created_at)).offset(offset).limit(per_page)
+        stmt = (
+            select(
+                Advert.id, Advert.title, Advert.description, Advert.target_url, Advert.button_title,
+                Advert.image_path, Advert.image_url, Advert.station_id, Advert.created_by,
+                Advert.views_count, Advert.clicks_count, Advert.status, Advert.state,
+                Advert.created_at, Advert.updated_at,
+                Station.name.label("station_name"), Station.slug.label("station_slug"), Station.status.label("station_status"),
+                User.id.label("creator_id"), User.name.label("creator_name"), User.email.label("creator_email")
+            )
+            .join(Station, Advert.station_id == Station.id)
+            .outerjoin(User, Advert.created_by == User.id)
+            .where(and_(Advert.station_id == station_id, Advert.state == True, Advert.status == True))
+            .order_by(desc(Advert.created_at))
+            .offset(offset)
+            .limit(per_page)
+        )
         result = await db.execute(stmt)
-        adverts = result.scalars().all()
-        adverts_data = [await advert.to_dict_with_relations(db) for advert in adverts]
-        return paginate_data(jsonable_encoder(adverts_data), page=page, per_page=per_page)
+        adverts_data = [AdvertOut.from_row(row).model_dump(mode="json") for row in result]
+        return paginate_data(adverts_data, page=page, per_page=per_page)
         
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch station adverts: {str(e)}")
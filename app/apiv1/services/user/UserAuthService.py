@@ -44,7 +44,7 @@ async def authenticate_or_create_open_user(db: AsyncSession, device_fingerprint:
            await db.refresh(user)
        
        expires_delta = timedelta(days=30)
-       user_data = await user.to_dict()
+       user_data = user.to_dict()
        user.last_seen = datetime.now()
        await db.commit()
        token_data = await create_user_access_token(
@@ -94,7 +94,7 @@ async def update_user_information(db: AsyncSession, name: str, email: str, user_
            
            # Create new token for merged user
            expires_delta = timedelta(days=30)
-           user_data = await email_user.to_dict()
+           user_data = email_user.to_dict()
            token_data = await create_user_access_token(
                db=db,
                user=user_data,
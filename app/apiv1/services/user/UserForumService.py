@@ -1,27 +1,37 @@
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_, desc, func, asc, or_
+from sqlalchemy import and_, desc, func, asc, or_, exists, literal
+from sqlalchemy.orm import selectinload
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from app.models.ForumModel import Forum
 from app.models.ForumCommentModel import ForumComment
+from app.models.ForumViewModel import ForumView
 from app.models.UserModel import User
 from app.utils.returns_data import returnsdata
 from app.utils.constants import SUCCESS, ERROR
+from app.utils.advanced_paginator import paginate_keyset, keyset_page_size, InvalidCursorError, QueryOptimizer
+from app.utils.view_counter import view_counter
+from app.utils.query_guard import strict_loading_options
 from datetime import timedelta
+from cachetools import TTLCache
+
+# Per-station forum metrics, short TTL since the counts change slowly
+FORUM_METRICS_TTL = 30
+_forum_metrics_cache = TTLCache(maxsize=1024, ttl=FORUM_METRICS_TTL)
 
 
 async def get_forum_metrics(db: AsyncSession, station_id: str) -> Dict[str, Any]:
     try:
-        # Get total topics (forums) for this station
+        thirty_minutes_ago = datetime.utcnow() - timedelta(minutes=30)
+        
+        # Total topics (forums) for this station
         topics_stmt = select(func.count(Forum.id)).where(
             and_(Forum.state == True, Forum.status == True, Forum.station_id == station_id)
         )
-        topics_result = await db.execute(topics_stmt)
-        total_topics = topics_result.scalar() or 0
         
-        # Get total comments for forums in this station
+        # Total comments for forums in this station
         comments_stmt = select(func.count(ForumComment.id)).join(Forum).where(
             and_(
                 ForumComment.state == True,
@@ -30,24 +40,13 @@ async def get_forum_metrics(db: AsyncSession, station_id: str) -> Dict[str, Any]
                 Forum.state == True
             )
         )
-        comments_result = await db.execute(comments_stmt)
-        total_comments = comments_result.scalar() or 0
         
-        # Get total views for forums in this station (sum of all forum views)
-        forums_stmt = select(Forum.views).where(
+        # Total views across forums in this station
+        views_stmt = select(func.count(ForumView.id)).join(Forum, ForumView.forum_id == Forum.id).where(
             and_(Forum.state == True, Forum.status == True, Forum.station_id == station_id)
         )
-        forums_result = await db.execute(forums_stmt)
-        forums_views = forums_result.scalars().all()
-        
-        total_views = 0
-        for views_json in forums_views:
-            if views_json and isinstance(views_json, list):
-                # Count number of view entries in the JSON array
-                total_views += len(views_json)
         
-        # Get users online in last 30 minutes
-        thirty_minutes_ago = datetime.utcnow() - timedelta(minutes=30)
+        # Users online in last 30 minutes
         online_stmt = select(func.count(User.id)).where(
             and_(
                 User.state == True,
@@ -55,70 +54,77 @@ async def get_forum_metrics(db: AsyncSession, station_id: str) -> Dict[str, Any]
                 User.last_seen >= thirty_minutes_ago
             )
         )
-        online_result = await db.execute(online_stmt)
-        online_now = online_result.scalar() or 0
+        
+        result = await db.execute(select(
+            topics_stmt.scalar_subquery(),
+            comments_stmt.scalar_subquery(),
+            views_stmt.scalar_subquery(),
+            online_stmt.scalar_subquery()
+        ))
+        total_topics, total_comments, total_views, online_now = result.one()
         
         return {
-            "total_topics": total_topics,
-            "total_comments": total_comments,
-            "total_views": total_views,
-            "online_now": online_now
+            "total_topics": total_topics or 0,
+            "total_comments": total_comments or 0,
+            "total_views": total_views or 0,
+            "online_now": online_now or 0
         }
         
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch forum metrics: {str(e)}")
 
 
-async def get_user_forums(db: AsyncSession,station_id: str, filters: dict = None, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+async def get_forum_metrics_cached(db: AsyncSession, station_id: str) -> Dict[str, Any]:
+    metrics = _forum_metrics_cache.get(station_id)
+    if metrics is None:
+        metrics = await get_forum_metrics(db, station_id)
+        _forum_metrics_cache[station_id] = metrics
+    return dict(metrics)
+
+
+def invalidate_forum_metrics(station_id: str) -> None:
+    _forum_metrics_cache.pop(station_id, None)
+
+
+def _forum_filters(station_id: str, filters: dict = None) -> List[Any]:
+    clauses = [Forum.state == True, Forum.status == True, Forum.station_id == station_id]
+    if filters and filters.get("search"):
+        clauses.append(QueryOptimizer.fulltext_match([Forum.title, Forum.body], filters.get("search")))
+    return clauses
+
+
+async def get_user_forums(db: AsyncSession,station_id: str, filters: dict = None, page: int = 1, per_page: int = 10, cursor: Optional[str] = None, include_total: bool = True) -> Dict[str, Any]:
     try:
-        offset = (page - 1) * per_page
-        
-        stmt = select(Forum).where(and_(Forum.state == True, Forum.status == True, Forum.station_id == station_id))
+        per_page = keyset_page_size(per_page)
+        clauses = _forum_filters(station_id, filters)
+        stmt = select(Forum).options(*Forum.serialization_options(), *strict_loading_options()).where(*clauses)
         
-        # Add filters if provided
-        if filters:
-            if filters.get("search"):
-                search_term = f"%{filters.get('search')}%"
-                stmt = stmt.where(
-                    or_(
-                        Forum.title.ilike(search_term),
-                        Forum.body.ilike(search_term)
-                    )
-                )
-        
-        # Get total count
-        count_stmt = select(func.count(Forum.id)).where(and_(Forum.state == True, Forum.status == True))
-        if filters and filters.get("search"):
-            search_term = f"%{filters.get('search')}%"
-            count_stmt = count_stmt.where(
-                or_(
-                    Forum.title.ilike(search_term),
-                    Forum.body.ilike(search_term)
-                )
-            )
-        
-        total_result = await db.execute(count_stmt)
-        total_count = total_result.scalar()
+        # Get total count (first page only when asked for, later pages follow the cursor)
+        total_count = None
+        if include_total and not cursor:
+            total_result = await db.execute(select(func.count()).select_from(Forum).where(*clauses))
+            total_count = total_result.scalar()
         
         # Get forums
-        stmt = stmt.order_by(desc(Forum.created_at)).offset(offset).limit(per_page)
-        result = await db.execute(stmt)
-        forums = result.scalars().all()
+        forums, next_cursor = await paginate_keyset(db, stmt, [Forum.created_at, Forum.id], cursor=cursor, per_page=per_page, page=page)
         
-        forums_data = []
-        for forum in forums:
-            forum_dict = await forum.to_dict_with_relations(db)
-            forums_data.append(forum_dict)
-        metrics = await get_forum_metrics(db, station_id)
+        # Sequential on purpose: the serializers can fall back to queries and an AsyncSession is not safe to share across tasks
+        forums_data = [await forum.to_dict_with_relations(db) for forum in forums]
+        metrics = await get_forum_metrics_cached(db, station_id)
         return {
             "data": forums_data,
-            "current_page": page,
+            # A cursor page has no page number
+            "current_page": None if cursor else page,
             "per_page": per_page,
             "total": total_count,
-            "total_pages": (total_count + per_page - 1) // per_page,
+            "total_pages": (total_count + per_page - 1) // per_page if total_count is not None else None,
+            "has_next": next_cursor is not None,
+            "next_cursor": next_cursor,
             "metrics": metrics
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch forums: {str(e)}")
 
@@ -126,27 +132,19 @@ async def get_user_forums(db: AsyncSession,station_id: str, filters: dict = None
 
 async def get_forum_by_slug(db: AsyncSession, forum_slug: str, user_id: str) -> Dict[str, Any]:
     try:
-        stmt = select(Forum).where(and_(Forum.slug == forum_slug, Forum.state == True, Forum.status == True))
+        # Whether this user already viewed the forum is checked in SQL alongside the forum fetch
+        user_viewed = exists().where(and_(ForumView.forum_id == Forum.id, ForumView.user_id == user_id)) if user_id else literal(True)
+        stmt = select(Forum, user_viewed.label("user_viewed")).options(*Forum.serialization_options()).where(and_(Forum.slug == forum_slug, Forum.state == True, Forum.status == True))
         result = await db.execute(stmt)
-        forum = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if not forum:
+        if not row:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Forum not found")
+        forum, already_viewed = row
         
-        # Initialize views if None and handle user view tracking
-        if user_id:
-            if forum.views is None:
-                forum.views = []
-            
-            # Check if user already viewed
-            user_viewed = any(view.get("user_id") == user_id for view in forum.views)
-            
-            if not user_viewed:
-                forum.views.append({
-                    "user_id": user_id,
-                    "viewed_at": datetime.utcnow().isoformat()
-                })
-                await db.commit()
+        # First views are buffered and written in the background
+        if not already_viewed:
+            view_counter.record_forum_view(forum.id, user_id)
                      
         return await forum.to_dict_with_relations(db)
              
@@ -156,38 +154,38 @@ async def get_forum_by_slug(db: AsyncSession, forum_slug: str, user_id: str) ->
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch forum: {str(e)}")
 
 
-async def get_forum_comments(db: AsyncSession, forum_id: str, page: int = 1, per_page: int = 10) -> Dict[str, Any]:
+async def get_forum_comments(db: AsyncSession, forum_id: str, page: int = 1, per_page: int = 10, cursor: Optional[str] = None, include_total: bool = True) -> Dict[str, Any]:
     try:
-        offset = (page - 1) * per_page
-        
-        # Get total count
-        count_stmt = select(func.count(ForumComment.id)).where(
-            and_(ForumComment.forum_id == forum_id, ForumComment.state == True, ForumComment.status == True)
-        )
-        total_result = await db.execute(count_stmt)
-        total_count = total_result.scalar()
+        per_page = keyset_page_size(per_page)
+        # Get total count (first page only when asked for, later pages follow the cursor)
+        total_count = None
+        if include_total and not cursor:
+            count_stmt = select(func.count(ForumComment.id)).where(
+                and_(ForumComment.forum_id == forum_id, ForumComment.state == True, ForumComment.status == True)
+            )
+            total_result = await db.execute(count_stmt)
+            total_count = total_result.scalar()
         
         # Get comments
-        stmt = select(ForumComment).where(
+        stmt = select(ForumComment).options(*ForumComment.serialization_options(), *strict_loading_options()).where(
             and_(ForumComment.forum_id == forum_id, ForumComment.state == True, ForumComment.status == True)
-        ).order_by(asc(ForumComment.created_at)).offset(offset).limit(per_page)
-        
-        result = await db.execute(stmt)
-        comments = result.scalars().all()
+        )
+        comments, next_cursor = await paginate_keyset(db, stmt, [ForumComment.created_at, ForumComment.id], cursor=cursor, per_page=per_page, descending=False, page=page)
         
-        comments_data = []
-        for comment in comments:
-            comment_dict = await comment.to_dict_with_relations(db)
-            comments_data.append(comment_dict)
+        comments_data = [await comment.to_dict_with_relations(db) for comment in comments]
         
         return {
             "data": comments_data,
-            "current_page": page,
+            "current_page": None if cursor else page,
             "per_page": per_page,
             "total": total_count,
-            "total_pages": (total_count + per_page - 1) // per_page
+            "total_pages": (total_count + per_page - 1) // per_page if total_count is not None else None,
+            "has_next": next_cursor is not None,
+            "next_cursor": next_cursor
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to fetch comments: {str(e)}")
 
@@ -221,9 +219,10 @@ async def create_forum_comment(db: AsyncSession, comment_data: Dict[str, Any], u
             updated_at=datetime.utcnow()
         )
         
+        # Ids and timestamps are generated client side, so the committed object needs no reload
         db.add(new_comment)
         await db.commit()
-        await db.refresh(new_comment)
+        invalidate_forum_metrics(forum.station_id)
         return new_comment
         
     except HTTPException:
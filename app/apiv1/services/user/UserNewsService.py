@@ -1,7 +1,6 @@
 from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc
-from slugify import slugify
 from datetime import datetime, timedelta
 from typing import Optional, Union, Dict, Any, List
 from app.database import get_database
@@ -10,98 +9,85 @@ from app.models.UserModel import User
 from app.utils.returns_data import returnsdata
 from app.utils.constants import SUCCESS, ERROR
 from app.utils.file_upload import save_upload_file, remove_file
-import re
+from app.utils.advanced_paginator import paginate_keyset, keyset_page_size, InvalidCursorError, QueryOptimizer
+from app.utils.view_counter import view_counter
+from app.utils.query_guard import strict_loading_options
+import asyncio
 import os
-import random
-import uuid
 
-async def get_user_news(db: AsyncSession,station_id: str, filters: dict = None, per_page: int = 1, page: int = 1) -> Dict[str, Any]:
-    try:
-        query = select(News).where(News.state == True, News.is_published == True, News.station_id == station_id)
-        
-        if filters:
-            if filters.get("is_featured"):
-                query = query.where(News.is_featured == True)
-            if filters.get("is_breaking"):
-                query = query.where(News.is_breaking == True)
-            if filters.get("category_id"):
-                query = query.where(News.category_id == filters.get("category_id"))
-            if filters.get("author_id"):
-                query = query.where(News.author_id == filters.get("author_id"))
-            if filters.get("search"):
-                search_term = f"%{filters.get('search')}%"
-                query = query.where(or_(
-                    News.title.ilike(search_term),
-                    News.content.ilike(search_term),
-                    News.summary.ilike(search_term)
-                ))
+def _news_filters(station_id: str, filters: dict = None) -> List[Any]:
+    clauses = [News.state == True, News.is_published == True, News.station_id == station_id]
+    if filters:
+        if filters.get("is_featured"):
+            clauses.append(News.is_featured == True)
+        if filters.get("is_breaking"):
+            clauses.append(News.is_breaking == True)
+        if filters.get("category_id"):
+            clauses.append(News.category_id == filters.get("category_id"))
+        if filters.get("author_id"):
+            clauses.append(News.author_id == filters.get("author_id"))
+        if filters.get("search"):
+            clauses.append(QueryOptimizer.fulltext_match([News.title, News.content, News.summary], filters.get("search")))
+    return clauses
 
-        # Base query for counting
-        count_query = select(func.count(News.id)).where(News.state == True, News.is_published == True)
-        
-        # Apply same filters to count query
-        if filters:
-            if filters.get("is_featured"):
-                count_query = count_query.where(News.is_featured == True)
-            if filters.get("is_breaking"):
-                count_query = count_query.where(News.is_breaking == True)
-            if filters.get("category_id"):
-                count_query = count_query.where(News.category_id == filters.get("category_id"))
-            if filters.get("station_id"):
-                count_query = count_query.where(News.station_id == filters.get("station_id"))
-            if filters.get("author_id"):
-                count_query = count_query.where(News.author_id == filters.get("author_id"))
-            if filters.get("search"):
-                search_term = f"%{filters.get('search')}%"
-                count_query = count_query.where(or_(
-                    News.title.ilike(search_term),
-                    News.content.ilike(search_term),
-                    News.summary.ilike(search_term)
-                ))
 
-        # Ordering
-        if filters and filters.get("order_by"):
-            if filters.get("order_by") == "published_at":
+async def get_user_news(db: AsyncSession,station_id: str, filters: dict = None, per_page: int = 1, page: int = 1, cursor: Optional[str] = None, include_total: bool = True) -> Dict[str, Any]:
+    try:
+        per_page = keyset_page_size(per_page)
+        clauses = _news_filters(station_id, filters)
+        query = select(*News.list_columns()).where(*clauses)
+        count_query = select(func.count()).select_from(News).where(*clauses)
+
+        # Ordering: custom orderings page by offset, the default created_at order pages by cursor
+        order_by = filters.get("order_by") if filters else None
+        next_cursor = None
+        current_page = page
+        if order_by in ("published_at", "views", "priority"):
+            if order_by == "published_at":
                 query = query.order_by(desc(News.published_at))
-            elif filters.get("order_by") == "views":
+            elif order_by == "views":
                 query = query.order_by(desc(News.views_count))
-            elif filters.get("order_by") == "priority":
-                query = query.order_by(desc(News.priority))
             else:
-                query = query.order_by(desc(News.created_at))
+                query = query.order_by(desc(News.priority))
+            offset = (page - 1) * per_page
+            result = await db.execute(query.offset(offset).limit(per_page + 1))
+            articles = result.all()
+            has_next = len(articles) > per_page
+            articles = articles[:per_page]
         else:
-            query = query.order_by(desc(News.created_at))
-
-        # Pagination
-        offset = (page - 1) * per_page
-        query = query.offset(offset).limit(per_page)
+            articles, next_cursor = await paginate_keyset(db, query, [News.created_at, News.id], cursor=cursor, per_page=per_page, page=page)
+            has_next = next_cursor is not None
+            if cursor:
+                current_page = None
         
-        # Execute queries
-        result = await db.execute(query)
-        articles = result.scalars().all()
-        
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        # Total count on the first page only when asked for, later pages follow the cursor
+        total = None
+        if include_total and not cursor:
+            total_result = await db.execute(count_query)
+            total = total_result.scalar()
         
-        articles_data = []
-        for article in articles:
-            articles_data.append(await article.to_dict_with_relations(db))
+        articles_data = await News.rows_to_dicts(db, articles)
         
         return {
             "data": articles_data,
-            "page": page,
+            "page": current_page,
             "per_page": per_page,
             "total": total,
-            "pages": (total + per_page - 1) // per_page
+            "pages": (total + per_page - 1) // per_page if total is not None else None,
+            "has_next": has_next,
+            "next_cursor": next_cursor
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get news articles: {str(e)}")
 
 
-async def get_user_news_breaking(db: AsyncSession,station_id: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+async def get_user_news_breaking(db: AsyncSession,station_id: str, limit: int = 10, offset: int = 0, include_total: bool = True) -> Dict[str, Any]:
     try:
-        query = select(News).where(News.state == True, News.is_breaking == True, News.station_id == station_id)
+        clauses = [News.state == True, News.is_breaking == True, News.station_id == station_id]
+        query = select(*News.list_columns()).where(*clauses)
         
         query = query.order_by(desc(News.created_at))
 
@@ -110,20 +96,21 @@ async def get_user_news_breaking(db: AsyncSession,station_id: str, limit: int =
         per_page = limit
         offset = (page - 1) * per_page
         
-        query = query.offset(offset).limit(per_page)
+        query = query.offset(offset).limit(per_page + 1)
         
         result = await db.execute(query)
-        articles = result.scalars().all()
+        articles = result.all()
+        has_next = len(articles) > per_page
+        articles = articles[:per_page]
         
         # Get total count
-        count_query = select(func.count(News.id)).where(News.state == True)
-        
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        total = None
+        if include_total:
+            count_query = select(func.count()).select_from(News).where(*clauses)
+            total_result = await db.execute(count_query)
+            total = total_result.scalar()
         
-        articles_data = []  
-        for article in articles:
-            articles_data.append(await article.to_dict_with_relations(db))
+        articles_data = await News.rows_to_dicts(db, articles)
         
         return {
             "data": articles_data,
@@ -131,7 +118,8 @@ async def get_user_news_breaking(db: AsyncSession,station_id: str, limit: int =
                 "page": page,
                 "per_page": per_page,
                 "total": total,
-                "pages": (total + per_page - 1) // per_page
+                "pages": (total + per_page - 1) // per_page if total is not None else None,
+                "has_next": has_next
             }
         }
         
@@ -142,17 +130,18 @@ async def get_user_news_breaking(db: AsyncSession,station_id: str, limit: int =
 
 async def get_news_article_by_slug(db: AsyncSession, slug: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(News).where(and_(News.slug == slug, News.state == True, News.is_published == True)))
+        result = await db.execute(select(News).options(*News.detail_options()).where(and_(News.slug == slug, News.state == True, News.is_published == True)))
         article = result.scalar_one_or_none()
         
         if not article:
             raise HTTPException(status_code=404, detail="News article not found")
             
-        # Increment views count
-        article.views_count += 1
-        await db.commit()
+        # Views are buffered and flushed in the background
+        view_counter.increment(News, 'views_count', article.id)
             
-        return await article.to_dict_with_relations(db)
+        data = await article.to_dict_with_relations(db)
+        data['views_count'] = (article.views_count or 0) + view_counter.pending(News, 'views_count', article.id)
+        return data
         
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to get news article: {str(e)}")
@@ -19,16 +19,16 @@ from app.utils.pagination import paginate_data
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import selectinload
 from app.utils.advanced_paginator import paginate_query, QueryOptimizer
+from app.utils.helper_functions import convert_status_to_boolean
+from app.utils.query_guard import strict_loading_options
 
 async def get_station_by_initial_access_link(db: AsyncSession, access_link: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(Station).where(and_(Station.access_link == access_link, Station.state == True, Station.status == True)).limit(1))
+        result = await db.execute(select(Station).options(*Station.serialization_options(include_programs=True, include_schedule=True), *strict_loading_options()).where(and_(Station.access_link == access_link, Station.state == True, Station.status == True)).limit(1))
         station = result.scalar_one_or_none()
         
         if not station:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Station not found")
-        await db.commit()
-        await db.refresh(station)
         return await station.to_dict_with_relations(db, include_programs=True, include_schedule=True)
         
     except HTTPException:
@@ -38,14 +38,13 @@ async def get_station_by_initial_access_link(db: AsyncSession, access_link: str)
 
 async def get_station_by_access_link(db: AsyncSession, access_link: str, user_id: str) -> Dict[str, Any]:
     try:
-        result = await db.execute(select(Station).where(and_(Station.access_link == access_link, Station.state == True, Station.status == True)).limit(1))
+        result = await db.execute(select(Station).options(*Station.serialization_options(include_programs=True, include_schedule=True), *strict_loading_options()).where(and_(Station.access_link == access_link, Station.state == True, Station.status == True)).limit(1))
         station = result.scalar_one_or_none()
         
         if not station:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Station not found")
+        # create_station_listener commits the listener row itself
         await StationListeners.create_station_listener(db, user_id=user_id, station_id=station.id)
-        await db.commit()
-        await db.refresh(station)
         return await station.to_dict_with_relations(db, include_programs=True, include_schedule=True)
         
     except HTTPException:
@@ -59,12 +58,7 @@ async def get_station_livechat_messages(db: AsyncSession, station_id: str, limit
     try:
         limit = min(limit, 200)  # Enforce 200 message limit
         
-        query = select(LiveChatMessage).options(selectinload(LiveChatMessage.user),selectinload(LiveChatMessage.station)).where(and_(LiveChatMessage.station_id == station_id,LiveChatMessage.is_visible == True,LiveChatMessage.state == True,LiveChatMessage.status == True)).order_by(asc(LiveChatMessage.created_at)).limit(limit).offset(offset)
-        
-        result = await db.execute(query)
-        messages = result.scalars().all()
-        
-        return [await message.to_dict_with_relations(db=db) for message in messages]
+        return await LiveChatMessage.list_for_station(db, station_id, limit, offset)
         
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -87,20 +81,20 @@ async def create_livechat_message(db: AsyncSession,station_id: str,message: str,
         
         chat_message = LiveChatMessage(
             station_id=station_id,
+            station=station,
             user_id=user_id,
             message=message,
             message_type=message_type,
         )
         
+        # Ids and defaults are generated client side, so the committed object needs no reload
         db.add(chat_message)
         await db.commit()
-        await db.refresh(chat_message)
         
         message_dict = await chat_message.to_dict_with_relations(db=db)
 
         if user_id:
-            await websocket_manager.broadcast_to_station(
-                db=db,
+            websocket_manager.broadcast_to_station_background(
                 station_id=station_id,
                 data={"message": message_dict},
                 message_type="livechat_message",
@@ -118,32 +112,18 @@ async def get_user_hosts_by_station(db: AsyncSession, station_id: str, page: int
     try:
         offset = (page - 1) * per_page
         
-        # Get all radio programs for the station
-        radio_programs_stmt = select(RadioProgram).where(
+        # Hosts referenced by any of the station's programs, matched inside the JSON column in SQL
+        station_programs = select(RadioProgram.id).where(
             and_(
                 RadioProgram.station_id == station_id, 
                 RadioProgram.state == True, 
-                RadioProgram.status == True
+                RadioProgram.status == True,
+                RadioProgram.has_host(Host.id)
             )
         )
-        radio_programs_result = await db.execute(radio_programs_stmt)
-        radio_programs = radio_programs_result.scalars().all()
-        
-        # Extract all host IDs from programs
-        host_ids = set()
-        for program in radio_programs:
-            if program.hosts:  # Check if hosts exists and is not empty
-                for host in program.hosts:
-                    if isinstance(host, dict) and 'id' in host:
-                        host_ids.add(host['id'])
-        
-        if not host_ids:
-            return paginate_data([], page=page, per_page=per_page)
-        
-        # Get hosts by IDs
         stmt = select(Host).where(
             and_(
-                Host.id.in_(list(host_ids)), 
+                station_programs.exists(), 
                 Host.state == True, 
                 Host.status == True
             )
@@ -152,7 +132,21 @@ async def get_user_hosts_by_station(db: AsyncSession, station_id: str, page: int
         result = await db.execute(stmt)
         hosts = result.scalars().all()
         
-        hosts_data = [await host.to_dict_with_relations(db=db, include_programs=True) for host in hosts]
+        # Prefetch the programs of every host on this page in one query so the
+        # hosts serialize concurrently without touching the shared session
+        page_host_ids = {host.id for host in hosts}
+        if not page_host_ids:
+            return paginate_data([], page=page, per_page=per_page)
+        programs_result = await db.execute(select(RadioProgram).where(and_(RadioProgram.state == True, RadioProgram.status == True, or_(*(RadioProgram.has_host(host_id) for host_id in page_host_ids)))))
+        host_programs = {host_id: [] for host_id in page_host_ids}
+        for program in programs_result.scalars().all():
+            program_host_ids = {host.get('id') for host in program.hosts if isinstance(host, dict)} & page_host_ids
+            if program_host_ids:
+                program_dict = program.to_dict()
+                for host_id in program_host_ids:
+                    host_programs[host_id].append(program_dict)
+        
+        hosts_data = [await host.to_dict_with_relations(db=db, include_programs=True, programs=host_programs[host.id]) for host in hosts]
         
         return paginate_data(jsonable_encoder(hosts_data), page=page, per_page=per_page)
         
@@ -162,7 +156,7 @@ async def get_user_hosts_by_station(db: AsyncSession, station_id: str, page: int
 
 async def get_user_radio_sessions(db: AsyncSession, station_id: str, data: Dict[str, Any], page: int = 1, per_page: int = 10) -> Dict[str, Any]:
     try:
-        query = select(RadioSessionRecording).where(and_(RadioSessionRecording.state == True, RadioSessionRecording.status == True, RadioSessionRecording.station_id == station_id, RadioSessionRecording.recording_status == 'completed'))
+        query = select(RadioSessionRecording).options(*RadioSessionRecording.serialization_options()).where(and_(RadioSessionRecording.state == True, RadioSessionRecording.status == True, RadioSessionRecording.station_id == station_id, RadioSessionRecording.recording_status == 'completed'))
         filters = {}
         if data.get('program_id'): filters['program_id'] = data['program_id']
         if data.get('day_of_week'): filters['day_of_week'] = data['day_of_week']
@@ -177,8 +171,7 @@ async def get_user_radio_sessions(db: AsyncSession, station_id: str, data: Dict[
                 raise HTTPException(status_code=400, detail="Invalid session_date format")
         
         query = query.order_by(desc(RadioSessionRecording.created_at))
-        async def transform_radio_session(item, db_session): return await item.to_dict_with_relations(db_session)
-        return await paginate_query(db=db, query=query, page=page, per_page=per_page, transform_func=transform_radio_session, include_total=True)
+        return await paginate_query(db=db, query=query, page=page, per_page=per_page, batch_transform=RadioSessionRecording.to_dicts_with_relations, include_total=bool(convert_status_to_boolean(data.get('include_total', True))))
     except HTTPException:
         raise
     except Exception as e:
@@ -239,13 +232,7 @@ async def get_user_radio_events(db: AsyncSession, data: Dict[str, Any], page: in
         
         # Search filter
         if data.get('search'):
-            search_pattern = f"%{data['search']}%"
-            query = query.where(or_(
-                Event.title.ilike(search_pattern),
-                Event.description.ilike(search_pattern),
-                Event.venue_name.ilike(search_pattern),
-                Event.venue_address.ilike(search_pattern)
-            ))
+            query = query.where(QueryOptimizer.fulltext_match([Event.title, Event.description, Event.venue_name, Event.venue_address], data['search']))
         
         # Free/Paid filter (assuming events with featured_image are paid)
         if data.get('price_type'):
@@ -270,7 +257,7 @@ async def get_user_radio_events(db: AsyncSession, data: Dict[str, Any], page: in
         async def transform_event(item, db_session): 
             return await item.to_dict_with_relations(db_session)
             
-        return await paginate_query(db=db, query=query, page=page, per_page=per_page, transform_func=transform_event, include_total=True)
+        return await paginate_query(db=db, query=query, page=page, per_page=per_page, transform_func=transform_event, include_total=bool(convert_status_to_boolean(data.get('include_total', True))))
         
     except HTTPException:
         raise
@@ -1,8 +1,11 @@
 from sqlalchemy.dialects.mysql import CHAR
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
 from app.models.BaseModel import BaseModelMixin
 import os
+import time
+import logging
 from dotenv import load_dotenv
 from urllib.parse import quote_plus
 
@@ -17,6 +20,17 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 APP_ENV = os.getenv("APP_ENV")
 
+# Connection pool sizing, per worker process. Keep
+# (DB_POOL_SIZE + DB_MAX_OVERFLOW) * uvicorn workers below MySQL's max_connections minus headroom
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "25"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "25"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Connections checked out longer than this are logged, to find requests that hold the pool during slow non-DB work
+DB_SLOW_HOLD_SECONDS = float(os.getenv("DB_SLOW_HOLD_SECONDS", "1"))
+
+logger = logging.getLogger(__name__)
+
 def get_database_url():
     # URL encode the password to handle special characters like @
     encoded_password = quote_plus(DB_PASSWORD) if DB_PASSWORD else ""
@@ -27,11 +41,27 @@ URL_DATABASE = get_database_url()
 engine = create_async_engine(
     URL_DATABASE,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=True,  # Set to False in production
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,  # Recycle before MySQL's wait_timeout drops idle connections
+    echo=APP_ENV == "development",  # SQL logging only while developing
+    query_cache_size=1200,
+    isolation_level="READ COMMITTED",
 )
 
+@event.listens_for(engine.sync_engine, "checkout")
+def _record_checkout(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info["checked_out_at"] = time.monotonic()
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _log_slow_checkin(dbapi_connection, connection_record):
+    checked_out_at = connection_record.info.pop("checked_out_at", None)
+    if checked_out_at is not None:
+        held = time.monotonic() - checked_out_at
+        if held > DB_SLOW_HOLD_SECONDS:
+            logger.warning(f"Database connection held for {held:.2f}s")
+
 # Create async session maker with explicit configuration
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -46,11 +76,8 @@ AsyncSessionLocal = async_sessionmaker(
 
 # Improved database dependency
 async def get_database() -> AsyncGenerator[AsyncSession, None]:
-    session = AsyncSessionLocal()
-    try:
+    async with AsyncSessionLocal() as session:
         yield session
-    finally:
-        await session.close()
 
 # Initialization function
 async def init_models():
@@ -5,18 +5,50 @@ from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from contextlib import asynccontextmanager
-from app.models import *
+from app import models  # noqa: F401  registers every mapped table on Base.metadata
 from app.routes import api_router
 from app.database import init_models, close_models, get_database
+from app.utils.view_counter import view_counter
+from app.utils.returns_data import OrjsonResponse
 
 import logging
 import os
 
 
+logger = logging.getLogger("uvicorn")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        logger.info("Initializing application...")
+        await init_models()
+        view_counter.start()
+        logger.info("Application startup completed successfully")
+      
+    except Exception as e:
+        logger.error(f"Startup failed: {e}", exc_info=True)
+        raise
+
+    yield
+
+    try:
+        logger.info("Shutting down application...")
+        await view_counter.stop()
+        await close_models()
+        logger.info("Application shutdown completed successfully")
+        
+    except Exception as e:
+        logger.error(f"Shutdown failed: {e}", exc_info=True)
+        raise
+
+
 app = FastAPI(
     title="Capital Radio App System",
     description="Backend API for Captal Radio Application",
     version="1.0.0",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan,
     openapi_extra={
         "x-upload-size-limit": 5000 * 1024 * 1024,  # 5000 MB
     }
@@ -27,7 +59,6 @@ logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )   
-logger = logging.getLogger("uvicorn")
 
 # Add CORS middleware
 app.add_middleware(
@@ -60,25 +91,3 @@ async def detailed_recording_status():
 
 
 app.include_router(api_router, prefix="/api/v1")
-# Startup and shutdown events
-@app.on_event("startup")
-async def startup():
-    try:
-        logger.info("Initializing application...")
-        await init_models()
-        logger.info("Application startup completed successfully")
-      
-    except Exception as e:
-        logger.error(f"Startup failed: {e}", exc_info=True)
-        raise
-
-@app.on_event("shutdown")
-async def shutdown():
-    try:
-        logger.info("Shutting down application...")
-        await close_models()
-        logger.info("Application shutdown completed successfully")
-        
-    except Exception as e:
-        logger.error(f"Shutdown failed: {e}", exc_info=True)
-        raise
\ No newline at end of file
@@ -1,10 +1,60 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship, selectinload
 from app.models.BaseModel import Base
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict
+
+
+class AdvertStationOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: str
+    slug: Optional[str] = None
+    status: Optional[bool] = None
+
+
+class AdvertCreatorOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+
+
+class AdvertOut(BaseModel):
+    # Response shape for adverts; validating straight from the ORM object keeps serialization in pydantic-core
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    title: str
+    description: str
+    target_url: Optional[str] = None
+    button_title: Optional[str] = None
+    image_path: Optional[str] = None
+    image_url: Optional[str] = None
+    station_id: str
+    created_by: str
+    views_count: int = 0
+    clicks_count: int = 0
+    status: Optional[bool] = None
+    state: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    station: Optional[AdvertStationOut] = None
+    creator: Optional[AdvertCreatorOut] = None
+
+    @classmethod
+    def from_row(cls, row) -> "AdvertOut":
+        data = dict(row._mapping)
+        station = {key[len("station_"):]: data.pop(key) for key in ("station_name", "station_slug", "station_status")}
+        creator = {key[len("creator_"):]: data.pop(key) for key in ("creator_id", "creator_name", "creator_email")}
+        data["station"] = AdvertStationOut(id=data["station_id"], **station)
+        data["creator"] = AdvertCreatorOut(**creator) if creator["id"] else None
+        return cls.model_validate(data)
 
 
 class Advert(Base):
@@ -20,57 +70,20 @@ class Advert(Base):
     created_by = Column(String(36), ForeignKey('users.id'), nullable=False)
     
     # Engagement metrics
-    views_count = Column(String(36), default=0)
-    clicks_count = Column(String(36), default=0)
+    views_count = Column(Integer, default=0, server_default='0', nullable=False)
+    clicks_count = Column(Integer, default=0, server_default='0', nullable=False)
     
     # Relationships
-    station = relationship("Station", backref=backref("adverts", lazy="selectin"))
-    creator = relationship("User", backref=backref("created_adverts", lazy="selectin"))
+    station = relationship("Station", back_populates="adverts")
+    creator = relationship("User", back_populates="created_adverts")
 
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'target_url': self.target_url,
-            'button_title': self.button_title,
-            'image_path': self.image_path,
-            'image_url': self.image_url,
-            'station_id': self.station_id,
-            'created_by': self.created_by,
-            'views_count': self.views_count,
-            'clicks_count': self.clicks_count,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        return [selectinload(cls.station), selectinload(cls.creator)]
     
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['station', 'creator'])
-            data = await self.to_dict()
-            
-            # Add related entities data
-            if self.station:
-                data['station'] = {
-                    'id': self.station.id,
-                    'name': self.station.name,
-                    'slug': getattr(self.station, 'slug', None),
-                    'status': self.station.status
-                }
-            
-            if self.creator:
-                data['creator'] = {
-                    'id': self.creator.id,
-                    'name': self.creator.name,
-                    'email': self.creator.email
-                }
-                
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert advert to dictionary with relations: {str(e)}")
+        await self.refresh_relations(db, ['station', 'creator'])
+        return AdvertOut.model_validate(self).model_dump(mode="json")
     
     async def delete_with_relations(self, db: AsyncSession) -> bool:
         try:
@@ -78,27 +91,20 @@ class Advert(Base):
             await db.commit()
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete advert with relations: {str(e)}")
+            raise
     
     async def increment_views(self, db: AsyncSession) -> bool:
-        try:
-            self.views_count += 1
-            await db.commit()
-            return True
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Failed to increment views: {str(e)}")
+        # Buffered in memory and written in batches by the view counter flush
+        from app.utils.view_counter import view_counter
+        view_counter.increment(Advert, 'views_count', self.id)
+        return True
     
     async def increment_clicks(self, db: AsyncSession) -> bool:
-        try:
-            self.clicks_count += 1
-            await db.commit()
-            return True
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Failed to increment clicks: {str(e)}")
+        from app.utils.view_counter import view_counter
+        view_counter.increment(Advert, 'clicks_count', self.id)
+        return True
     
     @property
     def engagement_rate(self) -> float:
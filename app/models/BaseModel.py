@@ -1,14 +1,25 @@
-from sqlalchemy import Boolean, Column, String, DateTime, event, or_, and_
+from sqlalchemy import Boolean, Column, String, DateTime, or_, and_, inspect, select, delete, insert
 from sqlalchemy.ext.declarative import declared_attr, declarative_base
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import InvalidRequestError
+from app.utils.query_guard import STRICT_LOADING
+from app.utils.advanced_paginator import paginate_keyset
+from app.utils.returns_data import ORJSON_OPTIONS
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Type, TypeVar
 import uuid
-import json
+import orjson
+import warnings
 
 
 T = TypeVar('T', bound='BaseModelMixin')
 
+# Ids per DELETE ... IN (...) statement, keeps bulk deletes under the driver's parameter limits
+DELETE_CHUNK_SIZE = 10000
+# Rows per executemany batch in bulk_insert, bounds the size of each multi-row INSERT
+INSERT_CHUNK_SIZE = 1000
+
 def generate_uuid() -> str:
     return str(uuid.uuid4())
 
@@ -26,28 +37,99 @@ class BaseModelMixin:
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     @classmethod
-    def __declare_last__(cls):
-        @event.listens_for(cls, 'before_insert')
-        def receive_before_insert(mapper, connection, instance):
-            if instance.id is None:
-                instance.id = generate_uuid()
-
-    def to_dict(self, exclude: Optional[List[str]] = None) -> Dict[str, Any]:
-        if exclude is None:
-            exclude = []
-            
-        data = {}
-        for column in self.__table__.columns:
-            if column.name not in exclude:
-                value = getattr(self, column.name)
-                if isinstance(value, datetime):
-                    data[column.name] = value.isoformat()
-                else:
-                    data[column.name] = value
-        return data
-
-    def to_json(self, exclude: Optional[List[str]] = None) -> str:
-        return json.dumps(self.to_dict(exclude))
+    def _dict_fields(cls) -> tuple:
+        # Column names and the DateTime subset, computed once per class on first use
+        fields = cls.__dict__.get('_dict_field_cache')
+        if fields is None:
+            columns = cls.__table__.columns
+            fields = (
+                tuple(column.name for column in columns),
+                frozenset(column.name for column in columns if isinstance(column.type, DateTime))
+            )
+            cls._dict_field_cache = fields
+        return fields
+
+    def to_dict(self, exclude: Optional[List[str]] = None, serialize_datetime: bool = True) -> Dict[str, Any]:
+        names, datetime_names = self._dict_fields()
+        if not serialize_datetime:
+            datetime_names = ()
+        if exclude:
+            names = [name for name in names if name not in exclude]
+        return {
+            name: (value.isoformat() if value is not None and name in datetime_names else value)
+            for name in names
+            for value in (getattr(self, name),)
+        }
+
+    def to_json(self, exclude: Optional[List[str]] = None) -> bytes:
+        # Uses the model's own field selection; orjson encodes any datetimes it leaves unformatted
+        data = self.to_dict()
+        if exclude:
+            data = {key: value for key, value in data.items() if key not in exclude}
+        return orjson.dumps(data, option=ORJSON_OPTIONS)
+
+    async def refresh_relations(self, db: AsyncSession, relations: List[str]) -> None:
+        # Only hit the database for relationships that were not eager loaded
+        unloaded = [name for name in relations if name in inspect(self).unloaded]
+        if unloaded and STRICT_LOADING:
+            raise InvalidRequestError(f"{type(self).__name__}.{unloaded[0]} is not eager loaded (SQL_STRICT_LOADING is on)")
+        if unloaded:
+            # One targeted SELECT instead of refresh(): many-to-one relations are joined in, collections come
+            # from one IN query each, and the row's own column state is left alone
+            cls = type(self)
+            relationships = inspect(cls).relationships
+            options = [
+                selectinload(getattr(cls, name)) if relationships[name].uselist else joinedload(getattr(cls, name))
+                for name in unloaded
+            ]
+            await db.execute(select(cls).where(cls.id == self.id).options(*options))
+
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        # Loader options covering everything to_dict_with_relations reads; models override this
+        return []
+
+    @classmethod
+    def detail_options(cls) -> List[Any]:
+        # Single-row views; models with deferred columns add their undefer options here
+        return cls.serialization_options()
+
+    @classmethod
+    async def get_for_serialization(cls: Type[T], db: AsyncSession, id: str) -> Optional[T]:
+        result = await db.execute(select(cls).options(*cls.detail_options()).where(cls.id == id).execution_options(populate_existing=True))
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def delete_many(cls, db: AsyncSession, ids: List[str]) -> int:
+        # One DELETE per chunk and a single commit; child rows go through ON DELETE CASCADE
+        ids = list(dict.fromkeys(ids))
+        deleted = 0
+        try:
+            for start in range(0, len(ids), DELETE_CHUNK_SIZE):
+                result = await db.execute(
+                    delete(cls).where(cls.id.in_(ids[start:start + DELETE_CHUNK_SIZE])).execution_options(synchronize_session=False)
+                )
+                deleted += result.rowcount
+            await db.commit()
+            return deleted
+        except Exception:
+            await db.rollback()
+            raise
+
+    @classmethod
+    async def bulk_insert(cls, db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+        # executemany through Core, the MySQL dialect folds each chunk into multi-row INSERT ... VALUES;
+        # column defaults (ids, timestamps, state/status) are still filled in per row
+        if not rows:
+            return 0
+        try:
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                await db.execute(insert(cls), rows[start:start + INSERT_CHUNK_SIZE])
+            await db.commit()
+            return len(rows)
+        except Exception:
+            await db.rollback()
+            raise
 
     # CRUD Class Methods
     @classmethod
@@ -62,6 +144,38 @@ class BaseModelMixin:
     def get_by_id(cls: Type[T], db: Session, id: str) -> Optional[T]:
         return db.query(cls).filter(cls.id == id, cls.state == True).first()
 
+    @classmethod
+    def _filter_conditions(cls, filters: Optional[Dict[str, Any]] = None) -> List[Any]:
+        return [getattr(cls, key) == value for key, value in (filters or {}).items() if hasattr(cls, key)]
+
+    @classmethod
+    def _search_conditions(cls, search_term: str, fields: List[str]) -> List[Any]:
+        return [getattr(cls, field).ilike(f"%{search_term}%") for field in fields if hasattr(cls, field)]
+
+    @classmethod
+    async def get_page(
+        cls: Type[T],
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        # Keyset page over (created_at, id), so deep pages cost the same as the first; returns (items, next_cursor)
+        stmt = select(cls).where(cls.state == True, *cls._filter_conditions(filters))
+        return await paginate_keyset(db, stmt, [cls.created_at, cls.id], cursor=cursor, per_page=limit)
+
+    @classmethod
+    async def search_page(
+        cls: Type[T],
+        db: AsyncSession,
+        search_term: str,
+        fields: List[str],
+        cursor: Optional[str] = None,
+        limit: int = 50
+    ) -> tuple:
+        stmt = select(cls).where(cls.state == True, or_(*cls._search_conditions(search_term, fields)))
+        return await paginate_keyset(db, stmt, [cls.created_at, cls.id], cursor=cursor, per_page=limit)
+
     @classmethod
     def get_all(
         cls: Type[T], 
@@ -70,15 +184,12 @@ class BaseModelMixin:
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None
     ) -> List[T]:
+        warnings.warn(f"{cls.__name__}.get_all uses OFFSET pagination, use get_page instead", DeprecationWarning, stacklevel=2)
         query = db.query(cls).filter(cls.state == True)
         
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                if hasattr(cls, key):
-                    filter_conditions.append(getattr(cls, key) == value)
-            if filter_conditions:
-                query = query.filter(and_(*filter_conditions))
+        filter_conditions = cls._filter_conditions(filters)
+        if filter_conditions:
+            query = query.filter(and_(*filter_conditions))
                 
         return query.offset(skip).limit(limit).all()
 
@@ -91,15 +202,11 @@ class BaseModelMixin:
         skip: int = 0,
         limit: int = 100
     ) -> List[T]:
-
-        conditions = []
-        for field in fields:
-            if hasattr(cls, field):
-                conditions.append(getattr(cls, field).ilike(f"%{search_term}%"))
+        warnings.warn(f"{cls.__name__}.search uses OFFSET pagination, use search_page instead", DeprecationWarning, stacklevel=2)
         
         return db.query(cls)\
             .filter(cls.state == True)\
-            .filter(or_(*conditions))\
+            .filter(or_(*cls._search_conditions(search_term, fields)))\
             .offset(skip)\
             .limit(limit)\
             .all()
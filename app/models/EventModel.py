@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, Numeric
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, Numeric, Index
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc
 from app.models.BaseModel import Base
@@ -7,6 +7,15 @@ from typing import Optional, Dict, Any
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_state_start_date", 'state', 'start_date'),
+        Index("ix_events_published_state_status_start_date", 'is_published', 'state', 'status', 'start_date'),
+        Index("ix_events_published_featured_state_status_created_at", 'is_published', 'is_featured', 'state', 'status', 'created_at'),
+        Index("ix_events_state_status_created_at", 'state', 'status', 'created_at'),
+        Index("ix_events_event_type_state_status_created_at", 'event_type', 'state', 'status', 'created_at'),
+        Index("ix_events_category_state_status_created_at", 'category', 'state', 'status', 'created_at'),
+        Index("ix_events_fulltext", 'title', 'description', 'venue_name', 'venue_address', mysql_prefix='FULLTEXT'),
+    )
     
     # Basic event information
     title = Column(String(500), nullable=False)
@@ -46,48 +55,10 @@ class Event(Base):
     created_by = Column(String(36), ForeignKey('users.id'), nullable=True)
     updated_by = Column(String(36), ForeignKey('users.id'), nullable=True)
 
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'slug': self.slug,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'start_time': self.start_time,
-            'end_time': self.end_time,
-            'venue_name': self.venue_name,
-            'venue_address': self.venue_address,
-            'city': self.city,
-            'country': self.country,
-            'is_virtual': self.is_virtual,
-            'virtual_link': self.virtual_link,
-            'category': self.category,
-            'event_type': self.event_type,
-            'currency': self.currency,
-            'featured_image_path': self.featured_image_path,
-            'featured_image_url': self.featured_image_url,
-            'is_featured': self.is_featured,
-            'is_published': self.is_published,
-            'views_count': self.views_count,
-            'shares_count': self.shares_count,
-            'created_by': self.created_by,
-            'updated_by': self.updated_by,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-    
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self)
-            data = await self.to_dict()
-            
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert event to dictionary with relations: {str(e)}")
+        data = self.to_dict()
+        
+        return data
     
     async def delete_with_relations(self, db: AsyncSession) -> bool:
         try:
@@ -95,9 +66,9 @@ class Event(Base):
             await db.commit()
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete event with relations: {str(e)}")
+            raise
     
     @classmethod
     async def get_published_events(cls, db: AsyncSession, limit: int = 50):
@@ -142,9 +113,10 @@ class Event(Base):
         return result.scalars().all()
     
     async def increment_views(self, db: AsyncSession):
-        self.views_count = self.views_count + 1
-        await db.commit()
+        # Buffered in memory and written in batches by the view counter flush
+        from app.utils.view_counter import view_counter
+        view_counter.increment(Event, 'views_count', self.id)
     
     async def increment_shares(self, db: AsyncSession):
-        self.shares_count = self.shares_count + 1
-        await db.commit()
\ No newline at end of file
+        from app.utils.view_counter import view_counter
+        view_counter.increment(Event, 'shares_count', self.id)
\ No newline at end of file
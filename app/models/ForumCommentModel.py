@@ -1,121 +1,108 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import select, delete, or_
+from sqlalchemy.orm import relationship, selectinload
 from app.models.BaseModel import Base
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 class ForumComment(Base):
     __tablename__ = "forum_comments"
+    __table_args__ = (
+        Index("ix_forum_comments_forum_state_status_created_at", 'forum_id', 'state', 'status', 'created_at', 'id'),
+    )
     
     content = Column(Text, nullable=False)
-    forum_id = Column(String(36), ForeignKey('forums.id'), nullable=False)
-    reply_to = Column(String(36), ForeignKey('forum_comments.id'), nullable=True)
+    forum_id = Column(String(36), ForeignKey('forums.id', ondelete='CASCADE'), nullable=False)
+    reply_to = Column(String(36), ForeignKey('forum_comments.id', ondelete='CASCADE'), nullable=True)
     created_by = Column(String(36), ForeignKey('users.id'), nullable=False)
     
     # Relationships
-    forum = relationship("Forum", back_populates="comments", lazy="selectin")
-    creator = relationship("User", backref=backref("forum_comments", lazy="selectin"))
+    forum = relationship("Forum", back_populates="comments")
+    creator = relationship("User", back_populates="forum_comments")
     
     # Self-referencing relationship - fixed
-    reply_to_comment = relationship("ForumComment", remote_side="ForumComment.id", back_populates="replies", lazy="selectin")
-    replies = relationship("ForumComment", back_populates="reply_to_comment", lazy="selectin")
+    reply_to_comment = relationship("ForumComment", remote_side="ForumComment.id", back_populates="replies")
+    replies = relationship("ForumComment", back_populates="reply_to_comment", passive_deletes=True)
 
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'content': self.content,
-            'forum_id': self.forum_id,
-            'reply_to': self.reply_to,
-            'created_by': self.created_by,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        return [
+            selectinload(cls.forum),
+            selectinload(cls.creator),
+            selectinload(cls.reply_to_comment),
+            selectinload(cls.replies).selectinload(cls.creator)
+        ]
     
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['forum', 'creator', 'reply_to_comment', 'replies'])
-            data = await self.to_dict()
+        await self.refresh_relations(db, ['forum', 'creator', 'reply_to_comment', 'replies'])
+        data = self.to_dict()
+        
+        if self.forum:
+            data['forum'] = {
+                'id': self.forum.id,
+                'title': self.forum.title,
+                'status': self.forum.status,
+                'state': self.forum.state,
+                'created_at': self.forum.created_at.isoformat() if self.forum.created_at else None,
+                'updated_at': self.forum.updated_at.isoformat() if self.forum.updated_at else None
+            }
+        
+        if self.creator:
+            data['creator'] = {
+                'id': self.creator.id,
+                'name': self.creator.name,
+                'email': self.creator.email,
+                'image_url': self.creator.image_url
+            }
             
-            if self.forum:
-                data['forum'] = {
-                    'id': self.forum.id,
-                    'title': self.forum.title,
-                    'status': self.forum.status,
-                    'state': self.forum.state,
-                    'created_at': self.forum.created_at.isoformat() if self.forum.created_at else None,
-                    'updated_at': self.forum.updated_at.isoformat() if self.forum.updated_at else None
-                }
+        if self.reply_to_comment:
+            data['reply_to_comment'] = {
+                'id': self.reply_to_comment.id,
+                'content': self.reply_to_comment.content,
+                'forum_id': self.reply_to_comment.forum_id,
+                'reply_to': self.reply_to_comment.reply_to,
+                'created_by': self.reply_to_comment.created_by,
+                'status': self.reply_to_comment.status,
+                'state': self.reply_to_comment.state,
+                'created_at': self.reply_to_comment.created_at.isoformat() if self.reply_to_comment.created_at else None,
+                'updated_at': self.reply_to_comment.updated_at.isoformat() if self.reply_to_comment.updated_at else None
+            }
             
-            if self.creator:
-                data['creator'] = {
-                    'id': self.creator.id,
-                    'name': self.creator.name,
-                    'email': self.creator.email,
-                    'image_url': self.creator.image_url
-                }
-                
-            if self.reply_to_comment:
-                data['reply_to_comment'] = {
-                    'id': self.reply_to_comment.id,
-                    'content': self.reply_to_comment.content,
-                    'forum_id': self.reply_to_comment.forum_id,
-                    'reply_to': self.reply_to_comment.reply_to,
-                    'created_by': self.reply_to_comment.created_by,
-                    'status': self.reply_to_comment.status,
-                    'state': self.reply_to_comment.state,
-                    'created_at': self.reply_to_comment.created_at.isoformat() if self.reply_to_comment.created_at else None,
-                    'updated_at': self.reply_to_comment.updated_at.isoformat() if self.reply_to_comment.updated_at else None
+        if self.replies:
+            data['replies'] = []
+            for reply in self.replies:
+                await reply.refresh_relations(db, ['creator'])
+                reply_data = {
+                    'id': reply.id,
+                    'content': reply.content,
+                    'forum_id': reply.forum_id,
+                    'reply_to': reply.reply_to,
+                    'created_by': reply.created_by,
+                    'status': reply.status,
+                    'state': reply.state,
+                    'created_at': reply.created_at.isoformat() if reply.created_at else None,
+                    'updated_at': reply.updated_at.isoformat() if reply.updated_at else None
                 }
                 
-            if self.replies:
-                data['replies'] = []
-                for reply in self.replies:
-                    await db.refresh(reply, ['creator'])
-                    reply_data = {
-                        'id': reply.id,
-                        'content': reply.content,
-                        'forum_id': reply.forum_id,
-                        'reply_to': reply.reply_to,
-                        'created_by': reply.created_by,
-                        'status': reply.status,
-                        'state': reply.state,
-                        'created_at': reply.created_at.isoformat() if reply.created_at else None,
-                        'updated_at': reply.updated_at.isoformat() if reply.updated_at else None
+                if reply.creator:
+                    reply_data['creator'] = {
+                        'id': reply.creator.id,
+                        'name': reply.creator.name,
+                        'email': reply.creator.email,
+                        'image_url': reply.creator.image_url
                     }
-                    
-                    if reply.creator:
-                        reply_data['creator'] = {
-                            'id': reply.creator.id,
-                            'name': reply.creator.name,
-                            'email': reply.creator.email,
-                            'image_url': reply.creator.image_url
-                        }
-                    
-                    data['replies'].append(reply_data)
                 
-                data['replies_count'] = len(self.replies)
-            else:
-                data['replies_count'] = 0
-                
-            return data
+                data['replies'].append(reply_data)
+            
+            data['replies_count'] = len(self.replies)
+        else:
+            data['replies_count'] = 0
             
-        except Exception as e:
-            raise Exception(f"Failed to convert forum comment to dictionary with relations: {str(e)}")
+        return data
     
     async def delete_with_relations(self, db: AsyncSession) -> bool:
-        try:
-            await db.refresh(self, ['replies'])
-            if self.replies:
-                for reply in self.replies:
-                    await db.execute(delete(ForumComment).where(ForumComment.id == reply.id))
-            await db.execute(delete(ForumComment).where(ForumComment.id == self.id))
-            await db.commit()
-            return True
-            
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Failed to delete forum comment with relations: {str(e)}")
\ No newline at end of file
+        # Replies go with their parent, ON DELETE CASCADE covers deeper threads
+        # Runs in the caller's transaction; the caller commits, so bulk deletes can share one commit
+        result = await db.execute(delete(ForumComment).where(or_(ForumComment.id == self.id, ForumComment.reply_to == self.id)))
+        return result.rowcount > 0
\ No newline at end of file
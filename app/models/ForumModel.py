@@ -1,93 +1,86 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import select, delete, func, inspect
+from sqlalchemy.orm import relationship, column_property, selectinload, deferred, undefer_group
 from app.models.BaseModel import Base
+from app.models.ForumViewModel import ForumView
+from app.models.ForumCommentModel import ForumComment
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+import uuid
+
+def generate_forum_slug() -> str:
+    return f"forum_{uuid.uuid4().hex}"
 
 class Forum(Base):
     __tablename__ = "forums"
+    __table_args__ = (
+        Index("ix_forums_station_state_status_created_at", 'station_id', 'state', 'status', 'created_at', 'id'),
+        Index("ix_forums_published_state_status_created_at", 'is_published', 'state', 'status', 'created_at'),
+        Index("ix_forums_fulltext", 'title', 'body', mysql_prefix='FULLTEXT'),
+    )
     
     title = Column(String(255), nullable=False)
     body = Column(Text, nullable=False)
     station_id = Column(String(36), ForeignKey('stations.id'), nullable=False)
     created_by = Column(String(36), ForeignKey('users.id'), nullable=False)
-    slug = Column(String(500), nullable=False, unique=True, default=func.lower(func.concat('forum_', func.md5(func.concat('forum_', func.now())))))
+    slug = Column(String(255), nullable=False, unique=True, default=generate_forum_slug)
     is_pinned = Column(Boolean, default=False)
     is_published = Column(Boolean, default=False)
-    views = Column(JSON, default={})
+    # Legacy per-forum viewer blob, superseded by forum_views; deferred so forum SELECTs skip it
+    views = deferred(Column(JSON, default={}))
     # Relationships
-    station = relationship("Station", backref=backref("forums", lazy="selectin"))
-    creator = relationship("User", backref=backref("created_forums", lazy="selectin"))
-    comments = relationship("ForumComment", back_populates="forum", lazy="selectin", cascade="all, delete-orphan")
+    station = relationship("Station", back_populates="forums")
+    creator = relationship("User", back_populates="created_forums")
+    comments = relationship("ForumComment", back_populates="forum", cascade="all, delete-orphan", passive_deletes=True)
 
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'body': self.body,
-            'slug': self.slug,
-            'is_pinned': self.is_pinned,
-            'is_published': self.is_published,
-            'station_id': self.station_id,
-            'created_by': self.created_by,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self) -> Dict[str, Any]:
+        return super().to_dict(exclude=['views'])
+    
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        return [selectinload(cls.station), selectinload(cls.creator), undefer_group('counts')]
     
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['station', 'creator', 'comments'])
-            data = await self.to_dict()
-            
-            # Add related entities data
-            if self.station:
-                data['station'] = await self.station.to_dict()
-            
-            if self.creator:
-                data['creator'] = {
-                    'id': self.creator.id,
-                    'name': self.creator.name,
-                    'email': self.creator.email,
-                    'image_url': self.creator.image_url
-                }
-            
-            # Add comments count (only active comments)
-            if self.comments:
-                active_comments = [c for c in self.comments if c.state == True]
-                data['comments_count'] = len(active_comments)
-            else:
-                data['comments_count'] = 0
+        await self.refresh_relations(db, ['station', 'creator'])
+        # The counts come with serialization_options(); forums loaded without them fetch both in one SELECT
+        unloaded_counts = [name for name in ('comments_count', 'views_count') if name in inspect(self).unloaded]
+        if unloaded_counts:
+            await db.refresh(self, unloaded_counts)
+        data = self.to_dict()
+        
+        # Add related entities data
+        if self.station:
+            data['station'] = self.station.to_dict()
+        
+        if self.creator:
+            data['creator'] = {
+                'id': self.creator.id,
+                'name': self.creator.name,
+                'email': self.creator.email,
+                'image_url': self.creator.image_url
+            }
+        
+        # Active comments are counted in SQL, the collection itself is never loaded here
+        data['comments_count'] = self.comments_count or 0
 
-            if self.views:
-                data['views_count'] = len(self.views)
-            else:
-                data['views_count'] = 0    
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert forum to dictionary with relations: {str(e)}")
+        data['views_count'] = self.views_count or 0
+        return data
     
     async def delete_with_relations(self, db: AsyncSession) -> bool:
-        try:
-            await db.refresh(self, ['comments'])
-            
-            if self.comments:
-                from app.models.ForumCommentModel import ForumComment
-                for comment in self.comments:
-                    comment_query = select(ForumComment).where(ForumComment.id == comment.id)
-                    comm = await db.execute(comment_query)
-                    comment_obj = comm.scalar_one_or_none()
-                    if comment_obj:
-                        await comment_obj.delete_with_relations(db)
-            
-            await db.execute(delete(Forum).where(Forum.id == self.id))
-            await db.commit()
-            return True
-            
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Failed to delete forum with relations: {str(e)}")
+        # Comments and views are removed by ON DELETE CASCADE on their forum_id keys
+        # Runs in the caller's transaction; the caller commits, so bulk deletes can share one commit
+        result = await db.execute(delete(Forum).where(Forum.id == self.id))
+        return result.rowcount > 0
+
+
+# Correlated COUNT subqueries, deferred so only serializing queries (undefer_group('counts')) pay for them
+Forum.views_count = column_property(
+    select(func.count(ForumView.id)).where(ForumView.forum_id == Forum.id).correlate_except(ForumView).scalar_subquery(),
+    deferred=True, group='counts'
+)
+
+Forum.comments_count = column_property(
+    select(func.count(ForumComment.id)).where(ForumComment.forum_id == Forum.id, ForumComment.state == True).correlate_except(ForumComment).scalar_subquery(),
+    deferred=True, group='counts'
+)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete
+from app.models.BaseModel import Base
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+class ForumView(Base):
+    __tablename__ = "forum_views"
+    __table_args__ = (
+        UniqueConstraint('forum_id', 'user_id', name='uq_forum_views_forum_user'),
+    )
+    
+    forum_id = Column(String(36), ForeignKey('forums.id', ondelete='CASCADE'), nullable=False)
+    user_id = Column(String(36), ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    viewed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'forum_id': self.forum_id,
+            'user_id': self.user_id,
+            'viewed_at': self.viewed_at.isoformat() if self.viewed_at else None,
+            'status': self.status,
+            'state': self.state,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
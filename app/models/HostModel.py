@@ -1,12 +1,25 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer, Index
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, delete
+from sqlalchemy.orm import relationship
 from app.models.BaseModel import Base
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from operator import attrgetter
+
+_HOST_FIELDS = (
+    'id', 'name', 'slug', 'email', 'role', 'phone', 'bio', 'social_media', 'experience_years',
+    'on_air_status', 'image_url', 'image_path', 'user_id', 'created_by', 'status', 'state',
+    'created_at', 'updated_at',
+)
+_host_values = attrgetter(*_HOST_FIELDS)
 
 class Host(Base):
     __tablename__ = "hosts"
+    __table_args__ = (
+        Index("ix_hosts_state_status_created_at", 'state', 'status', 'created_at'),
+        Index("ix_hosts_state_status_name", 'state', 'status', 'name'),
+    )
     
     user_id = Column(String(36), ForeignKey('users.id'), nullable=True)
     # Basic Information
@@ -26,83 +39,65 @@ class Host(Base):
     
     # Meta Information
     created_by = Column(String(36), ForeignKey('users.id'), nullable=True)
+    # Inverse of RadioSessionRecording.session_hosts, never serialized from a host
+    recordings = relationship("RadioSessionRecording", secondary="recording_hosts", back_populates="session_hosts", lazy="raise")
     
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'slug': self.slug,
-            'email': self.email,
-            'role': self.role,
-            'phone': self.phone,
-            'bio': self.bio,
-            'social_media': self.social_media,
-            'experience_years': self.experience_years,
-            'on_air_status': self.on_air_status,
-            'image_url': self.image_url,
-            'image_path': self.image_path,
-            'user_id': self.user_id,
-            'created_by': self.created_by,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_HOST_FIELDS, _host_values(self)))
     
-    async def to_dict_with_relations(self, db: AsyncSession, include_programs: bool = False) -> Dict[str, Any]:
-        try:
-            await db.refresh(self)
-            data = await self.to_dict()
+    async def to_dict_with_relations(self, db: AsyncSession, include_programs: bool = False, programs: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        data = self.to_dict()
 
-            if include_programs:
+        if include_programs:
+            if programs is None:
                 programs = await self.get_host_programs(db)
-                if programs:
-                    data['programs'] = programs
-                else:
-                    data['programs'] = []
+            if programs:
+                data['programs'] = programs
+            else:
+                data['programs'] = []
         
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert station to dictionary with relations: {str(e)}")
+        return data
 
 
+    def program_snapshot(self) -> Dict[str, Any]:
+        # Copy stored in RadioProgram.hosts; JSON columns need the timestamps as strings
+        data = self.to_dict()
+        data['created_at'] = self.created_at.isoformat() if self.created_at else None
+        data['updated_at'] = self.updated_at.isoformat() if self.updated_at else None
+        return data
+
+    async def sync_program_snapshots(self, db: AsyncSession, remove: bool = False) -> None:
+        # Programs keep a copy of Host.to_dict in their hosts JSON, rewrite those copies when the host changes
+        from app.models.RadioProgramModel import RadioProgram
+        result = await db.execute(select(RadioProgram).where(RadioProgram.has_host(self.id)))
+        snapshot = self.program_snapshot()
+        for program in result.scalars().all():
+            hosts = [host for host in (program.hosts or []) if not (remove and isinstance(host, dict) and host.get('id') == self.id)]
+            program.hosts = [snapshot if isinstance(host, dict) and host.get('id') == self.id else host for host in hosts]
+
     async def delete_with_relations(self, db: AsyncSession) -> bool:
         try:
+            await self.sync_program_snapshots(db, remove=True)
             await db.execute(delete(Host).where(Host.id == self.id))
             await db.commit()
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete station with relations: {str(e)}")
+            raise
 
 
     async def get_host_programs(self, db: AsyncSession) -> List[Dict[str, Any]]:
-        try:
-            from app.models.RadioProgramModel import RadioProgram
-            
-            # Get all programs and filter in Python since hosts is JSON
-            stmt = select(RadioProgram).where(
-                and_(
-                    RadioProgram.state == True,
-                    RadioProgram.status == True,
-                    RadioProgram.hosts.isnot(None)
-                )
+        from app.models.RadioProgramModel import RadioProgram
+        
+        # Only the programs listing this host come back from MySQL
+        stmt = select(RadioProgram).where(
+            and_(
+                RadioProgram.state == True,
+                RadioProgram.status == True,
+                RadioProgram.has_host(self.id)
             )
-            result = await db.execute(stmt)
-            all_programs = result.scalars().all()
-            
-            # Filter programs that contain this host
-            host_programs = []
-            for program in all_programs:
-                if program.hosts:
-                    for host in program.hosts:
-                        if isinstance(host, dict) and host.get('id') == self.id:
-                            host_programs.append(program)
-                            break
-            
-            return [await program.to_dict() for program in host_programs]
-            
-        except Exception as e:
-            raise Exception(f"Failed to get host programs: {str(e)}")
\ No newline at end of file
+        )
+        result = await db.execute(stmt)
+        
+        return [program.to_dict() for program in result.scalars().all()]
\ No newline at end of file
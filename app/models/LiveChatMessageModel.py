@@ -1,56 +1,95 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, Index
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from sqlalchemy.orm import relationship
+from sqlalchemy import select, delete, and_, asc
+from sqlalchemy.orm import relationship, selectinload
 from app.models.BaseModel import Base
+from app.models.UserModel import User
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from operator import attrgetter
+
+_LIVECHAT_MESSAGE_FIELDS = (
+    'id', 'station_id', 'user_id', 'message', 'message_type', 'is_visible', 'state', 'status',
+    'created_at', 'updated_at',
+)
+_livechat_message_values = attrgetter(*_LIVECHAT_MESSAGE_FIELDS)
+
+# What a chat message shows of its sender; User.to_dict also carries tokens and verification codes
+_SENDER_FIELDS = ('id', 'name', 'slug', 'image_url', 'role')
+
+def _sender_dict(source: Any, prefix: str = '') -> Dict[str, Any]:
+    # source is a User, or a projection row whose sender columns are labelled with prefix
+    return {field: getattr(source, prefix + field) for field in _SENDER_FIELDS}
 
 class LiveChatMessage(Base):
     __tablename__ = "livechat_messages"
-    station_id = Column(String(36), ForeignKey('stations.id'), nullable=False, index=True)
-    user_id = Column(String(36), ForeignKey('users.id'), nullable=True)
+    __table_args__ = (
+        Index("ix_livechat_messages_station_visible_state_status_created_at", 'station_id', 'is_visible', 'state', 'status', 'created_at'),
+    )
+    
+    station_id = Column(String(36), ForeignKey('stations.id', ondelete='CASCADE'), nullable=False, index=True)
+    user_id = Column(String(36), ForeignKey('users.id'), nullable=True, index=True)
     message = Column(Text, nullable=False)
     message_type = Column(String(20), default='user')  # user, system, moderator
     is_visible = Column(Boolean, default=True)
     
     # Relationships
-    user = relationship("User", foreign_keys=[user_id])
-    station = relationship("Station", foreign_keys=[station_id])
+    user = relationship("User", back_populates="chat_messages")
+    station = relationship("Station", back_populates="chat_messages")
     
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'station_id': self.station_id,
-            'user_id': self.user_id,
-            'message': self.message,
-            'message_type': self.message_type,
-            'is_visible': self.is_visible,
-            'state': self.state,
-            'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_LIVECHAT_MESSAGE_FIELDS, _livechat_message_values(self)))
+
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        # Only the sender is serialized, the station is already known to every caller
+        return [selectinload(cls.user)]
+
+    @classmethod
+    async def list_for_station(cls, db: AsyncSession, station_id: str, limit: int = 200, offset: int = 0) -> List[Dict[str, Any]]:
+        # Column projection with the sender joined in, rows become dicts without hydrating ORM objects
+        stmt = (
+            select(
+                cls.id, cls.station_id, cls.user_id, cls.message, cls.message_type, cls.is_visible,
+                cls.state, cls.status, cls.created_at, cls.updated_at,
+                *(getattr(User, field).label(f"sender_{field}") for field in _SENDER_FIELDS)
+            )
+            .outerjoin(User, cls.user_id == User.id)
+            .where(and_(cls.station_id == station_id, cls.is_visible == True, cls.state == True, cls.status == True))
+            .order_by(asc(cls.created_at))
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await db.execute(stmt)
+        messages = []
+        for row in result:
+            data = {
+                'id': row.id,
+                'station_id': row.station_id,
+                'user_id': row.user_id,
+                'message': row.message,
+                'message_type': row.message_type,
+                'is_visible': row.is_visible,
+                'state': row.state,
+                'status': row.status,
+                'created_at': row.created_at,
+                'updated_at': row.updated_at
+            }
+            if row.sender_id:
+                data['user'] = _sender_dict(row, 'sender_')
+            messages.append(data)
+        return messages
 
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self,['user','station'])
-            data = await self.to_dict()
+        await self.refresh_relations(db, ['user'])
+        data = self.to_dict()
 
-            if self.user:
-                data['user'] = await self.user.to_dict()
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert livechat message to dictionary with relations: {str(e)}")
+        if self.user:
+            data['user'] = _sender_dict(self.user)
+        return data
 
 
     async def delete_with_relations(self, db: AsyncSession) -> bool:
-        try:
-            await db.execute(delete(LiveChatMessage).where(LiveChatMessage.id == self.id))
-            await db.commit()
-            return True
-            
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Failed to delete livechat message with relations: {str(e)}")
\ No newline at end of file
+        # Runs in the caller's transaction; the caller commits, so bulk deletes can share one commit
+        result = await db.execute(delete(LiveChatMessage).where(LiveChatMessage.id == self.id))
+        return result.rowcount > 0
\ No newline at end of file
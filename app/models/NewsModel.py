@@ -1,18 +1,47 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, DECIMAL
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, DECIMAL, Index
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc, event, inspect
+from sqlalchemy.orm import relationship, selectinload, aliased, deferred, undefer_group
 from app.models.BaseModel import Base
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from operator import attrgetter
+from cachetools import TTLCache
+
+# The category set is small and read by every article, so each process keeps all of it keyed by id
+NEWS_CATEGORY_CACHE_TTL = 300
+_news_category_cache = TTLCache(maxsize=1, ttl=NEWS_CATEGORY_CACHE_TTL)
+
+_NEWS_FIELDS = (
+    'id', 'title', 'slug', 'excerpt', 'featured_image_path',
+    'featured_image_url', 'gallery_images', 'meta_title', 'meta_description', 'meta_keywords',
+    'published_at', 'is_published', 'is_featured', 'is_breaking', 'category_id', 'station_id',
+    'author_id', 'views_count', 'likes_count', 'shares_count', 'comments_count', 'tags',
+    'reading_time', 'source', 'source_url', 'priority', 'status', 'state', 'created_at',
+    'updated_at',
+)
+_news_values = attrgetter(*_NEWS_FIELDS)
+# Article body columns, deferred so list queries leave them out
+_NEWS_BODY_FIELDS = ('summary', 'content')
 
 class News(Base):
     __tablename__ = "news"
+    __table_args__ = (
+        Index("ix_news_state_published_created_at", 'state', 'is_published', 'created_at'),
+        Index("ix_news_state_published_views_count", 'state', 'is_published', 'views_count'),
+        Index("ix_news_station_state_published_created_at", 'station_id', 'state', 'is_published', 'created_at', 'id'),
+        Index("ix_news_state_published_published_at", 'state', 'is_published', 'published_at'),
+        Index("ix_news_station_state_published_published_at", 'station_id', 'state', 'is_published', 'published_at'),
+        Index("ix_news_station_category_state_published_created_at", 'station_id', 'category_id', 'state', 'is_published', 'created_at', 'id'),
+        Index("ix_news_station_featured_state_published_created_at", 'station_id', 'is_featured', 'state', 'is_published', 'created_at', 'id'),
+        Index("ix_news_station_breaking_state_created_at", 'station_id', 'is_breaking', 'state', 'created_at'),
+        Index("ix_news_fulltext", 'title', 'content', 'summary', mysql_prefix='FULLTEXT'),
+    )
     
     title = Column(String(500), nullable=False)
     slug = Column(String(500), nullable=False, unique=True, index=True)
-    summary = Column(Text, nullable=True)
-    content = Column(Text, nullable=False)
+    summary = deferred(Column(Text, nullable=True), group='body')
+    content = deferred(Column(Text, nullable=False), group='body')
     excerpt = Column(String(500), nullable=True)
     
     # Media
@@ -50,76 +79,110 @@ class News(Base):
     priority = Column(Integer, default=0)  # For ordering
     
     # Relationships
-    category = relationship("NewsCategory", backref=backref("news_articles", lazy="selectin"))
-    station = relationship("Station", backref=backref("news_articles", lazy="selectin"))
-    author = relationship("User", backref=backref("authored_news", lazy="selectin"))
-    
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'slug': self.slug,
-            'summary': self.summary,
-            'content': self.content,
-            'excerpt': self.excerpt,
-            'featured_image_path': self.featured_image_path,
-            'featured_image_url': self.featured_image_url,
-            'gallery_images': self.gallery_images,
-            'meta_title': self.meta_title,
-            'meta_description': self.meta_description,
-            'meta_keywords': self.meta_keywords,
-            'published_at': self.published_at.isoformat() if self.published_at else None,
-            'is_published': self.is_published,
-            'is_featured': self.is_featured,
-            'is_breaking': self.is_breaking,
-            'category_id': self.category_id,
-            'station_id': self.station_id,
-            'author_id': self.author_id,
-            'views_count': self.views_count,
-            'likes_count': self.likes_count,
-            'shares_count': self.shares_count,
-            'comments_count': self.comments_count,
-            'tags': self.tags,
-            'reading_time': self.reading_time,
-            'source': self.source,
-            'source_url': self.source_url,
-            'priority': self.priority,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    category = relationship("NewsCategory", back_populates="news_articles")
+    station = relationship("Station", back_populates="news_articles")
+    author = relationship("User", back_populates="authored_news")
+    comments = relationship("NewsComment", back_populates="news", lazy="raise", passive_deletes=True)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = dict(zip(_NEWS_FIELDS, _news_values(self)))
+        # The body is only serialized where it was loaded (detail views), lists stay narrow
+        unloaded = inspect(self).unloaded
+        for name in _NEWS_BODY_FIELDS:
+            if name not in unloaded:
+                data[name] = getattr(self, name)
+        return data
+    
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        # The category comes from the in-process category cache
+        return [selectinload(cls.station), selectinload(cls.author)]
+    
+    @classmethod
+    def detail_options(cls) -> List[Any]:
+        return [*cls.serialization_options(), undefer_group('body')]
+    
+    @classmethod
+    def list_columns(cls) -> List[Any]:
+        # Column projection for list endpoints: rows come back as plain tuples, no ORM instances are hydrated
+        return [cls.__table__.c[name] for name in _NEWS_FIELDS]
+    
+    @classmethod
+    async def rows_to_dicts(cls, db: AsyncSession, rows) -> List[Dict[str, Any]]:
+        # Same shape as to_dict_with_relations for list_columns() rows; stations and authors are one IN query each
+        station_cls = cls.station.property.mapper.class_
+        author_cls = cls.author.property.mapper.class_
+        station_ids = {row.station_id for row in rows if row.station_id}
+        author_ids = {row.author_id for row in rows if row.author_id}
+        stations = {}
+        if station_ids:
+            result = await db.execute(select(station_cls).where(station_cls.id.in_(station_ids)))
+            stations = {station.id: station.to_dict() for station in result.scalars()}
+        authors = {}
+        if author_ids:
+            result = await db.execute(select(author_cls).where(author_cls.id.in_(author_ids)))
+            authors = {author.id: author.to_dict() for author in result.scalars()}
+        categories = await NewsCategory.get_cached_by_id(db)
+        
+        data = []
+        for row in rows:
+            item = dict(row._mapping)
+            category = categories.get(row.category_id) if row.category_id else None
+            if category:
+                item['category'] = dict(category)
+            if row.station_id in stations:
+                item['station'] = stations[row.station_id]
+            if row.author_id in authors:
+                item['author'] = authors[row.author_id]
+            data.append(item)
+        return data
+    
+    COUNTER_FIELDS = ('views_count', 'likes_count', 'shares_count', 'comments_count')
+    
+    @classmethod
+    async def increment_counter(cls, db: AsyncSession, news_id: str, field: str, delta: int = 1) -> int:
+        # Single UPDATE computed in SQL, so concurrent increments are not lost and no row is loaded
+        if field not in cls.COUNTER_FIELDS:
+            raise ValueError(f"Unknown news counter: {field}")
+        column = cls.__table__.c[field]
+        result = await db.execute(
+            update(cls)
+            .where(and_(cls.id == news_id, cls.state == True))
+            .values({field: func.coalesce(column, 0) + delta})
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
     
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['category', 'station', 'author'])
-            data = await self.to_dict()
-            
-            if self.category:
-                data['category'] = await self.category.to_dict()
-            if self.station:
-                data['station'] = await self.station.to_dict()
-            if self.author:
-                data['author'] = await self.author.to_dict()
-                
-            return data
+        await self.refresh_relations(db, ['station', 'author'])
+        data = self.to_dict()
+        
+        category = (await NewsCategory.get_cached_by_id(db)).get(self.category_id) if self.category_id else None
+        if category:
+            data['category'] = dict(category)
+        if self.station:
+            data['station'] = self.station.to_dict()
+        if self.author:
+            data['author'] = self.author.to_dict()
             
-        except Exception as e:
-            raise Exception(f"Failed to convert news to dictionary with relations: {str(e)}")
+        return data
 
 
     async def delete_with_relations(self, db: AsyncSession) -> bool:
-        try:
-            await db.delete(self)
-            await db.commit()
-            return True
-        except Exception as e:
-            await db.rollback()
-            raise Exception(f"Failed to delete livechat message with relations: {str(e)}")
+        # Comments and their replies are removed by ON DELETE CASCADE on news_id and parent_id
+        # Runs in the caller's transaction; the caller commits, so bulk deletes can share one commit
+        result = await db.execute(delete(News).where(News.id == self.id))
+        return result.rowcount > 0
 
 
     
 
+_NEWS_CATEGORY_FIELDS = (
+    'id', 'name', 'slug', 'description', 'color', 'icon', 'parent_id', 'sort_order', 'status',
+    'state', 'created_at', 'updated_at',
+)
+_news_category_values = attrgetter(*_NEWS_CATEGORY_FIELDS)
+
 class NewsCategory(Base):
     __tablename__ = "news_categories"
     
@@ -132,30 +195,45 @@ class NewsCategory(Base):
     sort_order = Column(Integer, default=0)
     
     # Relationships
-    parent = relationship("NewsCategory", remote_side="NewsCategory.id", backref="children")
-    
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'slug': self.slug,
-            'description': self.description,
-            'color': self.color,
-            'icon': self.icon,
-            'parent_id': self.parent_id,
-            'sort_order': self.sort_order,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+    parent = relationship("NewsCategory", remote_side="NewsCategory.id", back_populates="children")
+    children = relationship("NewsCategory", back_populates="parent", lazy="raise")
+    news_articles = relationship("News", back_populates="category", lazy="raise")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_NEWS_CATEGORY_FIELDS, _news_category_values(self)))
+
+    @classmethod
+    async def get_cached_by_id(cls, db: AsyncSession) -> Dict[str, Dict[str, Any]]:
+        categories = _news_category_cache.get('all')
+        if categories is None:
+            result = await db.execute(select(cls))
+            categories = {category.id: category.to_dict() for category in result.scalars().all()}
+            _news_category_cache['all'] = categories
+        return categories
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        _news_category_cache.clear()
+
+
+@event.listens_for(NewsCategory, 'after_insert')
+@event.listens_for(NewsCategory, 'after_update')
+@event.listens_for(NewsCategory, 'after_delete')
+def _invalidate_news_category_cache(mapper, connection, target) -> None:
+    NewsCategory.invalidate_cache()
+
+_NEWS_COMMENT_FIELDS = (
+    'id', 'news_id', 'user_id', 'parent_id', 'author_name', 'author_email', 'content',
+    'is_approved', 'likes_count', 'status', 'state', 'created_at', 'updated_at',
+)
+_news_comment_values = attrgetter(*_NEWS_COMMENT_FIELDS)
 
 class NewsComment(Base):
     __tablename__ = "news_comments"
     
-    news_id = Column(String(36), ForeignKey('news.id'), nullable=False)
+    news_id = Column(String(36), ForeignKey('news.id', ondelete='CASCADE'), nullable=False, index=True)
     user_id = Column(String(36), ForeignKey('users.id'), nullable=True)
-    parent_id = Column(String(36), ForeignKey('news_comments.id'), nullable=True)
+    parent_id = Column(String(36), ForeignKey('news_comments.id', ondelete='CASCADE'), nullable=True, index=True)
     
     author_name = Column(String(255), nullable=True)
     author_email = Column(String(255), nullable=True)
@@ -164,23 +242,29 @@ class NewsComment(Base):
     likes_count = Column(Integer, default=0)
     
     # Relationships
-    news = relationship("News", backref=backref("comments", lazy="selectin"))
-    user = relationship("User", backref=backref("news_comments", lazy="selectin"))
-    parent = relationship("NewsComment", remote_side="NewsComment.id", backref="replies")
-    
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'news_id': self.news_id,
-            'user_id': self.user_id,
-            'parent_id': self.parent_id,
-            'author_name': self.author_name,
-            'author_email': self.author_email,
-            'content': self.content,
-            'is_approved': self.is_approved,
-            'likes_count': self.likes_count,
-            'status': self.status,
-            'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+    news = relationship("News", back_populates="comments")
+    user = relationship("User", back_populates="news_comments")
+    parent = relationship("NewsComment", remote_side="NewsComment.id", back_populates="replies")
+    replies = relationship("NewsComment", back_populates="parent", lazy="raise", passive_deletes=True)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_NEWS_COMMENT_FIELDS, _news_comment_values(self)))
+
+    @classmethod
+    async def tree_for_news(cls, db: AsyncSession, news_id: str) -> List[Dict[str, Any]]:
+        # Whole thread in one WITH RECURSIVE query; hidden or unapproved comments drop their subtree too
+        visible = and_(cls.state == True, cls.is_approved == True)
+        thread = select(cls.id).where(and_(cls.news_id == news_id, cls.parent_id.is_(None), visible)).cte("thread", recursive=True)
+        reply = aliased(cls)
+        thread = thread.union_all(
+            select(reply.id).join(thread, reply.parent_id == thread.c.id).where(and_(reply.state == True, reply.is_approved == True))
+        )
+        result = await db.execute(select(cls).join(thread, cls.id == thread.c.id).order_by(asc(cls.created_at), asc(cls.id)))
+
+        # Rows come back flat in created_at order; link them by id so every level keeps that order
+        nodes = {comment.id: {**comment.to_dict(), 'replies': []} for comment in result.scalars().all()}
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node['parent_id'])
+            (parent['replies'] if parent else roots).append(node)
+        return roots
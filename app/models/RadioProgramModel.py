@@ -1,15 +1,29 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, Index, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc
+from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc, inspect
 from sqlalchemy.future import select
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from app.models.BaseModel import Base
 from datetime import datetime
 from typing import Optional, Dict, Any, List
+from operator import attrgetter
 
 
+_RADIO_PROGRAM_FIELDS = (
+    'id', 'title', 'description', 'type', 'duration', 'station_id', 'studio', 'hosts', 'image_path',
+    'image_url', 'created_by', 'state', 'status', 'created_at', 'updated_at',
+)
+_radio_program_values = attrgetter(*_RADIO_PROGRAM_FIELDS)
+
 class RadioProgram(Base):
     __tablename__ = "radio_programs"
+    __table_args__ = (
+        Index("ix_radio_programs_station_state_status", 'station_id', 'state', 'status'),
+        Index("ix_radio_programs_state_created_at", 'state', 'created_at'),
+        # Multi-valued index over the host ids, used by has_host; MySQL 8.0.17+ only
+        Index("ix_radio_programs_host_ids", text("(CAST(hosts->'$[*].id' AS CHAR(36) ARRAY))")).ddl_if(dialect='mysql'),
+    )
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     type = Column(String(100), nullable=False, default='live_show')  # live_show, interview, podcast, news, music, talk_show, sports, special
@@ -23,53 +37,97 @@ class RadioProgram(Base):
     listener_favorite = Column(Boolean, default=False)  # JSON array of listener favorite objects
 
 
-    creator = relationship("User", foreign_keys=[created_by])
+    creator = relationship("User", back_populates="created_programs")
     station = relationship("Station", back_populates="programs")
+    recordings = relationship("RadioSessionRecording", back_populates="program", lazy="raise")
+    
+    @classmethod
+    def has_host(cls, host_id):
+        # hosts is a JSON array of {"id": ...} objects; the test runs on its id list so the
+        # ix_radio_programs_host_ids multi-valued index can answer it
+        return func.json_contains(func.json_extract(cls.hosts, '$[*].id'), func.json_array(host_id))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(_RADIO_PROGRAM_FIELDS, _radio_program_values(self)))
+    
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        return [selectinload(cls.station)]
     
-    async def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'type': self.type,
-            'duration': self.duration,
-            'station_id': self.station_id,
-            'studio': self.studio,
-            'hosts': self.hosts,
-            'image_path': self.image_path,
-            'image_url': self.image_url,
-            'created_by': self.created_by,
-            'state': self.state,
-            'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+    @classmethod
+    async def load_batch(cls, db: AsyncSession, ids: List[str]) -> List["RadioProgram"]:
+        if not ids:
+            return []
+        result = await db.execute(select(cls).options(*cls.serialization_options()).where(cls.id.in_(ids)))
+        return result.scalars().all()
+    
+    @staticmethod
+    def is_host_snapshot(host: Any) -> bool:
+        # Hosts associated before snapshots were stored only carry a subset of Host.to_dict
+        return isinstance(host, dict) and 'slug' in host
+    
+    @classmethod
+    async def get_hosts_by_id(cls, db: AsyncSession, programs: List["RadioProgram"]) -> Dict[str, Dict[str, Any]]:
+        # One Host query for the legacy host entries in the batch, snapshots are served from the JSON as is
+        from app.models.HostModel import Host
+        host_ids = {
+            host['id'] for program in programs for host in (program.hosts or [])
+            if isinstance(host, dict) and host.get('id') and not cls.is_host_snapshot(host)
         }
+        if not host_ids:
+            return {}
+        result = await db.execute(select(Host).where(Host.id.in_(host_ids)))
+        return {host.id: host.to_dict() for host in result.scalars().all()}
     
-    async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['station', 'creator'])
-            data = await self.to_dict()
-            if self.station:
-                data['station'] = {
-                    'id': self.station.id,
-                    'name': self.station.name,
-                    'frequency': self.station.frequency,
-                    'tagline': self.station.tagline,
-                    'access_link': self.station.access_link,
-                    'streaming_link': self.station.streaming_link,
-                    'streaming_status': self.station.streaming_status,
-                    'radio_access_status': self.station.radio_access_status
-                }
-            hosts = await self.get_program_hosts(db, self.hosts)
-            if hosts:
-                data['hosts'] = hosts
-            else:
-                data['hosts'] = []
-            
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert radio program to dictionary with relations: {str(e)}")
+    @classmethod
+    async def load_stations(cls, db: AsyncSession, programs: List["RadioProgram"]) -> None:
+        # One Station query for every program in the batch whose station was not eager loaded
+        missing = [program for program in programs if 'station' in inspect(program).unloaded]
+        station_ids = {program.station_id for program in missing if program.station_id}
+        if not station_ids:
+            return
+        station_cls = cls.station.property.mapper.class_
+        result = await db.execute(select(station_cls).where(station_cls.id.in_(station_ids)))
+        stations = {station.id: station for station in result.scalars().all()}
+        for program in missing:
+            set_committed_value(program, 'station', stations.get(program.station_id))
+    
+    @classmethod
+    async def to_dicts_with_relations(cls, db: AsyncSession, programs: List["RadioProgram"]) -> List[Dict[str, Any]]:
+        # Stations and legacy hosts come from one IN query each, the dicts are then assembled without awaiting
+        await cls.load_stations(db, programs)
+        hosts_by_id = await cls.get_hosts_by_id(db, programs)
+        return [program._to_dict_with_loaded(hosts_by_id) for program in programs]
+    
+    async def to_dict_with_relations(self, db: AsyncSession, hosts_by_id: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        await self.refresh_relations(db, ['station'])
+        if hosts_by_id is None:
+            hosts_by_id = await RadioProgram.get_hosts_by_id(db, [self])
+        return self._to_dict_with_loaded(hosts_by_id)
+    
+    def _to_dict_with_loaded(self, hosts_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        data = self.to_dict()
+        if self.station:
+            data['station'] = {
+                'id': self.station.id,
+                'name': self.station.name,
+                'frequency': self.station.frequency,
+                'tagline': self.station.tagline,
+                'access_link': self.station.access_link,
+                'streaming_link': self.station.streaming_link,
+                'streaming_status': self.station.streaming_status,
+                'radio_access_status': self.station.radio_access_status
+            }
+        hosts = {}
+        for host in self.hosts or []:
+            if not isinstance(host, dict) or host.get('id') in hosts:
+                continue
+            if self.is_host_snapshot(host):
+                hosts[host['id']] = host
+            elif host.get('id') in hosts_by_id:
+                hosts[host['id']] = hosts_by_id[host['id']]
+        data['hosts'] = list(hosts.values())
+        return data
     
   
 
@@ -79,18 +137,6 @@ class RadioProgram(Base):
             await db.commit()
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete radio program with relations: {str(e)}")
-    
-
-    async def get_program_hosts(self, db: AsyncSession, hosts_json: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        try:
-            from app.models.HostModel import Host
-            hosts_ids = [host['id'] for host in hosts_json]
-            stmt = select(Host).where(Host.id.in_(hosts_ids))
-            result = await db.execute(stmt)
-            hosts = result.scalars().all()
-            return [await host.to_dict() for host in hosts]
-        except Exception as e:
-            raise Exception(f"Failed to get program hosts: {str(e)}")
\ No newline at end of file
+            raise
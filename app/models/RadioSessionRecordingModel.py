@@ -1,15 +1,24 @@
 # RadioSessionRecordingModel.py
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON, Integer, Float
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON, Integer, Float, Index
+from sqlalchemy.orm import relationship, selectinload
 from sqlalchemy import delete, select, and_
 from datetime import datetime
 from app.models.BaseModel import Base
+from app.models.HostModel import Host
+from app.utils.file_upload import remove_file
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Mapping
+from types import MappingProxyType
+from functools import lru_cache
 import uuid
 
 class RadioSessionRecording(Base):
     __tablename__ = "radio_session_recordings"
+    __table_args__ = (
+        Index("ix_radio_session_recordings_state_recording_status", 'state', 'recording_status'),
+        Index("ix_radio_session_recordings_station_recording_status_created_at", 'station_id', 'recording_status', 'state', 'status', 'created_at'),
+        Index("ix_radio_session_recordings_station_program_session_date", 'station_id', 'program_id', 'session_date'),
+    )
     
     # Foreign Keys
     station_id = Column(String(36), ForeignKey('stations.id'), nullable=False)
@@ -55,20 +64,23 @@ class RadioSessionRecording(Base):
     recording_metadata = Column(JSON, nullable=True)  # Extra data like tags, thumbnails, etc.
     
     # Relationships
-    station = relationship("Station", foreign_keys=[station_id])
-    program = relationship("RadioProgram", foreign_keys=[program_id])
+    station = relationship("Station", back_populates="recordings")
+    program = relationship("RadioProgram", back_populates="recordings")
+    # Hosts linked through recording_hosts; the hosts JSON above keeps the raw session snapshot and the display order
+    session_hosts = relationship("Host", secondary="recording_hosts", back_populates="recordings")
     
-    async def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Dict[str, Any]:
+        # Dates and datetimes stay native, OrjsonResponse writes them as ISO 8601
         return {
             'id': self.id,
             'station_id': self.station_id,
             'program_id': self.program_id,
-            'session_date': self.session_date.isoformat() if self.session_date else None,
+            'session_date': self.session_date,
             'day_of_week': self.day_of_week,
-            'scheduled_start_time': self.scheduled_start_time.isoformat() if self.scheduled_start_time else None,
-            'scheduled_end_time': self.scheduled_end_time.isoformat() if self.scheduled_end_time else None,
-            'actual_start_time': self.actual_start_time.isoformat() if self.actual_start_time else None,
-            'actual_end_time': self.actual_end_time.isoformat() if self.actual_end_time else None,
+            'scheduled_start_time': self.scheduled_start_time,
+            'scheduled_end_time': self.scheduled_end_time,
+            'actual_start_time': self.actual_start_time,
+            'actual_end_time': self.actual_end_time,
             'recording_status': self.recording_status,
             'stream_url': self.stream_url,
             'recording_file_path': self.recording_file_path,
@@ -90,116 +102,93 @@ class RadioSessionRecording(Base):
             'recording_metadata': self.recording_metadata,
             'status': self.status,
             'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
+    @classmethod
+    def serialization_options(cls) -> List[Any]:
+        return [selectinload(cls.station), selectinload(cls.program), selectinload(cls.session_hosts)]
+    
+    @classmethod
+    async def to_dicts_with_relations(cls, db: AsyncSession, recordings: List["RadioSessionRecording"]) -> List[Dict[str, Any]]:
+        return [await recording.to_dict_with_relations(db) for recording in recordings]
+    
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['station', 'program'])
-            data = await self.to_dict()
-            
-            if self.station:
-                data['station'] = await self.station.to_dict()
-            if self.program:
-                data['program'] = await self.program.to_dict()
+        await self.refresh_relations(db, ['station', 'program', 'session_hosts'])
+        data = self.to_dict()
+        
+        if self.station:
+            data['station'] = self.station.to_dict()
+        if self.program:
+            data['program'] = self.program.to_dict()
 
-            show_hosts = await self.get_program_hosts(db, self.hosts)
-            if show_hosts:
-                data['hosts'] = show_hosts
-            else:
-                data['hosts'] = []
-                
-            return data
+        # Linked hosts in the order the session listed them
+        positions = {host_id: position for position, host_id in enumerate(self.host_ids(self.hosts))}
+        data['hosts'] = [host.to_dict() for host in sorted(self.session_hosts, key=lambda host: positions.get(host.id, len(positions)))]
             
-        except Exception as e:
-            raise Exception(f"Failed to convert recording to dictionary with relations: {str(e)}")
+        return data
 
     async def delete_with_relations(self, db: AsyncSession):
         try:
-            from app.utils.file_upload import remove_file
             if self.recording_file_path:
                 remove_file(self.recording_file_path)
             await db.execute(delete(RadioSessionRecording).where(RadioSessionRecording.id == self.id))
             await db.commit()
             return True
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete recording with relations: {str(e)}")
+            raise
 
 
-    async def get_program_hosts(self, db: AsyncSession, hosts_json: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        try:
-            if not hosts_json or not isinstance(hosts_json, list):
-                return []
-                
-            from app.models.HostModel import Host
-            
-            # Extract host IDs from the JSON structure
-            hosts_ids = []
-            for host in hosts_json:
-                if isinstance(host, dict) and 'id' in host:
-                    hosts_ids.append(host['id'])
-                elif isinstance(host, str):  # In case IDs are stored as strings
-                    hosts_ids.append(host)
-            
-            if not hosts_ids:
-                return []
-                
-            stmt = select(Host).where(Host.id.in_(hosts_ids))
-            result = await db.execute(stmt)
-            hosts = result.scalars().all()
-            
-            # Convert to dictionaries - this is the key fix
-            hosts_data = []
-            for host in hosts:
-                try:
-                    host_dict = await host.to_dict() if hasattr(host, 'to_dict') else {
-                        'id': host.id,
-                        'name': getattr(host, 'name', ''),
-                        'role': getattr(host, 'role', ''),
-                        'email': getattr(host, 'email', ''),
-                        'phone': getattr(host, 'phone', ''),
-                        'image_url': getattr(host, 'image_url', ''),
-                    }
-                    hosts_data.append(host_dict)
-                except Exception as e:
-                    # If individual host conversion fails, skip it
-                    print(f"Failed to convert host {host.id}: {e}")
-                    continue
-                    
-            return hosts_data
-            
-        except Exception as e:
-            print(f"Failed to get program hosts: {str(e)}")
-            return []  # Return empty list instead of raising exception
+    @staticmethod
+    def host_ids(hosts_json: Any) -> List[str]:
+        # Host IDs from the JSON structure, in order and without repeats
+        if not hosts_json or not isinstance(hosts_json, list):
+            return []
+        hosts_ids = {}
+        for host in hosts_json:
+            if isinstance(host, dict) and 'id' in host:
+                hosts_ids[host['id']] = None
+            elif isinstance(host, str):  # In case IDs are stored as strings
+                hosts_ids[host] = None
+        return list(hosts_ids)
+
+    @classmethod
+    async def load_hosts(cls, db: AsyncSession, hosts_json: Any) -> List[Any]:
+        # Host rows for a session's hosts JSON, to link on a new recording; unknown ids are dropped
+        
+        hosts_ids = cls.host_ids(hosts_json)
+        if not hosts_ids:
+            return []
+        result = await db.execute(select(Host).where(Host.id.in_(hosts_ids)))
+        return list(result.scalars().all())
 
     def get_recording_filename(self) -> str:
         if not self.session_date or not self.station:
             return f"recording_{self.id}.{self.audio_format}"
         
-        date_str = self.session_date.strftime('%Y%m%d')
-        time_str = self.scheduled_start_time.strftime('%H%M') if self.scheduled_start_time else '0000'
-        station_name = self.station.name.replace(' ', '_').lower() if hasattr(self.station, 'name') else 'station'
-        
-        return f"{station_name}_{date_str}_{time_str}_{self.id}.{self.audio_format}"
+        station_name = station_file_prefix(self.station.name) if hasattr(self.station, 'name') else 'station'
+        time_str = f"{self.scheduled_start_time:%H%M}" if self.scheduled_start_time else '0000'
+        return f"{station_name}_{self.session_date:%Y%m%d}_{time_str}_{self.id}.{self.audio_format}"
     
     def is_currently_recording(self) -> bool:
         return self.recording_status == 'recording'
     
-    def is_scheduled_now(self) -> bool:
-        now = datetime.utcnow()
+    # The predicates take the caller's "now" so a loop over many recordings reads the clock once
+    def is_scheduled_now(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
         return (self.scheduled_start_time <= now <= self.scheduled_end_time and 
                 self.recording_status == 'scheduled')
     
-    def should_start_recording(self) -> bool:
-        now = datetime.utcnow()
+    def should_start_recording(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
         return (now >= self.scheduled_start_time and 
                 self.recording_status == 'scheduled' and
                 self.is_live_session)
     
-    def should_stop_recording(self) -> bool:
-        now = datetime.utcnow()
+    def should_stop_recording(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
         return (now >= self.scheduled_end_time and 
                 self.recording_status == 'recording')
     
@@ -210,15 +199,13 @@ class RadioSessionRecording(Base):
         delta = self.scheduled_end_time - self.scheduled_start_time
         return int(delta.total_seconds() / 60)
     
-    def get_recording_quality_settings(self) -> Dict[str, Any]:
-        quality_settings = {
-            '64kbps': {'bitrate': '64k', 'sample_rate': '22050'},
-            '128kbps': {'bitrate': '128k', 'sample_rate': '44100'},
-            '256kbps': {'bitrate': '256k', 'sample_rate': '44100'},
-            '320kbps': {'bitrate': '320k', 'sample_rate': '44100'},
-        }
-        
-        return quality_settings.get(self.audio_quality, quality_settings['128kbps'])
+    def get_recording_quality_settings(self) -> Mapping[str, str]:
+        return RECORDING_QUALITY_SETTINGS.get(self.audio_quality, RECORDING_QUALITY_SETTINGS['128kbps'])
+
+@lru_cache(maxsize=256)
+def station_file_prefix(station_name: str) -> str:
+    # Station names repeat across every recording of the station, so the lowered form is kept
+    return station_name.replace(' ', '_').lower()
 
 # Recording status enum for reference
 RECORDING_STATUSES = {
@@ -239,4 +226,12 @@ PROCESSING_STATUSES = {
     'generating_thumbnails': 'Creating thumbnails/previews',
     'completed': 'Processing completed',
     'failed': 'Processing failed'
-}
\ No newline at end of file
+}
+
+# Encoder settings per audio quality, read-only since every recording shares them
+RECORDING_QUALITY_SETTINGS = MappingProxyType({
+    '64kbps': MappingProxyType({'bitrate': '64k', 'sample_rate': '22050'}),
+    '128kbps': MappingProxyType({'bitrate': '128k', 'sample_rate': '44100'}),
+    '256kbps': MappingProxyType({'bitrate': '256k', 'sample_rate': '44100'}),
+    '320kbps': MappingProxyType({'bitrate': '320k', 'sample_rate': '44100'}),
+})
\ No newline at end of file
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, ForeignKey, UniqueConstraint
+from app.models.BaseModel import Base
+from typing import Dict, Any
+
+class RecordingHost(Base):
+    __tablename__ = "recording_hosts"
+    __table_args__ = (
+        UniqueConstraint('recording_id', 'host_id', name='uq_recording_hosts_recording_host'),
+    )
+    
+    recording_id = Column(String(36), ForeignKey('radio_session_recordings.id', ondelete='CASCADE'), nullable=False)
+    host_id = Column(String(36), ForeignKey('hosts.id', ondelete='CASCADE'), nullable=False, index=True)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'recording_id': self.recording_id,
+            'host_id': self.host_id,
+            'status': self.status,
+            'state': self.state,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
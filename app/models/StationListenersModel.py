@@ -1,30 +1,37 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer, UniqueConstraint, Index
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, and_
+from sqlalchemy import select, update, delete, and_
+from sqlalchemy.dialects.mysql import insert
 from app.models.BaseModel import Base
 from datetime import datetime
 from typing import Optional, Dict, Any
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship
 
 class StationListeners(Base):
     __tablename__ = "station_listeners"
+    __table_args__ = (
+        UniqueConstraint('station_id', 'user_id', name='uq_station_listeners_station_user'),
+        # Recent-listener counts range scan last_seen within one station
+        Index("ix_station_listeners_station_last_seen", 'station_id', 'last_seen'),
+    )
     
     user_id = Column(String(36), ForeignKey('users.id'), nullable=True)
     # Basic Information
     station_id = Column(String(36), ForeignKey('stations.id'), nullable=True)
     last_seen = Column(DateTime, nullable=True)
     # Meta Information
-    user = relationship("User", backref=backref("station_listeners", lazy="selectin"))
+    user = relationship("User", back_populates="station_listeners")
+    station = relationship("Station", back_populates="station_listeners")
     
-    async def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
             'station_id': self.station_id,
             'user_id': self.user_id,
             'status': self.status,
             'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -33,25 +40,32 @@ class StationListeners(Base):
             await db.execute(delete(StationListeners).where(StationListeners.id == self.id))
             await db.commit()
             return True
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete station listeners with relations: {str(e)}")
+            raise
 
 
     @staticmethod
     async def create_station_listener(db: AsyncSession, user_id: str, station_id: str) -> bool:
         try:
-            result = await db.execute(select(StationListeners).where(and_(StationListeners.station_id == station_id, (user_id is None or StationListeners.user_id == user_id))))
-            if user := result.scalars().first():
-                user.last_seen = datetime.now()
-                await db.commit()
-                return True
+            now = datetime.now()
+            if user_id is None:
+                # NULL never collides on the unique key, so the anonymous listener row is matched with IS NULL
+                result = await db.execute(
+                    update(StationListeners)
+                    .where(and_(StationListeners.station_id == station_id, StationListeners.user_id.is_(None)))
+                    .values(last_seen=now, updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    db.add(StationListeners(station_id=station_id, user_id=None, last_seen=now))
             else:
-                user = StationListeners(station_id=station_id, user_id=user_id, last_seen=datetime.now())
-                db.add(user)
-                await db.commit()
-                return True
-        except Exception as e:
+                # One statement per heartbeat: the (station_id, user_id) unique key turns a repeat visit into a last_seen update
+                stmt = insert(StationListeners).values(station_id=station_id, user_id=user_id, last_seen=now)
+                await db.execute(stmt.on_duplicate_key_update(last_seen=stmt.inserted.last_seen, updated_at=stmt.inserted.updated_at))
+            await db.commit()
+            return True
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to create station listeners with relations: {str(e)}")
+            raise
     
\ No newline at end of file
@@ -1,14 +1,44 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer, Index
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.orm import relationship, selectinload, joinedload, query_expression, with_expression
+from sqlalchemy.orm.attributes import set_committed_value
 from app.models.BaseModel import Base
+from app.models.RadioProgramModel import RadioProgram
+from app.models.StationScheduleModel import StationSchedule
+from app.models.StationListenersModel import StationListeners
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 import urllib.parse
+from functools import lru_cache
+from app.utils.constants import BASE_URL
+
+# A listener counts towards a station while seen within this window
+LISTENER_WINDOW = timedelta(hours=24)
+
+@lru_cache(maxsize=512)
+def secure_stream_url(link: Optional[str]) -> Optional[str]:
+    """Stream URL that works with HTTPS: plain http links go through the streaming proxy"""
+    if not link:
+        return None
+    
+    # If it's already HTTPS, return as is
+    if link.startswith('https://'):
+        return link
+    
+    # If it's HTTP, create proxy URL
+    if link.startswith('http://'):
+        encoded_url = urllib.parse.quote(link, safe='')
+        return f"{BASE_URL}api/v1/user/streaming/proxy?url={encoded_url}"
+    
+    return link
 
 class Station(Base):
     __tablename__ = "stations"
+    __table_args__ = (
+        Index("ix_stations_state_status", 'state', 'status'),
+        Index("ix_stations_state_streaming_status", 'state', 'streaming_status'),
+    )
     
     # Basic Information
     name = Column(String(255), nullable=False, index=True)
@@ -33,44 +63,29 @@ class Station(Base):
     
     # Meta Information
     created_by = Column(String(36), ForeignKey('users.id'), nullable=True)
+    creator = relationship("User", back_populates="created_stations")
     programs = relationship("RadioProgram", back_populates="station")
     schedule = relationship("StationSchedule", back_populates="station", uselist=False)
+    # Inverse sides, never serialized from a station; queries load them explicitly if ever needed
+    adverts = relationship("Advert", back_populates="station", lazy="raise")
+    forums = relationship("Forum", back_populates="station", lazy="raise")
+    news_articles = relationship("News", back_populates="station", lazy="raise")
+    station_listeners = relationship("StationListeners", back_populates="station", lazy="raise")
+    recordings = relationship("RadioSessionRecording", back_populates="station", lazy="raise")
+    chat_messages = relationship("LiveChatMessage", back_populates="station", lazy="raise")
+    # Recent listener count selected alongside the row by serialization_options(); None when the query did not ask for it
+    listener_count = query_expression()
     
     def get_secure_streaming_url(self) -> Optional[str]:
         """Get streaming URL that works with HTTPS"""
-        if not self.streaming_link:
-            return None
-        
-        # If it's already HTTPS, return as is
-        if self.streaming_link.startswith('https://'):
-            return self.streaming_link
-        
-        # If it's HTTP, create proxy URL
-        if self.streaming_link.startswith('http://'):
-            from app.utils.constants import BASE_URL
-            encoded_url = urllib.parse.quote(self.streaming_link, safe='')
-            return f"{BASE_URL}api/v1/user/streaming/proxy?url={encoded_url}"
-        
-        return self.streaming_link
+        return secure_stream_url(self.streaming_link)
     
     def get_secure_backup_streaming_url(self) -> Optional[str]:
         """Get backup streaming URL that works with HTTPS"""
-        if not self.backup_streaming_link:
-            return None
-        
-        # If it's already HTTPS, return as is
-        if self.backup_streaming_link.startswith('https://'):
-            return self.backup_streaming_link
-        
-        # If it's HTTP, create proxy URL
-        if self.backup_streaming_link.startswith('http://'):
-            from app.utils.constants import BASE_URL
-            encoded_url = urllib.parse.quote(self.backup_streaming_link, safe='')
-            return f"{BASE_URL}api/v1/user/streaming/proxy?url={encoded_url}"
-        
-        return self.backup_streaming_link
+        return secure_stream_url(self.backup_streaming_link)
     
-    async def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Dict[str, Any]:
+        # Timestamps are left for orjson to format
         return {
             'id': self.id,
             'name': self.name,
@@ -92,76 +107,121 @@ class Station(Base):
             'created_by': self.created_by,
             'status': self.status,
             'state': self.state,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
-    async def to_dict_with_relations(self, db: AsyncSession, include_programs: bool = False, include_schedule: bool = False) -> Dict[str, Any]:
-        try:
-            await db.refresh(self, ['programs','schedule'])
-            data = await self.to_dict()
-            
-            if self.created_by:
-                from app.models.UserModel import User
-                creator_result = await db.execute(select(User).where(User.id == self.created_by))
-                creator = creator_result.scalar_one_or_none()
-                if creator:
-                    data['creator'] = {
-                        'id': creator.id,
-                        'name': creator.name,
-                        'email': creator.email,
-                        'role': creator.role,
-                        'created_at': creator.created_at.isoformat() if creator.created_at else None,
-                        'updated_at': creator.updated_at.isoformat() if creator.updated_at else None
-                    }
-                else:
-                    data['creator'] = None
-            else:
-                data['creator'] = None
-            
-            listeners = await self.get_listeners(db)
-            data['listeners'] = listeners if listeners else 0
-            
-            data['stats'] = {
-                'total_listeners': listeners if listeners else 0,
-                'is_streaming': self.streaming_status == 'live',
-                'is_accessible': self.radio_access_status and self.status and self.state
+    @classmethod
+    def serialization_options(cls, include_programs: bool = False, include_schedule: bool = False) -> List[Any]:
+        # The creator is joined in and the listener count is a correlated subquery in the same SELECT;
+        # the collections this call serializes come from one IN query each
+        options = [joinedload(cls.creator), with_expression(cls.listener_count, cls.listener_count_expression())]
+        if include_programs:
+            options.append(selectinload(cls.programs))
+        if include_schedule:
+            options.append(selectinload(cls.schedule))
+        return options
+    
+    @classmethod
+    async def to_dicts_with_relations(cls, db: AsyncSession, stations: List["Station"]) -> List[Dict[str, Any]]:
+        # Listener counts the station query did not select come from one grouped query for the whole page
+        listener_counts = await cls.bulk_listener_counts(db, [station.id for station in stations if station.listener_count is None])
+        return [await station.to_dict_with_relations(db, listener_counts=listener_counts) for station in stations]
+    
+    async def to_dict_with_relations(self, db: AsyncSession, include_programs: bool = False, include_schedule: bool = False, listener_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        # Only load what this call serializes; a no-op when the query used serialization_options()
+        await self.refresh_relations(db, ['creator', *(name for name, included in (('programs', include_programs), ('schedule', include_schedule)) if included)])
+        data = self.to_dict()
+        
+        creator = self.creator
+        if creator:
+            data['creator'] = {
+                'id': creator.id,
+                'name': creator.name,
+                'email': creator.email,
+                'role': creator.role,
+                'created_at': creator.created_at,
+                'updated_at': creator.updated_at
             }
-            
-            if include_programs:
-                if self.programs:
-                    data['programs'] = [await program.to_dict_with_relations(db) for program in self.programs if program]
-                else:
-                    data['programs'] = []
-            
-            if include_schedule:
-                if self.schedule:
-                    data['schedule'] = await self.schedule.to_dict_with_relations(db)
-                else:
-                    data['schedule'] = None
-            
-            return data
-                    
-        except Exception as e:
-            raise Exception(f"Failed to convert station to dictionary with relations: {str(e)}")
+        else:
+            data['creator'] = None
+        
+        if self.listener_count is not None:
+            listeners = self.listener_count
+        elif listener_counts is not None:
+            listeners = listener_counts.get(self.id, 0)
+        else:
+            listeners = await self.get_listeners(db)
+        data['listeners'] = listeners if listeners else 0
+        
+        data['stats'] = {
+            'total_listeners': listeners if listeners else 0,
+            'is_streaming': self.streaming_status == 'live',
+            'is_accessible': self.radio_access_status and self.status and self.state
+        }
+        
+        if include_programs:
+            if self.programs:
+                programs = [program for program in self.programs if program]
+                for program in programs:
+                    # Loaded through this station, so point back at it instead of querying per program
+                    set_committed_value(program, 'station', self)
+                data['programs'] = await RadioProgram.to_dicts_with_relations(db, programs)
+            else:
+                data['programs'] = []
+        
+        if include_schedule:
+            if self.schedule:
+                set_committed_value(self.schedule, 'station', self)
+                data['schedule'] = await self.schedule.to_dict_with_relations(db, program_dicts={program['id']: program for program in data.get('programs', [])})
+            else:
+                data['schedule'] = None
+        
+        return data
 
     async def delete_with_relations(self, db: AsyncSession) -> bool:
         try:
+            now = datetime.utcnow()
             self.state = False
             self.status = False
-            self.updated_at = datetime.utcnow()
+            self.updated_at = now
+            
+            # Programs, the schedule and listeners are soft deleted with the station, one UPDATE per table
+            for model in (RadioProgram, StationSchedule, StationListeners):
+                await db.execute(
+                    update(model)
+                    .where(and_(model.station_id == self.id, model.state == True))
+                    .values(state=False, status=False, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                )
             
             await db.commit()
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete station with relations: {str(e)}")
+            raise
 
     async def get_listeners(self, db: AsyncSession) -> int:
-        from app.models.StationListenersModel import StationListeners
-        try:
-            result = await db.execute(select(func.count(StationListeners.id)).where(StationListeners.station_id == self.id).where(StationListeners.last_seen > datetime.now() - timedelta(hours=24)))
-            return result.scalar_one_or_none()
-        except Exception as e:
-            raise Exception(f"Failed to get listeners: {str(e)}")
\ No newline at end of file
+        result = await db.execute(select(func.count(StationListeners.id)).where(StationListeners.station_id == self.id).where(StationListeners.last_seen > datetime.now() - LISTENER_WINDOW))
+        return result.scalar_one_or_none()
+
+    @classmethod
+    def listener_count_expression(cls):
+        return (
+            select(func.count(StationListeners.id))
+            .where(StationListeners.station_id == cls.id, StationListeners.last_seen > datetime.now() - LISTENER_WINDOW)
+            .correlate(cls)
+            .scalar_subquery()
+        )
+
+    @classmethod
+    async def bulk_listener_counts(cls, db: AsyncSession, station_ids: List[str]) -> Dict[str, int]:
+        if not station_ids:
+            return {}
+        result = await db.execute(
+            select(StationListeners.station_id, func.count(StationListeners.id))
+            .where(StationListeners.station_id.in_(set(station_ids)), StationListeners.last_seen > datetime.now() - LISTENER_WINDOW)
+            .group_by(StationListeners.station_id)
+        )
+        return dict(result.all())
\ No newline at end of file
@@ -1,11 +1,17 @@
 # StationScheduleModel.py
 from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, JSON, select
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.BaseModel import Base
+from app.models.RadioProgramModel import RadioProgram
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, List, Optional
 import uuid
+import re
+import heapq
+
+# H:MM or HH:MM with hour 0-23 and minute 0-59, the same times int() parsing accepted
+_TIME_RE = re.compile(r'(?:[01]?\d|2[0-3]):[0-5]?\d')
 
 class StationSchedule(Base):
     __tablename__ = "station_schedules"
@@ -23,7 +29,7 @@ class StationSchedule(Base):
     notes = Column(Text, nullable=True)
     station = relationship("Station", back_populates="schedule")
     
-    async def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
             'station_id': self.station_id,
@@ -35,43 +41,47 @@ class StationSchedule(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
     
-    async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            from app.models.RadioProgramModel import RadioProgram
-            
-            await db.refresh(self, ['station'])
-            data = await self.to_dict()
-            
-            if self.station:
-                data['station'] = await self.station.to_dict()
-            
-            # Fetch programs for all sessions
-            sessions_with_programs = {}
-            for day, day_sessions in self.sessions.items():
-                sessions_with_programs[day] = []
-                for session in day_sessions:
-                    session_with_program = session.copy()
-                    if 'program_id' in session:
-                        program = await self._get_program_by_id(db, session['program_id'])
-                        session_with_program['program'] = await program.to_dict_with_relations(db) if program else None
-                    sessions_with_programs[day].append(session_with_program)
-            
-            data['sessions'] = sessions_with_programs
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert schedule to dictionary with relations: {str(e)}")
+    async def to_dict_with_relations(self, db: AsyncSession, program_dicts: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        await self.refresh_relations(db, ['station'])
+        data = self.to_dict()
+        
+        if self.station:
+            data['station'] = self.station.to_dict()
+        
+        # Programs the caller already serialized are reused, the rest are fetched in one batch
+        program_dicts = dict(program_dicts or {})
+        programs = await self._get_session_programs(db, exclude=program_dicts.keys())
+        program_dicts.update(zip(programs, await RadioProgram.to_dicts_with_relations(db, list(programs.values()))))
+        sessions_with_programs = {}
+        for day, day_sessions in self.sessions.items():
+            sessions_with_programs[day] = []
+            for session in day_sessions:
+                session_with_program = session.copy()
+                if 'program_id' in session:
+                    session_with_program['program'] = program_dicts.get(session['program_id'])
+                sessions_with_programs[day].append(session_with_program)
+        
+        data['sessions'] = sessions_with_programs
+        return data
 
     async def _get_program_by_id(self, db: AsyncSession, program_id: str) -> Optional['RadioProgram']:
         try:
-            from app.models.RadioProgramModel import RadioProgram
             result = await db.execute(select(RadioProgram).where(RadioProgram.id == program_id))
             return result.scalar_one_or_none()
         except Exception:
             return None
 
+    async def _get_session_programs(self, db: AsyncSession, exclude=(), sessions: Optional[List[Dict[str, Any]]] = None) -> Dict[str, 'RadioProgram']:
+        # Programs for the given sessions (the whole week by default) in one IN query
+        if sessions is None:
+            sessions = [session for day_sessions in self.sessions.values() for session in day_sessions]
+        program_ids = {session['program_id'] for session in sessions if session.get('program_id')}
+        program_ids.difference_update(exclude)
+        return {program.id: program for program in await RadioProgram.load_batch(db, list(program_ids))}
+
     async def get_sessions_with_programs(self, db: AsyncSession) -> Dict[str, List[Dict[str, Any]]]:
         """Get all sessions with their associated program data"""
+        programs = await self._get_session_programs(db)
         sessions_with_programs = {}
         
         for day, day_sessions in self.sessions.items():
@@ -79,8 +89,8 @@ class StationSchedule(Base):
             for session in day_sessions:
                 session_data = session.copy()
                 if 'program_id' in session:
-                    program = await self._get_program_by_id(db, session['program_id'])
-                    session_data['program'] = await program.to_dict() if program else None
+                    program = programs.get(session['program_id'])
+                    session_data['program'] = program.to_dict() if program else None
                 sessions_with_programs[day].append(session_data)
         
         return sessions_with_programs
@@ -98,7 +108,7 @@ class StationSchedule(Base):
                 session_data = session.copy()
                 if 'program_id' in session:
                     program = await self._get_program_by_id(db, session['program_id'])
-                    session_data['program'] = await program.to_dict() if program else None
+                    session_data['program'] = program.to_dict() if program else None
                 return session_data
         
         return None
@@ -108,12 +118,13 @@ class StationSchedule(Base):
         if day not in self.sessions:
             return []
         
+        programs = await self._get_session_programs(db, sessions=self.sessions[day])
         sessions_with_programs = []
         for session in self.sessions[day]:
             session_data = session.copy()
             if 'program_id' in session:
-                program = await self._get_program_by_id(db, session['program_id'])
-                session_data['program'] = await program.to_dict() if program else None
+                program = programs.get(session['program_id'])
+                session_data['program'] = program.to_dict() if program else None
             sessions_with_programs.append(session_data)
         
         return sessions_with_programs
@@ -190,15 +201,26 @@ class StationSchedule(Base):
         return errors
     
     def _check_day_conflicts(self, sessions: List[Dict], day: str) -> List[str]:
-        conflicts = []
+        # Sweep sessions in start order; only those still running when a session starts can overlap it
+        timed = sorted(
+            (session.get("start_time"), index) for index, session in enumerate(sessions)
+            if session.get("start_time") and session.get("end_time")
+        )
+        running = []
+        pairs = []
+        for start, j in timed:
+            while running and running[0][0] <= start:
+                heapq.heappop(running)
+            pairs.extend(sorted((i, j)) for _, i in running if self._sessions_overlap(sessions[i], sessions[j]))
+            heapq.heappush(running, (sessions[j].get("end_time"), j))
         
-        for i, session1 in enumerate(sessions):
-            for j, session2 in enumerate(sessions[i+1:], i+1):
-                if self._sessions_overlap(session1, session2):
-                    conflicts.append(
-                        f"{day}: Session {i+1} ({session1.get('start_time')}-{session1.get('end_time')}) "
-                        f"conflicts with Session {j+1} ({session2.get('start_time')}-{session2.get('end_time')})"
-                    )
+        conflicts = []
+        for i, j in sorted(pairs):
+            session1, session2 = sessions[i], sessions[j]
+            conflicts.append(
+                f"{day}: Session {i+1} ({session1.get('start_time')}-{session1.get('end_time')}) "
+                f"conflicts with Session {j+1} ({session2.get('start_time')}-{session2.get('end_time')})"
+            )
         
         return conflicts
     
@@ -214,14 +236,7 @@ class StationSchedule(Base):
         return (start1 < end2) and (start2 < end1)
     
     def _is_valid_time(self, time_str: str) -> bool:
-        try:
-            parts = time_str.split(":")
-            if len(parts) != 2:
-                return False
-            hour, minute = int(parts[0]), int(parts[1])
-            return 0 <= hour <= 23 and 0 <= minute <= 59
-        except:
-            return False
+        return isinstance(time_str, str) and _TIME_RE.fullmatch(time_str) is not None
 
     async def get_session_program(self, db: AsyncSession, program_id: str) -> Optional[Dict[str, Any]]:
         for day, day_sessions in self.sessions.items():
@@ -38,7 +38,7 @@ class SystemErrorLog(Base):
     resolved_by = Column(String(36), nullable=True)  # User ID who resolved
     notes = Column(Text, nullable=True)  # Additional notes about the error
     
-    async def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
             'service': self.service,
@@ -1,12 +1,18 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, and_, between, or_, asc, desc
+from sqlalchemy.orm import relationship
 from app.models.BaseModel import Base
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_state_role", 'state', 'role'),
+        Index("ix_users_state_last_seen", 'state', 'last_seen'),
+        Index("ix_users_state_status_last_seen", 'state', 'status', 'last_seen'),
+    )
     
     role = Column(String(36), nullable=True)
     provider = Column(String(255), nullable=True)
@@ -38,7 +44,19 @@ class User(Base):
     device_token = Column(Text, nullable=True)
     last_device = Column(Text, nullable=True)
 
-    async def to_dict(self) -> Dict[str, Any]:
+    # Inverse sides, never serialized from a user; queries load them explicitly if ever needed
+    tokens = relationship("Usertoken", back_populates="user", lazy="raise")
+    station_listeners = relationship("StationListeners", back_populates="user", lazy="raise")
+    created_adverts = relationship("Advert", back_populates="creator", lazy="raise")
+    created_forums = relationship("Forum", back_populates="creator", lazy="raise")
+    forum_comments = relationship("ForumComment", back_populates="creator", lazy="raise")
+    authored_news = relationship("News", back_populates="author", lazy="raise")
+    news_comments = relationship("NewsComment", back_populates="user", lazy="raise")
+    created_stations = relationship("Station", back_populates="creator", lazy="raise")
+    created_programs = relationship("RadioProgram", back_populates="creator", lazy="raise")
+    chat_messages = relationship("LiveChatMessage", back_populates="user", lazy="raise")
+
+    def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
             'role': self.role,
@@ -70,13 +88,8 @@ class User(Base):
         }
     
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            await db.refresh(self)
-            data = await self.to_dict()
-            return data
-            
-        except Exception as e:
-            raise Exception(f"Failed to convert user to dictionary with relations: {str(e)}")
+        data = self.to_dict()
+        return data
     
     async def delete_with_relations(self, db: AsyncSession) -> bool:
         try:
@@ -123,6 +136,6 @@ class User(Base):
             await db.commit()
             return True
             
-        except Exception as e:
+        except Exception:
             await db.rollback()
-            raise Exception(f"Failed to delete user with relations: {str(e)}")
\ No newline at end of file
+            raise
\ No newline at end of file
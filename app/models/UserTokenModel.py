@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.models.BaseModel import Base
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,9 +28,9 @@ class Usertoken(Base):
     revoked = Column(Boolean, default=False, nullable=False)
     device_fingerprint = Column(String(100), nullable=True)
 
-    user = relationship("User", backref=backref("tokens", lazy="selectin"))
+    user = relationship("User", back_populates="tokens")
     
-    async def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> Dict[str, Any]:
         return {
             'id': self.id,
             'user_id': self.user_id,
@@ -51,15 +51,11 @@ class Usertoken(Base):
         }
     
     async def to_dict_with_relations(self, db: AsyncSession) -> Dict[str, Any]:
-        try:
-            # Reload the model with any related entities
-            await db.refresh(self, ['user'])   
-            data = await self.to_dict()
-            # Add related entities data
-            if self.user:
-                data['user'] = await self.user.to_dict()
-                
-            return data
+        # Load the user unless the query already did
+        await self.refresh_relations(db, ['user'])
+        data = self.to_dict()
+        # Add related entities data
+        if self.user:
+            data['user'] = self.user.to_dict()
             
-        except Exception as e:
-            raise Exception(f"Failed to convert user token to dictionary with relations: {str(e)}")
\ No newline at end of file
+        return data
\ No newline at end of file
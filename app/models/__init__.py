@@ -8,8 +8,33 @@ from app.models.StationScheduleModel import StationSchedule
 from app.models.NewsModel import News
 from app.models.ForumModel import Forum
 from app.models.ForumCommentModel import ForumComment
+from app.models.ForumViewModel import ForumView
 from app.models.AdvertModel import Advert
 from app.models.LiveChatMessageModel import LiveChatMessage
 from app.models.StationListenersModel import StationListeners
 from app.models.EventModel import Event
 from app.models.RadioSessionRecordingModel import RadioSessionRecording
+from app.models.RecordingHostModel import RecordingHost
+
+# Every mapped class is imported once here so Base.metadata and the mapper
+# registry are complete before the first request; app.main imports the package
+# for that side effect only.
+__all__ = [
+    "Base",
+    "User",
+    "Usertoken",
+    "Station",
+    "Host",
+    "RadioProgram",
+    "StationSchedule",
+    "News",
+    "Forum",
+    "ForumComment",
+    "ForumView",
+    "Advert",
+    "LiveChatMessage",
+    "StationListeners",
+    "Event",
+    "RadioSessionRecording",
+    "RecordingHost",
+]
@@ -284,10 +284,9 @@ class EnhancedStationRecordingService:
         except:
             return 0
     
-    def _get_current_session(self, schedule: StationSchedule) -> Optional[Dict]:
+    def _get_current_session(self, schedule: StationSchedule, now: Optional[datetime] = None) -> Optional[Dict]:
         # Use Nairobi timezone for session calculations
-        nairobi_tz = pytz.timezone('Africa/Nairobi')
-        now = datetime.now(nairobi_tz)
+        now = now or datetime.now(pytz.timezone('Africa/Nairobi'))
         day_name = now.strftime('%A').lower()
         current_seconds = now.hour * 3600 + now.minute * 60 + now.second
         
@@ -309,19 +308,17 @@ class EnhancedStationRecordingService:
                     return session
         return None
     
-    def _should_start_recording(self, session: Dict) -> bool:
+    def _should_start_recording(self, session: Dict, now: Optional[datetime] = None) -> bool:
         # Use Nairobi timezone
-        nairobi_tz = pytz.timezone('Africa/Nairobi')
-        now = datetime.now(nairobi_tz)
+        now = now or datetime.now(pytz.timezone('Africa/Nairobi'))
         current_seconds = now.hour * 3600 + now.minute * 60 + now.second
         start_seconds = self._time_to_seconds(session.get('start_time', '00:00'))
         
         return current_seconds >= start_seconds
     
-    def _should_stop_recording(self, session: Dict) -> bool:
+    def _should_stop_recording(self, session: Dict, now: Optional[datetime] = None) -> bool:
         # Use Nairobi timezone
-        nairobi_tz = pytz.timezone('Africa/Nairobi')
-        now = datetime.now(nairobi_tz)
+        now = now or datetime.now(pytz.timezone('Africa/Nairobi'))
         current_seconds = now.hour * 3600 + now.minute * 60 + now.second
         end_seconds = self._time_to_seconds(session.get('end_time', '23:59'))
         
@@ -446,20 +443,20 @@ class EnhancedStationRecordingService:
                         await asyncio.sleep(self.check_interval)
                         continue
                     
-                    current_session = self._get_current_session(schedule)
+                    # One Nairobi-time "now" for every check in this iteration
+                    now = datetime.now(pytz.timezone('Africa/Nairobi'))
+                    current_session = self._get_current_session(schedule, now)
                     if current_session:
-                        # Use Nairobi timezone for session date
-                        nairobi_tz = pytz.timezone('Africa/Nairobi')
-                        session_date = datetime.now(nairobi_tz).strftime('%Y%m%d')
+                        session_date = now.strftime('%Y%m%d')
                         recording_key = f"{station_id}_{session_date}_{current_session['start_time'].replace(':', '')}"
                         
-                        if (self._should_start_recording(current_session) and 
+                        if (self._should_start_recording(current_session, now) and 
                             recording_key not in self.recording_processes):
                             logger.info(f"Starting recording for session: {current_session['start_time']}-{current_session['end_time']} on {station.name}")
                             await self._start_session_recording(db_session, station, current_session, recording_key)
                         
                         if (recording_key in self.recording_processes and 
-                            self._should_stop_recording(current_session)):
+                            self._should_stop_recording(current_session, now)):
                             logger.info(f"Stopping recording for session: {current_session['start_time']}-{current_session['end_time']} on {station.name}")
                             await self._stop_session_recording(db_session, recording_key)
                             
@@ -608,6 +605,7 @@ class EnhancedStationRecordingService:
             audio_quality='128kbps',
             studio=session.get('studio', 'A'),
             hosts=session.get('hosts', []),
+            session_hosts=await RadioSessionRecording.load_hosts(db, session.get('hosts', [])),
             session_notes=session.get('notes', ''),
             is_live_session=session.get('is_live', True),
             is_repeat_session=session.get('is_repeat', False),
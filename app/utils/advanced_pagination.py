@@ -114,7 +114,7 @@ async def paginate_simple(db: AsyncSession, query: Select, page: int = 1, per_pa
     if has_next: items = items[:-1]
     
     response_data = {
-        "data": [await item.to_dict() if hasattr(item, 'to_dict') else item for item in items], 
+        "data": [item.to_dict() if hasattr(item, 'to_dict') else item for item in items], 
         "current_page": page, 
         "per_page": per_page, 
         "has_next": has_next, 
@@ -143,7 +143,7 @@ async def paginate_cursor(db: AsyncSession, query: Select, cursor_field: str, cu
     prev_cursor = getattr(items[0], cursor_field) if items else None
     
     response_data = {
-        "data": [await item.to_dict() if hasattr(item, 'to_dict') else item for item in items], 
+        "data": [item.to_dict() if hasattr(item, 'to_dict') else item for item in items], 
         "has_next": has_more, 
         "has_prev": cursor_value is not None, 
         "next_cursor": next_cursor, 
@@ -2,10 +2,17 @@ from typing import Optional, List, Any, Dict, Callable
 from math import ceil
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, tuple_, true, DateTime
+from sqlalchemy.dialects.mysql import match
+from datetime import datetime
 import asyncio
+import base64
+import json
+import re
 
-def create_pagination_response(items: List[Any], current_page: int, per_page: int, total: Optional[int] = None, metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+FULLTEXT_WORD_RE = re.compile(r"\w+")
+
+def create_pagination_response(items: List[Any], current_page: int, per_page: int, total: Optional[int] = None, metrics: Optional[Dict[str, Any]] = None, has_next: Optional[bool] = None) -> Dict[str, Any]:
     offset = (current_page - 1) * per_page
     from_item = offset + 1 if items else 0
     to_item = offset + len(items)
@@ -16,7 +23,8 @@ def create_pagination_response(items: List[Any], current_page: int, per_page: in
         has_prev = current_page > 1
         last_page = total_pages
     else:
-        has_next = len(items) > per_page
+        # Without a total the caller's per_page + 1 probe decides whether another page exists
+        has_next = has_next if has_next is not None else len(items) > per_page
         has_prev = current_page > 1
         last_page = current_page + 1 if has_next else current_page
         total_pages = last_page
@@ -28,13 +36,13 @@ def create_pagination_response(items: List[Any], current_page: int, per_page: in
     
     return response_data
 
-async def paginate_query(db: AsyncSession, query: Select, page: int = 1, per_page: int = 50, transform_func: Optional[Callable] = None, include_total: bool = True, metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+async def paginate_query(db: AsyncSession, query: Select, page: int = 1, per_page: int = 50, transform_func: Optional[Callable] = None, include_total: bool = True, metrics: Optional[Dict[str, Any]] = None, batch_transform: Optional[Callable] = None) -> Dict[str, Any]:
     page, per_page = max(1, page), max(1, min(per_page, 100))
     offset = (page - 1) * per_page
     
     total = None
     if include_total:
-        try: total = (await db.execute(query.with_only_columns(func.count()).order_by(None))).scalar() or 0
+        try: total = (await db.execute(query.with_only_columns(func.count(), maintain_column_froms=True).order_by(None))).scalar() or 0
         except: include_total = False
     
     result = await db.execute(query.offset(offset).limit(per_page + 1))
@@ -45,10 +53,14 @@ async def paginate_query(db: AsyncSession, query: Select, page: int = 1, per_pag
     if transform_func:
         try: items = [await transform_func(item, db) if asyncio.iscoroutinefunction(transform_func) else transform_func(item, db) for item in items]
         except Exception as e: print(f"Transform function failed: {e}")
+    elif batch_transform:
+        # Serializes the whole page in one call, so relations can be fetched for every item at once
+        try: items = await batch_transform(db, items)
+        except Exception as e: print(f"Transform function failed: {e}")
     
     estimated_total = (offset + len(items) + 1 if has_more_items else offset + len(items)) if not include_total else total
     
-    return create_pagination_response(items=items, current_page=page, per_page=per_page, total=estimated_total if include_total else None, metrics=metrics)
+    return create_pagination_response(items=items, current_page=page, per_page=per_page, total=estimated_total if include_total else None, metrics=metrics, has_next=has_more_items)
 
 def paginate_data(items: List[Any], total_count: int, page: Optional[int] = 1, per_page: Optional[int] = 50, metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     page = max(1, page or 1)
@@ -67,11 +79,11 @@ async def paginate_simple(db: AsyncSession, query: Select, page: int = 1, per_pa
     transformed_items = []
     for item in items:
         try:
-            if hasattr(item, 'to_dict'): transformed_items.append(await item.to_dict() if asyncio.iscoroutinefunction(item.to_dict) else item.to_dict())
+            if hasattr(item, 'to_dict'): transformed_items.append(item.to_dict())
             else: transformed_items.append(item)
         except: transformed_items.append(item)
     
-    return create_pagination_response(items=transformed_items, current_page=page, per_page=per_page, total=None, metrics=metrics)
+    return create_pagination_response(items=transformed_items, current_page=page, per_page=per_page, total=None, metrics=metrics, has_next=has_more_items)
 
 
 async def paginate_cursor(db: AsyncSession, query: Select, cursor_field: str, cursor_value: Optional[Any] = None, per_page: int = 50, direction: str = "next", transform_func: Optional[Callable] = None,  metrics: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -106,12 +118,56 @@ async def paginate_cursor(db: AsyncSession, query: Select, cursor_field: str, cu
                 prev_cursor = cursor_val.isoformat() if isinstance(cursor_val, datetime) else cursor_val  # ✅ FIX
         except AttributeError: pass
     
-    response_data = create_pagination_response(items=transformed_items, current_page=1, per_page=per_page, total=None, metrics=metrics)
+    response_data = create_pagination_response(items=transformed_items, current_page=1, per_page=per_page, total=None, metrics=metrics, has_next=has_more)
     response_data.update({"has_more": has_more, "next_cursor": next_cursor, "prev_cursor": prev_cursor, "cursor_field": cursor_field, "direction": direction})
     for key in ["current_page", "last_page", "from", "to"]: response_data.pop(key, None)
     
     return response_data
 
+def encode_cursor(values: List[Any]) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+class InvalidCursorError(ValueError):
+    """A cursor that was not produced by encode_cursor for these order columns; services answer it with a 400"""
+
+def decode_cursor(cursor: str, order_cols: List[Any]) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(order_cols): raise ValueError("wrong shape")
+        return [datetime.fromisoformat(value) if value is not None and isinstance(column.type, DateTime) else value for column, value in zip(order_cols, values)]
+    except (ValueError, TypeError) as e:
+        # binascii.Error, JSONDecodeError and UnicodeDecodeError are all ValueErrors
+        raise InvalidCursorError("Invalid cursor") from e
+
+def keyset_page_size(per_page: int) -> int:
+    # The page size paginate_keyset actually uses, for services echoing per_page back
+    return max(1, min(per_page, 100))
+
+async def paginate_keyset(db: AsyncSession, query: Select, order_cols: List[Any], cursor: Optional[str] = None, per_page: int = 50, descending: bool = True, page: int = 1) -> tuple:
+    """Keyset pagination over order_cols (e.g. [Model.created_at, Model.id]); returns (items, next_cursor)
+
+    Without a cursor, page > 1 falls back to an OFFSET so clients paging by number still move forward;
+    the returned next_cursor lets them switch to keyset paging from there.
+    """
+    per_page = keyset_page_size(per_page)
+    
+    if cursor:
+        values = decode_cursor(cursor, order_cols)
+        query = query.where(tuple_(*order_cols) < tuple_(*values) if descending else tuple_(*order_cols) > tuple_(*values))
+    elif page > 1:
+        query = query.offset((page - 1) * per_page)
+    
+    query = query.order_by(*[column.desc() if descending else column.asc() for column in order_cols]).limit(per_page + 1)
+    result = await db.execute(query)
+    # One entity selects give ORM instances, column projections give rows
+    items = result.scalars().all() if len(query.column_descriptions) == 1 else result.all()
+    has_more = len(items) > per_page
+    if has_more: items = items[:-1]
+    
+    next_cursor = encode_cursor([getattr(items[-1], column.key) for column in order_cols]) if has_more and items else None
+    return items, next_cursor
+
 class QueryOptimizer:
     @staticmethod
     def add_search_filter(query: Select, model, search: str, fields: List[str]) -> Select:
@@ -119,6 +175,12 @@ class QueryOptimizer:
         search_conditions = [getattr(model, field).ilike(f"%{search}%") for field in fields if hasattr(model, field)]
         return query.where(or_(*search_conditions)) if search_conditions else query
     
+    @staticmethod
+    def fulltext_match(columns: List[Any], search: str):
+        # Boolean-mode MATCH where every word must prefix-match; needs a FULLTEXT index over exactly these columns
+        terms = " ".join(f"+{word}*" for word in FULLTEXT_WORD_RE.findall(search or ""))
+        return match(*columns, against=terms).in_boolean_mode() if terms else true()
+    
     @staticmethod
     def add_status_filter(query: Select, model, status: Optional[str], status_field: Optional[str] = "status") -> Select:
         return query.where(getattr(model, status_field) == status) if status and status_field and hasattr(model, status_field) else query
@@ -6,8 +6,12 @@ from typing import Union, Optional
 from fastapi import UploadFile
 import aiofiles
 import time
+import secrets
 from io import BytesIO
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_
+from sqlalchemy.exc import IntegrityError
+from slugify import slugify
 
 async def process_file_to_upload_type(file_data: Union[str, bytes, UploadFile]) -> Optional[UploadFile]:
     try:
@@ -118,6 +122,58 @@ def convert_status_to_boolean(status_value):
 
 
 
+async def generate_unique_slug(db: AsyncSession, model, text: str, *conditions, max_length: int = 80) -> str:
+    # One query fetches the base slug and all of its numbered variants, the free suffix is picked in Python
+    base_slug = slugify(text, max_length=max_length)
+    result = await db.execute(select(model.slug).where(or_(model.slug == base_slug, model.slug.like(f"{base_slug}-%")), *conditions))
+    taken = set(result.scalars().all())
+    if base_slug not in taken:
+        return base_slug
+    counter = 1
+    while f"{base_slug}-{counter}" in taken:
+        counter += 1
+    return f"{base_slug}-{counter}"
+
+
+SLUG_SUFFIX_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+SLUG_SUFFIX_LENGTH = 6
+SLUG_INSERT_ATTEMPTS = 3
+
+def generate_suffixed_slug(text: str, max_length: int = 80) -> str:
+    # A random base36 tail (36^6 ~ 2 billion) makes the slug unique without looking at the table
+    suffix = "".join(secrets.choice(SLUG_SUFFIX_ALPHABET) for _ in range(SLUG_SUFFIX_LENGTH))
+    base_slug = slugify(text, max_length=max_length - SLUG_SUFFIX_LENGTH - 1)
+    return f"{base_slug}-{suffix}" if base_slug else suffix
+
+
+async def commit_with_fresh_slug(db: AsyncSession, instance, text: str) -> None:
+    # Inserts a pending row, the unique slug key catches the rare suffix collision and a new slug is drawn
+    for attempt in range(SLUG_INSERT_ATTEMPTS):
+        db.add(instance)
+        try:
+            await db.commit()
+            return
+        except IntegrityError:
+            await db.rollback()
+            if attempt == SLUG_INSERT_ATTEMPTS - 1:
+                raise
+            instance.slug = generate_suffixed_slug(text)
+
+
+async def flush_with_fresh_slug(db: AsyncSession, instance, text: str) -> None:
+    # Renames of a persistent row: each slug is tried in its own savepoint so a collision keeps the other pending edits
+    await db.flush()
+    for attempt in range(SLUG_INSERT_ATTEMPTS):
+        try:
+            async with db.begin_nested():
+                instance.slug = generate_suffixed_slug(text)
+            return
+        except IntegrityError:
+            if attempt == SLUG_INSERT_ATTEMPTS - 1:
+                raise
+
+
+
 #Logs
 async def log_system_error(db: AsyncSession, service: str, error: Exception, access_function: str, **kwargs):
     try:
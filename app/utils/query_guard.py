@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
+from typing import Any, Iterator, List
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Development safety net: when enabled, list queries refuse to lazy load any
+# relationship that was not eager loaded explicitly, so a new N+1 fails loudly
+STRICT_LOADING = os.getenv("SQL_STRICT_LOADING", "false").lower() in ("1", "true", "yes")
+
+
+def strict_loading_options() -> List[Any]:
+    return [raiseload('*')] if STRICT_LOADING else []
+
+
+@contextmanager
+def count_queries(engine) -> Iterator[List[str]]:
+    """Collect every SQL statement the engine executes inside the block."""
+    statements: List[str] = []
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
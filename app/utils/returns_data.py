@@ -2,13 +2,26 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
 from typing import Any
+import orjson
 
 app = FastAPI()
 
+
+# The one orjson option set for everything the API emits (responses, to_json, websocket frames), so a
+# timestamp is encoded the same way on every path; naive datetimes stay without an offset
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonResponse(JSONResponse):
+    # Same contract as JSONResponse, rendered by orjson's C encoder
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
 class returnsdata:
     @staticmethod
     def success(data: Any, msg: str, status: str):
-        return JSONResponse(content={
+        return OrjsonResponse(content={
             "data": data,
             "msg": msg,
             "status": status,
@@ -17,7 +30,7 @@ class returnsdata:
     
     @staticmethod
     def warning(data: Any, msg: str, status: str):
-        return JSONResponse(content={
+        return OrjsonResponse(content={
             "data": data,
             "msg": msg,
             "status": status,
@@ -26,7 +39,7 @@ class returnsdata:
     
     @staticmethod
     def success_msg(msg: str, status: str):
-        return JSONResponse(content={
+        return OrjsonResponse(content={
             "msg": msg,
             "status": status,
             "status_code": 200
@@ -34,7 +47,7 @@ class returnsdata:
     
     @staticmethod
     def error_msg_data(data: Any, msg: str, status: str):
-        return JSONResponse(content={
+        return OrjsonResponse(content={
             "data": data,
             "msg": msg,
             "status": status,
@@ -43,16 +56,16 @@ class returnsdata:
     
 
     @staticmethod
-    def error_msg(msg: str, status: str):
-        return JSONResponse(content={
+    def error_msg(msg: str, status: str, status_code: int = 500):
+        return OrjsonResponse(content={
             "msg": msg,
             "status": status,
-            "status_code": 500
-        }, status_code=500) 
+            "status_code": status_code
+        }, status_code=status_code) 
     
     @staticmethod
     def error():
-        return JSONResponse(content={
+        return OrjsonResponse(content={
             "msg": "Something has happened. Refresh or try again later.",
             "status": "Error",
             "status_code": 500
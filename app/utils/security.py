@@ -133,7 +133,7 @@ async def get_user_from_token(payload: Dict[str, Any], db: AsyncSession) -> Dict
            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,detail="User not found or inactive")
        user.last_seen = datetime.now(timezone.utc)
        await db.commit()
-       user_data = await user.to_dict()
+       user_data = user.to_dict()
        print("===============================user data=======================================================================")
        print(user_data)
        return user_data
@@ -0,0 +1,90 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update, case
+from sqlalchemy.dialects.mysql import insert
+from app.database import AsyncSessionLocal
+from app.models.ForumViewModel import ForumView
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ViewCounterManager:
+    """Buffers view counters in memory and flushes them to the database periodically,
+    so read endpoints do not turn every page view into a write transaction."""
+
+    def __init__(self, flush_interval: int = 60):
+        self.flush_interval = flush_interval
+        self.pending_counts: Dict[Tuple[Any, str], Dict[str, int]] = {}   # (model, column) -> {row_id: delta}
+        self.pending_forum_views: Dict[str, Dict[str, datetime]] = {}   # forum_id -> {user_id: viewed_at}
+        self._task: Optional[asyncio.Task] = None
+
+    def increment(self, model, column_name: str, row_id: str, delta: int = 1) -> None:
+        counts = self.pending_counts.setdefault((model, column_name), {})
+        counts[row_id] = counts.get(row_id, 0) + delta
+
+    def pending(self, model, column_name: str, row_id: str) -> int:
+        return self.pending_counts.get((model, column_name), {}).get(row_id, 0)
+
+    def record_forum_view(self, forum_id: str, user_id: str) -> None:
+        self.pending_forum_views.setdefault(forum_id, {}).setdefault(user_id, datetime.utcnow())
+
+    async def flush(self, db: AsyncSession) -> None:
+        pending_counts, self.pending_counts = self.pending_counts, {}
+        pending_forum_views, self.pending_forum_views = self.pending_forum_views, {}
+
+        try:
+            for (model, column_name), counts in pending_counts.items():
+                # One UPDATE per counter column, with each row's delta picked by CASE on its id
+                column = getattr(model, column_name)
+                await db.execute(
+                    update(model)
+                    .where(model.id.in_(list(counts)))
+                    .values({column_name: column + case(counts, value=model.id, else_=0)})
+                    .execution_options(synchronize_session=False)
+                )
+
+            if pending_forum_views:
+                # The (forum_id, user_id) unique key deduplicates repeat viewers
+                rows = [
+                    {"forum_id": forum_id, "user_id": user_id, "viewed_at": viewed_at}
+                    for forum_id, viewers in pending_forum_views.items()
+                    for user_id, viewed_at in viewers.items()
+                ]
+                await db.execute(insert(ForumView).prefix_with('IGNORE'), rows)
+
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"View counter flush failed: {str(e)}")
+            # Keep the increments for the next flush
+            for key, counts in pending_counts.items():
+                for row_id, delta in counts.items():
+                    self.increment(key[0], key[1], row_id, delta)
+            for forum_id, viewers in pending_forum_views.items():
+                for user_id, viewed_at in viewers.items():
+                    self.pending_forum_views.setdefault(forum_id, {}).setdefault(user_id, viewed_at)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            async with AsyncSessionLocal() as db:
+                await self.flush(db)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop(), name="view_counter_flush")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        async with AsyncSessionLocal() as db:
+            await self.flush(db)
+
+view_counter = ViewCounterManager()
@@ -1,13 +1,16 @@
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.utils.security import decode_and_validate_token, get_user_from_token
-from app.utils.returns_data import returnsdata
+from app.utils.returns_data import returnsdata, ORJSON_OPTIONS
 from app.models.StationListenersModel import StationListeners
 from app.models.UserModel import User
 from app.utils.constants import SUCCESS, ERROR
+from app.database import AsyncSessionLocal
 from typing import Dict, List, Optional, Any
 from sqlalchemy import select, delete, and_
+import asyncio
 import json
+import orjson
 import logging
 from datetime import datetime, timedelta
 import uuid
@@ -20,6 +23,7 @@ class WebSocketManager:
         self.connection_info: Dict[str, Dict[str, Any]] = {}      # connection_id -> connection_data
         self.user_info: Dict[str, Dict[str, Any]] = {}           # user_id -> user_data
         self.station_users: Dict[str, List[str]] = {}            # station_id -> [user_ids]
+        self.background_tasks: set = set()                       # running fire-and-forget broadcasts
 
     async def authenticate_token(self, token: str, db: AsyncSession) -> Optional[Dict[str, Any]]:
         try:
@@ -144,7 +148,7 @@ class WebSocketManager:
 
     async def send_message_to_websocket(self, websocket: WebSocket, message: Dict[str, Any]) -> bool:
         try:
-            message_str = json.dumps(message, default=str)
+            message_str = orjson.dumps(message, default=str, option=ORJSON_OPTIONS).decode()
             await websocket.send_text(message_str)
             return True
         except WebSocketDisconnect:
@@ -223,6 +227,16 @@ class WebSocketManager:
             logger.error(f"Error broadcasting to station {station_id}: {str(e)}")
             return False
 
+    def broadcast_to_station_background(self, station_id: str, data: Any, message_type: str = "station_broadcast", message: str = "Station broadcast") -> None:
+        # Fan out without holding up the request; uses its own session since the request session closes on return
+        async def _broadcast():
+            async with AsyncSessionLocal() as db:
+                await self.broadcast_to_station(db=db, station_id=station_id, data=data, message_type=message_type, message=message)
+
+        task = asyncio.create_task(_broadcast())
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+
     async def broadcast_websocket_data(self, user_id: str, data: Any, type: str = "data", message: str = "Data received") -> bool:
         return await self.send_to_user(user_id=user_id, data=data, message_type=type, message=message)
 
@@ -0,0 +1,64 @@
+import asyncio
+import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.models
+from app.models import Base, Forum, ForumComment, ForumView, Station, User
+
+
+@pytest.fixture
+def run():
+    # Plain pytest drives the async code through one loop per test
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def session_factory(run):
+    # In-memory SQLite stands in for MySQL; the JSON columns go through the same stdlib json bind processing
+    engine = create_async_engine("sqlite+aiosqlite://")
+
+    async def create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    run(create_all())
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    run(engine.dispose())
+
+
+@pytest.fixture
+def station(run, session_factory):
+    async def seed():
+        async with session_factory() as db:
+            db.add(User(id="u1", name="Admin", email="admin@example.com", role="admin"))
+            station = Station(id="s1", name="Capital FM", slug="capital-fm", frequency="91.3", access_link="capital", created_by="u1")
+            db.add(station)
+            await db.commit()
+            return station
+
+    return run(seed())
+
+
+@pytest.fixture
+def seed_forums(run, session_factory, station):
+    # Forums f00.. one minute apart on the station, optionally with one reply and one view each; returns ids newest first
+    def seed(count, with_activity=False):
+        async def add_forums():
+            async with session_factory() as db:
+                for i in range(count):
+                    forum_id = f"f{i:02d}"
+                    db.add(Forum(id=forum_id, title=f"Topic {i}", body="body", slug=f"topic-{i}", station_id=station.id, created_by="u1",
+                                 created_at=datetime.datetime(2025, 1, 1) + datetime.timedelta(minutes=i)))
+                    if with_activity:
+                        db.add(ForumComment(id=f"c{i:02d}", content="reply", forum_id=forum_id, created_by="u1"))
+                        db.add(ForumView(forum_id=forum_id, user_id="u1"))
+                await db.commit()
+
+        run(add_forums())
+        return [f"f{i:02d}" for i in reversed(range(count))]
+
+    return seed
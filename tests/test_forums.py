@@ -0,0 +1,25 @@
+from sqlalchemy import select
+
+from app.models import Forum, ForumComment, ForumView
+from app.utils.query_guard import count_queries
+
+
+def test_plain_forum_selects_skip_the_counts(run, session_factory, station):
+    async def scenario():
+        async with session_factory() as db:
+            db.add(Forum(id="f1", title="Topic", body="body", slug="topic", station_id=station.id, created_by="u1"))
+            db.add(ForumComment(id="c1", content="first", forum_id="f1", created_by="u1"))
+            db.add(ForumView(forum_id="f1", user_id="u1"))
+            await db.commit()
+
+        async with session_factory() as db:
+            with count_queries(db.bind) as statements:
+                forum = (await db.execute(select(Forum).where(Forum.id == "f1"))).scalar_one()
+            # Serializing a forum loaded without serialization_options() still reports its counts
+            data = await forum.to_dict_with_relations(db)
+        return statements[0], data
+
+    plain, data = run(scenario())
+
+    assert "count(" not in plain.lower()
+    assert (data["comments_count"], data["views_count"]) == (1, 1)
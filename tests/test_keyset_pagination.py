@@ -0,0 +1,47 @@
+import pytest
+from fastapi import HTTPException
+
+from app.apiv1.services.user.UserForumService import get_user_forums
+
+
+@pytest.fixture
+def forums(seed_forums):
+    return seed_forums(15)
+
+
+def list_forums(run, session_factory, **kwargs):
+    async def fetch():
+        async with session_factory() as db:
+            return await get_user_forums(db, "s1", **kwargs)
+
+    return run(fetch())
+
+
+def test_page_number_without_cursor_moves_forward(run, session_factory, forums):
+    first = list_forums(run, session_factory, page=1, per_page=10)
+    second = list_forums(run, session_factory, page=2, per_page=10)
+
+    assert [forum["id"] for forum in first["data"]] == forums[:10]
+    assert [forum["id"] for forum in second["data"]] == forums[10:]
+    assert second["current_page"] == 2
+    assert second["total_pages"] == 2
+
+
+def test_cursor_continues_where_the_page_ended(run, session_factory, forums):
+    first = list_forums(run, session_factory, per_page=10)
+    second = list_forums(run, session_factory, per_page=10, cursor=first["next_cursor"])
+
+    assert [forum["id"] for forum in second["data"]] == forums[10:]
+    assert second["current_page"] is None
+    assert second["next_cursor"] is None
+
+
+def test_per_page_reports_the_clamped_size(run, session_factory, forums):
+    assert list_forums(run, session_factory, per_page=500)["per_page"] == 100
+
+
+def test_invalid_cursor_is_a_bad_request(run, session_factory, forums):
+    with pytest.raises(HTTPException) as error:
+        list_forums(run, session_factory, cursor="not-a-cursor")
+
+    assert error.value.status_code == 400
@@ -0,0 +1,19 @@
+from app.models import LiveChatMessage
+
+
+def test_new_message_matches_history_shape(run, session_factory, station):
+    async def scenario():
+        async with session_factory() as db:
+            message = LiveChatMessage(station_id=station.id, user_id="u1", message="Morning!")
+            db.add(message)
+            await db.commit()
+            created = await message.to_dict_with_relations(db)
+
+        async with session_factory() as db:
+            history = await LiveChatMessage.list_for_station(db, station.id)
+        return created, history
+
+    created, history = run(scenario())
+
+    assert history == [created]
+    assert created["user"] == {"id": "u1", "name": "Admin", "slug": None, "image_url": None, "role": "admin"}
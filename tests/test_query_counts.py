@@ -0,0 +1,23 @@
+import pytest
+
+from app.apiv1.services.user.UserForumService import get_user_forums, invalidate_forum_metrics
+from app.utils.query_guard import count_queries
+
+
+@pytest.mark.parametrize("forum_count", [2, 10])
+def test_forum_list_query_count_does_not_grow_with_the_page(run, session_factory, station, seed_forums, forum_count):
+    seed_forums(forum_count, with_activity=True)
+    invalidate_forum_metrics(station.id)
+
+    async def fetch():
+        async with session_factory() as db:
+            with count_queries(db.bind) as statements:
+                result = await get_user_forums(db, station.id, per_page=10)
+            return result, statements
+
+    result, statements = run(fetch())
+
+    assert len(result["data"]) == forum_count
+    assert all(forum["comments_count"] == 1 and forum["views_count"] == 1 for forum in result["data"])
+    # total count, the page with its counts, stations, creators and the metrics query
+    assert len(statements) == 5, statements
@@ -0,0 +1,45 @@
+import datetime
+
+import orjson
+
+from app.models import Station
+from app.utils.returns_data import OrjsonResponse
+from app.utils.websocket_manager import WebSocketManager
+
+
+def test_to_json_and_responses_encode_timestamps_alike():
+    created_at = datetime.datetime(2025, 1, 1, 6, 30, 15, 250000)
+    station = Station(id="s1", name="Capital FM", slug="capital-fm", frequency="91.3", created_at=created_at)
+
+    from_model = orjson.loads(station.to_json())["created_at"]
+    from_response = orjson.loads(OrjsonResponse({"created_at": created_at}).body)["created_at"]
+
+    assert from_model == from_response == "2025-01-01T06:30:15.250000"
+
+
+def test_to_json_uses_the_model_field_selection():
+    station = Station(id="s1", name="Capital FM", slug="capital-fm", frequency="91.3", streaming_link="http://stream")
+
+    data = orjson.loads(station.to_json(exclude=["about"]))
+
+    assert data["streaming_link"] == station.get_secure_streaming_url()
+    assert "streaming_link_original" in data
+    assert "about" not in data
+
+
+class StubWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, text):
+        self.frames.append(text)
+
+
+def test_websocket_frames_encode_timestamps_like_responses(run):
+    created_at = datetime.datetime(2025, 1, 1, 6, 30, 15, 250000)
+    websocket = StubWebSocket()
+
+    sent = run(WebSocketManager().send_message_to_websocket(websocket, {"message": {"created_at": created_at}}))
+
+    assert sent is True
+    assert orjson.loads(websocket.frames[0]) == orjson.loads(OrjsonResponse({"message": {"created_at": created_at}}).body)
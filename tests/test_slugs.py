@@ -0,0 +1,42 @@
+from app.apiv1.services.admin.AdminHostsService import update_host_data
+from app.models import Host
+from app.utils import helper_functions
+
+
+def seed_hosts(run, session_factory):
+    async def seed():
+        async with session_factory() as db:
+            db.add(Host(id="h1", name="Jane Host", slug="jane-host-abc123", email="jane@example.com"))
+            db.add(Host(id="h2", name="Other Host", slug="taken", email="other@example.com"))
+            await db.commit()
+
+    run(seed())
+
+
+def update_host(run, session_factory, monkeypatch, data):
+    async def no_program_snapshots(self, db, remove=False):
+        return None
+
+    # The program snapshot lookup uses MySQL's JSON_CONTAINS, which SQLite lacks
+    monkeypatch.setattr(Host, "sync_program_snapshots", no_program_snapshots)
+
+    async def update():
+        async with session_factory() as db:
+            host = await update_host_data(db, "h1", data)
+            return host.slug, host.bio
+
+    return run(update())
+
+
+def test_host_update_keeps_the_slug_when_the_name_is_unchanged(run, session_factory, monkeypatch):
+    seed_hosts(run, session_factory)
+
+    assert update_host(run, session_factory, monkeypatch, {"name": "Jane Host", "bio": "new bio"}) == ("jane-host-abc123", "new bio")
+
+
+def test_host_rename_retries_a_colliding_slug_and_keeps_the_other_edits(run, session_factory, monkeypatch):
+    seed_hosts(run, session_factory)
+    slugs = iter(["taken", "jane-renamed-def456"])
+    monkeypatch.setattr(helper_functions, "generate_suffixed_slug", lambda text, max_length=80: next(slugs))
+
+    assert update_host(run, session_factory, monkeypatch, {"name": "Jane Renamed", "bio": "new bio"}) == ("jane-renamed-def456", "new bio")
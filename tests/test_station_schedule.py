@@ -0,0 +1,31 @@
+from sqlalchemy import select
+
+from app.apiv1.services.admin.AdminStationScheduleService import add_session_to_day
+from app.models import RadioProgram, StationSchedule
+
+
+def test_add_session_to_existing_schedule(run, session_factory, station):
+    async def scenario():
+        async with session_factory() as db:
+            db.add(RadioProgram(id="p1", title="Breakfast", station_id=station.id, created_by="u1"))
+            db.add(RadioProgram(id="p2", title="Drive", station_id=station.id, created_by="u1"))
+            sessions = StationSchedule.get_empty_sessions()
+            sessions["monday"] = [{"program_id": "p1", "start_time": "06:00", "end_time": "09:00"}]
+            db.add(StationSchedule(id="sc1", station_id=station.id, sessions=sessions))
+            await db.commit()
+
+        async with session_factory() as db:
+            result = await add_session_to_day(db, station.id, "monday", {"program_id": "p2", "start_time": "16:00", "end_time": "19:00"}, "u1")
+
+        async with session_factory() as db:
+            stored = (await db.execute(select(StationSchedule.sessions).where(StationSchedule.id == "sc1"))).scalar_one()
+        return result, stored
+
+    result, stored = run(scenario())
+
+    assert [session["program"]["id"] for session in result["sessions"]["monday"]] == ["p1", "p2"]
+    # Only the raw session fields are persisted, never the serialized programs
+    assert stored["monday"] == [
+        {"program_id": "p1", "start_time": "06:00", "end_time": "09:00"},
+        {"program_id": "p2", "start_time": "16:00", "end_time": "19:00"},
+    ]